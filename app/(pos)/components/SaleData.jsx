@@ -6,8 +6,6 @@ import {
   Input,
   Select,
   SelectItem,
-  Autocomplete,
-  AutocompleteItem,
   CardBody,
   Button,
   Table,
@@ -19,8 +17,6 @@ import {
   Tooltip,
   Switch,
 } from "@nextui-org/react";
-import useCustomers from "@/app/hooks/useCustomers";
-import useProducts from "@/app/hooks/useProducts";
 import { getTodayDate } from "@/app/utils";
 import { useState, useEffect } from "react";
 import toast from "react-hot-toast";
@@ -28,6 +24,19 @@ import api from "@/app/axios";
 import { v4 as uuidv4 } from 'uuid';
 import { PlusIcon, TrashIcon } from "@heroicons/react/24/solid";
 import Cookies from "js-cookie";
+import SearchPicker from "./SearchPicker";
+
+const customerLabel = (customer) => customer.name;
+const productLabel = (product) => `${product.name} (${product.barcode})`;
+const customerUrl = (customer) => `/customers/${customer.id}/`;
+const productUrl = (product) => `/products/${product.slug}/`;
+
+const priceFor = (product, saleType) => {
+  if (saleType === "mayorista" && product.wholesale_price) {
+    return parseFloat(product.wholesale_price);
+  }
+  return parseFloat(product.retail_price);
+};
 
 export default function SaleData() {
   const [saleData, setSaleData] = useState({
@@ -58,10 +67,6 @@ export default function SaleData() {
     },
   ]);
 
-  const { customers, loading: loadingCustomers, error: errorCustomers } = useCustomers();
-
-  const { products, loading: loadingProducts, error: errorProducts } = useProducts();
-
   const [total, setTotal] = useState(0);
 
   const addSaleDetail = () => {
@@ -82,25 +87,31 @@ export default function SaleData() {
     setSaleDetails(updatedDetails);
   };
 
+  const handleProductSelect = (id, product) => {
+    setSaleDetails((prevDetails) =>
+      prevDetails.map((detail) => {
+        if (detail.id !== id) return detail;
+        if (!product) {
+          return { ...detail, product: "", productInfo: null, price: 0, subtotal: 0 };
+        }
+        const price = priceFor(product, saleData.sale_type);
+        return {
+          ...detail,
+          product: product.id,
+          // Precios del producto elegido, para recalcular si cambia el tipo de venta.
+          productInfo: { retail_price: product.retail_price, wholesale_price: product.wholesale_price },
+          price,
+          subtotal: price * detail.quantity,
+        };
+      })
+    );
+  };
+
   const handleSaleDetailChange = (id, field, value) => {
     const updatedDetails = saleDetails.map((detail) => {
       if (detail.id === id) {
         let updatedDetail = { ...detail, [field]: value };
 
-        if (field === "product" && value) {
-          const selectedProduct = products.find((prod) => prod.id === parseInt(value));
-
-          if (selectedProduct) {
-            if (saleData.sale_type === "mayorista" && selectedProduct.wholesale_price) {
-              updatedDetail.price = parseFloat(selectedProduct.wholesale_price);
-            } else {
-              updatedDetail.price = parseFloat(selectedProduct.retail_price);
-            }
-
-            updatedDetail.subtotal = updatedDetail.price * updatedDetail.quantity;
-          }
-        }
-
         if (field === "quantity") {
           if (updatedDetail.quantity < 0) {
             updatedDetail.quantity = 0;
@@ -127,20 +138,9 @@ export default function SaleData() {
 
     setSaleDetails((prevDetails) =>
       prevDetails.map((detail) => {
-        if (!detail.product) return detail;
-
-        const selectedProduct = products.find(
-          (prod) => prod.id === parseInt(detail.product)
-        );
-        if (!selectedProduct) return detail;
+        if (!detail.product || !detail.productInfo) return detail;
 
-        let newPrice;
-
-        if (newSaleType === "mayorista" && selectedProduct.wholesale_price) {
-          newPrice = parseFloat(selectedProduct.wholesale_price);
-        } else {
-          newPrice = parseFloat(selectedProduct.retail_price);
-        }
+        const newPrice = priceFor(detail.productInfo, newSaleType);
 
         return {
           ...detail,
@@ -232,14 +232,6 @@ export default function SaleData() {
     }
   };
 
-  if (loadingCustomers || loadingProducts) {
-    return <p>Loading...</p>;
-  }
-
-  if (errorCustomers || errorProducts) {
-    return <p>Error al cargar los datos.</p>;
-  }
-
   return (
     <Card className="p-4">
       <CardHeader>
@@ -261,21 +253,19 @@ export default function SaleData() {
           />
 
           {/* Campo de Cliente */}
-          <Autocomplete
+          <SearchPicker
+            url="/customers/"
+            recentKey="customers"
+            getLabel={customerLabel}
+            detailUrl={customerUrl}
+            selectedId={saleData.customer}
+            onSelect={(customer) => setSaleData((prev) => ({ ...prev, customer: customer ? customer.id : "" }))}
             label="Cliente"
             placeholder="Cliente"
-            value={saleData.customer}
             isClearable
-            onSelectionChange={(value) => setSaleData({ ...saleData, customer: value })}
             variant="underlined"
             className="w-full"
-          >
-            {customers.map((customer) => (
-              <AutocompleteItem key={customer.id} value={customer.id}>
-                {customer.name}
-              </AutocompleteItem>
-            ))}
-          </Autocomplete>
+          />
 
           {/* Campo de Método de Pago */}
           <Select
@@ -353,27 +343,19 @@ export default function SaleData() {
                   <TableRow key={detail.id}>
                     {/* Producto */}
                     <TableCell>
-                      <Autocomplete
+                      <SearchPicker
+                        url="/products/"
+                        recentKey="products"
+                        getLabel={productLabel}
+                        detailUrl={productUrl}
+                        selectedId={detail.product}
+                        onSelect={(product) => handleProductSelect(detail.id, product)}
                         aria-label="Producto"
                         placeholder="Selecciona un producto"
-                        value={detail.product}
-                        onSelectionChange={(key) => {
-                          handleSaleDetailChange(detail.id, "product", key);
-                        }}
                         variant="underlined"
                         className="w-full min-w-[200px]"
                         isClearable
-                      >
-                        {products.map((product) => (
-                          <AutocompleteItem
-                            key={product.id}
-                            value={product.id.toString()}
-                            textValue={`${product.name} (${product.barcode})`}
-                          >
-                            {product.name} ({product.barcode})
-                          </AutocompleteItem>
-                        ))}
-                      </Autocomplete>
+                      />
                     </TableCell>
 
                     {/* Precio */}
@@ -0,0 +1,136 @@
+"use client";
+
+import { Autocomplete, AutocompleteItem } from "@nextui-org/react";
+import { useState, useEffect, useMemo, useRef, useCallback } from "react";
+import Cookies from "js-cookie";
+import api from "@/app/axios";
+import useSearch from "@/app/hooks/useSearch";
+import useRecentItems from "@/app/hooks/useRecentItems";
+
+const normalize = (text) => text.toLowerCase().trim();
+
+// Autocomplete del POS que busca en el backend mientras se escribe. Con el
+// campo vacío muestra primero lo que más se eligió en esta terminal; al
+// escribir, esos mismos elementos aparecen al instante si coinciden y los
+// resultados del backend se suman después.
+export default function SearchPicker({
+  url,
+  recentKey,
+  getLabel,
+  detailUrl,
+  selectedId,
+  onSelect,
+  frequentCount = 8,
+  ...props
+}) {
+  const [inputValue, setInputValue] = useState("");
+  const [isOpen, setIsOpen] = useState(false);
+  const [selectedItem, setSelectedItem] = useState(null);
+  const scrollRef = useRef(null);
+
+  const query = selectedItem && inputValue === getLabel(selectedItem) ? "" : inputValue;
+  const search = useSearch(url, query, { enabled: isOpen });
+  const recent = useRecentItems(recentKey);
+  const { refresh } = recent;
+
+  // Lo que devuelve el backend actualiza precios y nombres de los frecuentes.
+  useEffect(() => {
+    if (search.items.length) refresh(search.items);
+  }, [search.items, refresh]);
+
+  useEffect(() => {
+    if (selectedId === "" || selectedId === null || selectedId === undefined) {
+      setSelectedItem(null);
+      setInputValue("");
+    }
+  }, [selectedId]);
+
+  const items = useMemo(() => {
+    const wanted = normalize(query);
+    const matches = (item) => normalize(getLabel(item)).includes(wanted);
+    const frequent = recent.entries
+      .map((entry) => entry.item)
+      .filter((item) => !wanted || matches(item))
+      .slice(0, wanted ? 5 : frequentCount)
+      .map((item) => ({ ...item, frequent: true }));
+    // Mientras llega la búsqueda nueva se filtran los resultados anteriores.
+    const found = normalize(search.resultsQuery ?? "") === wanted ? search.items : search.items.filter(matches);
+    const seen = new Set(frequent.map((item) => item.id));
+    const merged = [...frequent, ...found.filter((item) => !seen.has(item.id) && seen.add(item.id))];
+    // El elegido tiene que seguir en la lista para que el campo conserve su texto.
+    if (selectedItem && !seen.has(selectedItem.id)) merged.push(selectedItem);
+    return merged;
+  }, [query, recent.entries, search.items, search.resultsQuery, selectedItem, frequentCount, getLabel]);
+
+  const handleSelectionChange = useCallback(async (key) => {
+    if (key === null) {
+      setSelectedItem(null);
+      setInputValue("");
+      onSelect(null);
+      return;
+    }
+    const item = items.find((candidate) => String(candidate.id) === String(key));
+    if (!item) return;
+    const { frequent, ...chosen } = item;
+    setSelectedItem(chosen);
+    setInputValue(getLabel(chosen));
+    recent.remember(chosen);
+    onSelect(chosen);
+
+    // Lo guardado en la terminal puede estar desactualizado: se confirma con el backend.
+    if (frequent && detailUrl && !search.items.some((found) => found.id === chosen.id)) {
+      try {
+        const token = Cookies.get("access_token");
+        const response = await api.get(detailUrl(chosen), {
+          headers: {
+            Authorization: `Token ${token}`,
+          },
+        });
+        refresh([response.data]);
+        if (JSON.stringify(response.data) !== JSON.stringify(chosen)) {
+          setSelectedItem(response.data);
+          onSelect(response.data);
+        }
+      } catch (error) {
+        console.error("Error al actualizar el elemento elegido:", error);
+      }
+    }
+  }, [items, getLabel, recent, onSelect, detailUrl, search.items, refresh]);
+
+  const { hasMore, loadMore } = search;
+  useEffect(() => {
+    const list = scrollRef.current;
+    if (!isOpen || !list) return undefined;
+    const handleScroll = () => {
+      if (hasMore && list.scrollTop + list.clientHeight >= list.scrollHeight - 48) loadMore();
+    };
+    list.addEventListener("scroll", handleScroll);
+    return () => list.removeEventListener("scroll", handleScroll);
+  }, [isOpen, hasMore, loadMore]);
+
+  return (
+    <Autocomplete
+      {...props}
+      items={items}
+      inputValue={inputValue}
+      onInputChange={setInputValue}
+      selectedKey={selectedItem ? String(selectedItem.id) : null}
+      onSelectionChange={handleSelectionChange}
+      onOpenChange={setIsOpen}
+      menuTrigger="focus"
+      isLoading={search.loading}
+      scrollRef={scrollRef}
+      listboxProps={{ emptyContent: search.loading ? "Buscando..." : "Sin resultados." }}
+    >
+      {(item) => (
+        <AutocompleteItem
+          key={item.id}
+          textValue={getLabel(item)}
+          description={item.frequent ? "Frecuente" : undefined}
+        >
+          {getLabel(item)}
+        </AutocompleteItem>
+      )}
+    </Autocomplete>
+  );
+}
@@ -0,0 +1,73 @@
+// Pedidos simultáneos por operación masiva. El navegador abre hasta 6
+// conexiones por host; con 4 quedan libres para el resto de la página.
+export const BULK_CONCURRENCY = 4;
+const RETRIES = 2;
+const RETRY_DELAY_MS = 400;
+
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+const IDEMPOTENT_METHODS = ['get', 'head', 'options', 'put', 'delete'];
+
+// Sólo se reintenta lo que puede salir bien en el segundo intento: 429 o
+// errores del servidor. Sin respuesta (red) sólo se reintentan los métodos
+// idempotentes: un POST como `mark-as-charged` pudo haberse aplicado y
+// perderse sólo la respuesta, y el reintento fallaría con un 400 "ya
+// cobrada". Un 400 o 403 se informa.
+const isRetryable = (error) => {
+  const status = error.response?.status;
+  if (!status) {
+    return IDEMPOTENT_METHODS.includes((error.config?.method || 'get').toLowerCase());
+  }
+  return status === 429 || status >= 500;
+};
+
+export const bulkErrorMessage = (error) => {
+  const data = error.response?.data;
+  if (data?.detail) return data.detail;
+  if (data && typeof data === 'object') {
+    const first = Object.values(data).flat()[0];
+    if (typeof first === 'string') return first;
+  }
+  return error.response ? `Error ${error.response.status}.` : 'Sin conexión con el servidor.';
+};
+
+// Ejecuta `task(item)` para cada elemento con a lo sumo `concurrency`
+// pedidos en curso, reintentando con espera creciente los errores
+// transitorios. Nunca corta por una falla: devuelve qué salió bien y qué no.
+export const runBulk = async (items, task, {
+  concurrency = BULK_CONCURRENCY,
+  retries = RETRIES,
+  retryDelayMs = RETRY_DELAY_MS,
+  onProgress,
+} = {}) => {
+  const results = new Array(items.length);
+  let next = 0;
+  let done = 0;
+
+  const worker = async () => {
+    while (next < items.length) {
+      const index = next++;
+      const item = items[index];
+      for (let attempt = 0; ; attempt++) {
+        try {
+          results[index] = { item, ok: true, value: await task(item) };
+          break;
+        } catch (error) {
+          if (attempt >= retries || !isRetryable(error)) {
+            results[index] = { item, ok: false, error, message: bulkErrorMessage(error) };
+            break;
+          }
+          await sleep(retryDelayMs * 2 ** attempt * (0.5 + Math.random()));
+        }
+      }
+      done++;
+      onProgress?.({ done, total: items.length, result: results[index] });
+    }
+  };
+
+  await Promise.all(Array.from({ length: Math.min(concurrency, items.length) }, worker));
+  return {
+    succeeded: results.filter((result) => result.ok),
+    failed: results.filter((result) => !result.ok),
+  };
+};
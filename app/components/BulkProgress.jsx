@@ -0,0 +1,33 @@
+"use client";
+
+import { Progress } from "@nextui-org/react";
+
+// Avance de una operación masiva y, al terminar, las ventas que fallaron.
+export default function BulkProgress({ done, total, running, failed, label }) {
+  if (!total) return null;
+
+  return (
+    <div className="flex flex-col gap-2">
+      <Progress
+        aria-label={label}
+        label={label}
+        value={done}
+        maxValue={total}
+        valueLabel={`${done} de ${total}`}
+        showValueLabel
+        color={failed.length ? "warning" : "success"}
+        size="sm"
+      />
+      {!running && failed.length > 0 && (
+        <div className="text-sm text-red-500" role="alert">
+          <p>No se pudieron procesar {failed.length} de {total} ventas:</p>
+          <ul className="list-disc pl-5">
+            {failed.map(({ item, message }) => (
+              <li key={item.id}>Venta #{item.id}: {message}</li>
+            ))}
+          </ul>
+        </div>
+      )}
+    </div>
+  );
+}
@@ -0,0 +1,25 @@
+"use client";
+
+import { Select, SelectItem } from "@nextui-org/react";
+import { ROWS_PER_PAGE_OPTIONS } from "@/app/tableWindow";
+
+// Cantidad de filas por página de los listados del dashboard.
+export default function RowsPerPageSelect({ value, onChange }) {
+  return (
+    <Select
+      aria-label="Filas por página"
+      className="w-32"
+      size="sm"
+      variant="bordered"
+      disallowEmptySelection
+      selectedKeys={new Set([String(value)])}
+      onSelectionChange={(keys) => onChange(Number(Array.from(keys)[0]))}
+    >
+      {ROWS_PER_PAGE_OPTIONS.map((option) => (
+        <SelectItem key={String(option)} value={String(option)} textValue={`${option} filas`}>
+          {`${option} filas`}
+        </SelectItem>
+      ))}
+    </Select>
+  );
+}
@@ -2,6 +2,7 @@
 
 import { cn } from "@/app/utils";
 import { Link } from "@nextui-org/react";
+import NextLink from "next/link";
 import React, { useState, createContext, useContext, cloneElement } from "react";
 import { AnimatePresence, motion } from "framer-motion";
 import { IconMenu2, IconX } from "@tabler/icons-react";
@@ -138,6 +139,7 @@ export const SidebarLink = ({
 
   return (
     <Link
+      as={NextLink}
       href={link.path}
       onClick={onClick}
       isDisabled={isDisabled}
@@ -28,6 +28,8 @@ import {
   IconDots,
 } from "@tabler/icons-react";
 import useSalesForCollect from '@/app/hooks/useSalesForCollect';
+import useBulkAction from '@/app/hooks/useBulkAction';
+import BulkProgress from '@/app/components/BulkProgress';
 import { useRouter } from "next/navigation";
 import api from "@/app/axios";
 import Cookies from 'js-cookie';
@@ -64,7 +66,7 @@ function getChoiceName(choices, id) {
 export default function CollectPage() {
   const router = useRouter();
 
-  const { salesForCollect, totalCount, loading, error, fetchSalesForCollect } = useSalesForCollect();
+  const { salesForCollect, totalCount, loading, error, fetchSalesForCollect, setSalesForCollect } = useSalesForCollect();
 
   const rowsPerPage = 10;
   const [page, setPage] = useState(1);
@@ -77,13 +79,34 @@ export default function CollectPage() {
   const [partialAmounts, setPartialAmounts] = useState({});
   const [partialErrors, setPartialErrors] = useState({});
 
-  // Estado para manejar la carga al cobrar todas las ventas
-  const [isCollectingAll, setIsCollectingAll] = useState(false);
+  // Avance y fallas al cobrar todas las ventas de un cliente
+  const bulkCollect = useBulkAction();
+  const { run: runCollect, reset: resetCollect, running: isCollectingAll } = bulkCollect;
 
   // Estados para el modal de confirmación
   const [isConfirmModalOpen, setIsConfirmModalOpen] = useState(false);
   const [customerToCollect, setCustomerToCollect] = useState(null);
 
+  // Saca de la lista las ventas ya cobradas y ajusta los totales del cliente,
+  // sin volver a pedir la cobranza completa.
+  const removeCollectedSales = useCallback((customerId, saleIds) => {
+    const collected = new Set(saleIds);
+    setSalesForCollect(prev => prev.flatMap(customer => {
+      if (customer.id !== customerId) return [customer];
+      const remaining = customer.sales_to_collect.filter(sale => !collected.has(sale.id));
+      if (remaining.length === 0) return [];
+      const amount = customer.sales_to_collect
+        .filter(sale => collected.has(sale.id))
+        .reduce((sum, sale) => sum + parseFloat(sale.total_to_collect), 0);
+      return [{
+        ...customer,
+        sales_to_collect: remaining,
+        total_collected: parseFloat(customer.total_collected) + amount,
+        total_to_collect: parseFloat(customer.total_to_collect) - amount,
+      }];
+    }));
+  }, [setSalesForCollect]);
+
   const handleViewDetails = useCallback((customer) => {
     setSelectedCustomer(customer);
     setIsDetailsModalOpen(true);
@@ -162,10 +185,10 @@ export default function CollectPage() {
           },
         }
       );
-      fetchSalesForCollect({}, (page - 1) * rowsPerPage);
       console.log(`Venta #${saleId} marcada como totalmente cobrada.`);
 
       if (selectedCustomer) {
+        removeCollectedSales(selectedCustomer.id, [saleId]);
         const remainingSales = selectedCustomer.sales_to_collect.filter(sale => sale.id !== saleId);
 
         if (remainingSales.length === 0) {
@@ -185,7 +208,7 @@ export default function CollectPage() {
       console.error(`Error al marcar la venta #${saleId} como cobrada:`, error);
       // Manejar errores aquí, por ejemplo, mostrar una notificación
     }
-  }, [fetchSalesForCollect, page, rowsPerPage, selectedCustomer]);
+  }, [removeCollectedSales, selectedCustomer]);
 
   // Función para abrir el modal de confirmación
   const handleCollectAllSales = useCallback((customer) => {
@@ -197,44 +220,46 @@ export default function CollectPage() {
     router.push(`/dashboard/returns/create?sale=${saleId}&customer=${customerId}`);
   }, [router]);
 
-  // Función para manejar la confirmación y realizar la cobranza masiva
+  // Cobra todas las ventas del cliente con varios pedidos en paralelo. Las
+  // que fallan quedan en el modal para reintentarlas.
   const handleConfirmCollectAllSales = useCallback(async (customer) => {
     const token = Cookies.get("access_token");
 
-    try {
-      setIsCollectingAll(true);
-
-      for (const sale of customer.sales_to_collect) {
-        try {
-          await api.post(
-            `/sales/${sale.id}/mark-as-charged/`,
-            {},
-            {
-              headers: {
-                Authorization: `Token ${token}`,
-              },
-            }
-          );
-          console.log(`Venta #${sale.id} marcada como cobrada.`);
-        } catch (error) {
-          console.error(`Error al marcar la venta #${sale.id} como cobrada:`, error);
-          // Opcional: Puedes decidir continuar o detener el proceso
+    const { succeeded, failed } = await runCollect(customer.sales_to_collect, (sale) => (
+      api.post(
+        `/sales/${sale.id}/mark-as-charged/`,
+        {},
+        {
+          headers: {
+            Authorization: `Token ${token}`,
+          },
         }
-      }
+      )
+    ));
 
-      // Refrescar la lista de ventas para cobrar
-      fetchSalesForCollect({}, (page - 1) * rowsPerPage);
-      // Cerrar el modal de confirmación
+    removeCollectedSales(customer.id, succeeded.map(({ item }) => item.id));
+    failed.forEach(({ item, error }) => {
+      console.error(`Error al marcar la venta #${item.id} como cobrada:`, error);
+    });
+
+    if (failed.length === 0) {
       setIsConfirmModalOpen(false);
-      // Limpiar el cliente seleccionado
       setCustomerToCollect(null);
-    } catch (error) {
-      console.error("Error al cobrar todas las ventas:", error);
-      // Manejar errores generales aquí, por ejemplo, mostrar una notificación de error
-    } finally {
-      setIsCollectingAll(false);
+      resetCollect();
+    } else {
+      setCustomerToCollect(prev => ({
+        ...prev,
+        sales_to_collect: failed.map(({ item }) => item),
+      }));
     }
-  }, [fetchSalesForCollect, page, rowsPerPage]);
+  }, [runCollect, resetCollect, removeCollectedSales]);
+
+  const handleCloseConfirmModal = useCallback(() => {
+    if (isCollectingAll) return;
+    setIsConfirmModalOpen(false);
+    setCustomerToCollect(null);
+    resetCollect();
+  }, [isCollectingAll, resetCollect]);
 
   const handlePageChange = useCallback((newPage) => {
     setPage(newPage);
@@ -388,7 +413,7 @@ export default function CollectPage() {
       {/* Modal de Confirmación */}
       <Modal
         isOpen={isConfirmModalOpen}
-        onOpenChange={() => setIsConfirmModalOpen(false)}
+        onOpenChange={handleCloseConfirmModal}
         aria-labelledby="modal-confirm-title"
         placement="center"
         size="sm"
@@ -399,9 +424,16 @@ export default function CollectPage() {
             <p>
               ¿Está seguro de que desea cobrar todas las ventas de <strong>{customerToCollect?.name}</strong>?
             </p>
+            <BulkProgress
+              label="Ventas cobradas"
+              done={bulkCollect.done}
+              total={bulkCollect.total}
+              running={bulkCollect.running}
+              failed={bulkCollect.failed}
+            />
           </ModalBody>
           <ModalFooter>
-            <Button auto flat color="error" onPress={() => setIsConfirmModalOpen(false)}>
+            <Button auto flat color="error" onPress={handleCloseConfirmModal} disabled={isCollectingAll}>
               Cancelar
             </Button>
             <Button
@@ -410,7 +442,7 @@ export default function CollectPage() {
               onPress={() => handleConfirmCollectAllSales(customerToCollect)}
               disabled={isCollectingAll}
             >
-              {isCollectingAll ? <Spinner size="sm" /> : "Confirmar"}
+              {isCollectingAll ? <Spinner size="sm" /> : bulkCollect.failed.length ? "Reintentar" : "Confirmar"}
             </Button>
           </ModalFooter>
         </ModalContent>
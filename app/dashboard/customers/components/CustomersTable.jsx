@@ -12,6 +12,8 @@ import {
   Button
 } from "@nextui-org/react";
 import { IconEdit, IconTrash, IconCalendarEvent, IconChevronUp, IconChevronDown } from "@tabler/icons-react";
+import { useMemo } from "react";
+import { tableWindowProps } from "@/app/tableWindow";
 
 export default function CustomersTable({
   customers,
@@ -57,7 +59,8 @@ export default function CustomersTable({
     );
   };
 
-  const rows = customers.map((customer) => ({
+  // Con páginas grandes no se rearman todas las filas en cada render de la página.
+  const rows = useMemo(() => customers.map((customer) => ({
     id: customer.id,
     name: customer.name,
     phone_number: customer.phone_number,
@@ -108,7 +111,7 @@ export default function CustomersTable({
         </Tooltip>
       </div>
     ),
-  }));
+  })), [customers, capitalize, router, onStandingOrdersClick, onDeleteClick, user]);
 
   return (
     <div className="overflow-x-auto border rounded-md">
@@ -126,7 +129,7 @@ export default function CustomersTable({
           className="border-none min-w-full"
           shadow="none"
           isCompact
-          removeWrapper
+          {...tableWindowProps(rows.length)}
         >
           <TableHeader columns={columns}>
             {(column) => (
@@ -139,26 +142,22 @@ export default function CustomersTable({
               </TableColumn>
             )}
           </TableHeader>
-          <TableBody>
-            {rows.map((item) => (
+          <TableBody items={rows}>
+            {(item) => (
               <TableRow key={item.id}>
-                {columns.map((col) => {
-                  if (col.key === "actions") {
-                    return (
-                      <TableCell key={col.key}>{item.actions}</TableCell>
-                    );
-                  }
-                  return (
-                    <TableCell
-                      key={col.key}
-                      className="min-w-[80px] sm:min-w-[100px]"
-                    >
-                      {item[col.key]}
-                    </TableCell>
-                  );
-                })}
+                {(columnKey) => (
+                  <TableCell
+                    className={
+                      columnKey === "actions"
+                        ? undefined
+                        : "min-w-[80px] sm:min-w-[100px]"
+                    }
+                  >
+                    {item[columnKey]}
+                  </TableCell>
+                )}
               </TableRow>
-            ))}
+            )}
           </TableBody>
         </Table>
       )}
@@ -27,6 +27,7 @@ import {
 import { capitalize } from "@/app/utils";
 import api from "@/app/axios";
 import useCustomers from "@/app/hooks/useCustomers";
+import RowsPerPageSelect from "@/app/components/RowsPerPageSelect";
 
 import CustomersTable from "./components/CustomersTable";
 import ConfirmationModal from "./components/ConfirmationModal";
@@ -61,25 +62,15 @@ export default function CustomersPage() {
   }, []);
 
   const [searchQuery, setSearchQuery] = useState("");
-  const [debouncedSearchQuery, setDebouncedSearchQuery] = useState(searchQuery);
   const [filterCustomerType, setFilterCustomerType] = useState("");
   const [sortDescriptor, setSortDescriptor] = useState({
     column: null,
     direction: null,
   });
   const [page, setPage] = useState(1);
+  const [rowsPerPage, setRowsPerPage] = useState(10);
 
-  useEffect(() => {
-    const handler = setTimeout(() => {
-      setDebouncedSearchQuery(searchQuery);
-      setPage(1);
-    }, 500);
-    return () => {
-      clearTimeout(handler);
-    };
-  }, [searchQuery]);
-
-  const offset = useMemo(() => (page - 1) * 10, [page]);
+  const offset = useMemo(() => (page - 1) * rowsPerPage, [page, rowsPerPage]);
 
   const orderingParam = useMemo(() => {
     if (!sortDescriptor.column) return "";
@@ -92,15 +83,14 @@ export default function CustomersPage() {
     totalCount,
     loading,
     error: fetchError,
-    fetchCustomers,
   } = useCustomers(
     {
-      search: debouncedSearchQuery,
+      search: searchQuery,
       customer_type: filterCustomerType,
       ordering: orderingParam,
     },
     offset,
-    10
+    rowsPerPage
   );
 
   const filterItems = [
@@ -140,13 +130,7 @@ export default function CustomersPage() {
           Authorization: `Token ${token}`,
         },
       });
-      fetchCustomers({
-        search: debouncedSearchQuery,
-        customer_type: filterCustomerType,
-        ordering: orderingParam,
-        page: offset,
-        limit: 10,
-      });
+      // El interceptor de queryCache vuelve a pedir los clientes después del DELETE.
       onClose();
       toast.success("¡Cliente eliminado exitosamente!");
     } catch (err) {
@@ -155,21 +139,18 @@ export default function CustomersPage() {
     } finally {
       setDeleting(false);
     }
-  }, [
-    customerToDelete,
-    debouncedSearchQuery,
-    fetchCustomers,
-    filterCustomerType,
-    orderingParam,
-    offset,
-    onClose,
-  ]);
+  }, [customerToDelete, onClose]);
 
-  const totalPages = Math.ceil(totalCount / 10);
+  const totalPages = Math.ceil(totalCount / rowsPerPage);
   const handlePageChange = useCallback((newPage) => {
     setPage(newPage);
   }, []);
 
+  const handleRowsPerPageChange = useCallback((value) => {
+    setRowsPerPage(value);
+    setPage(1);
+  }, []);
+
   const handleSortChange = useCallback((columnKey) => {
     setSortDescriptor((prev) => {
       if (prev.column === columnKey) {
@@ -345,7 +326,11 @@ export default function CustomersPage() {
           radius="none"
           variant="underlined"
           value={searchQuery}
-          onChange={(e) => setSearchQuery(e.target.value)}
+          onChange={(e) => {
+            // useCustomers espera a que se deje de escribir antes de buscar.
+            setSearchQuery(e.target.value);
+            setPage(1);
+          }}
           className="w-full md:w-1/3"
           aria-label="Buscar clientes"
           isClearable
@@ -404,9 +389,12 @@ export default function CustomersPage() {
       {/* Paginación */}
       {!loading && !fetchError && customers.length > 0 && (
         <div className="flex flex-col sm:flex-row items-center justify-between mt-4">
-          <p className="text-sm text-muted-foreground mb-2 sm:mb-0">
-            Mostrando {customers.length} de {totalCount} clientes
-          </p>
+          <div className="flex items-center gap-3 mb-2 sm:mb-0">
+            <p className="text-sm text-muted-foreground">
+              Mostrando {customers.length} de {totalCount} clientes
+            </p>
+            <RowsPerPageSelect value={rowsPerPage} onChange={handleRowsPerPageChange} />
+          </div>
           <Pagination
             total={totalPages}
             initialPage={page}
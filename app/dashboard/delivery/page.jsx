@@ -1,6 +1,6 @@
 "use client";
 
-import React, { useState, useMemo, useCallback, useEffect } from 'react';
+import React, { useState, useMemo, useCallback, useEffect, useRef } from 'react';
 import {
   Button,
   Table,
@@ -34,7 +34,10 @@ import {
 } from "@tabler/icons-react";
 import useCustomers from "@/app/hooks/useCustomers";
 import useSales from "@/app/hooks/useSales";
+import useBulkAction from "@/app/hooks/useBulkAction";
+import BulkProgress from "@/app/components/BulkProgress";
 import api from '@/app/axios';
+import { invalidateResource } from '@/app/queryCache';
 import Cookies from "js-cookie";
 import { capitalize } from "@/app/utils";
 import { parseDate } from '@internationalized/date';
@@ -50,6 +53,26 @@ const STATE_CHOICES = {
   cancelada: "Cancelada",
 };
 
+// Entrega (y cobra, si corresponde) una venta. `delivered` recuerda las ya
+// entregadas para que un reintento después de fallar el cobro no las vuelva
+// a marcar. Los pedidos no refrescan el listado: la página saca las filas.
+const deliverSale = async (sale, { charge, delivered }) => {
+  const token = Cookies.get('access_token');
+  const config = {
+    headers: {
+      Authorization: `Token ${token}`,
+    },
+    invalidate: false,
+  };
+  if (!delivered?.has(sale.id)) {
+    await api.post(`/sales/${sale.id}/mark-as-delivered/`, null, config);
+    delivered?.add(sale.id);
+  }
+  if (charge) {
+    await api.post(`/sales/${sale.id}/mark-as-charged/`, null, config);
+  }
+};
+
 export default function PendingDeliveriesPage() {
   const router = useRouter();
   const [filterCustomer, setFilterCustomer] = useState(null);
@@ -87,7 +110,23 @@ export default function PendingDeliveriesPage() {
     return filters;
   }, [filterCustomer, filterDate]);
 
-  const { sales, loading: salesLoading, error: salesError, fetchSales } = useSales(salesFilters);
+  const { sales, loading: salesLoading, error: salesError, setSales } = useSales(salesFilters);
+
+  const [selectedKeys, setSelectedKeys] = useState(new Set());
+  const [bulkMode, setBulkMode] = useState(null);
+  const { isOpen: isBulkOpen, onOpen: onBulkOpen, onClose: onBulkClose } = useDisclosure();
+  const bulkDeliver = useBulkAction();
+  const { run: runDelivery, reset: resetDelivery, running: isDelivering } = bulkDeliver;
+  const deliveredRef = useRef(new Set());
+
+  // Las ventas entregadas dejan de estar pendientes: se sacan de la lista sin volver a pedirla.
+  const removeSales = useCallback((saleIds) => {
+    const done = new Set(saleIds);
+    // Los otros listados de ventas se vuelven a pedir cuando se usen.
+    invalidateResource('sales', { refetch: false });
+    setSales(prev => prev.filter(sale => !done.has(sale.id)));
+    setSelectedKeys(prev => (prev === "all" ? new Set() : new Set([...prev].filter(key => !done.has(Number(key))))));
+  }, [setSales]);
 
   const filteredAndSearchedSales = useMemo(() => {
     return sales;
@@ -123,49 +162,59 @@ export default function PendingDeliveriesPage() {
   }, [router]);
 
   const handleMarkAsDelivered = useCallback(async (sale) => {
-    const token = Cookies.get('access_token');
     try {
-      await api.post(
-        `/sales/${sale.id}/mark-as-delivered/`,
-        null,
-        {
-          headers: {
-            Authorization: `Token ${token}`,
-          },
-        }
-      );
-      fetchSales(salesFilters);
+      await deliverSale(sale, { charge: false });
+      removeSales([sale.id]);
     } catch (err) {
       console.error(`Error al marcar como entregado la venta ${sale.id}:`, err);
     }
-  }, [salesFilters, fetchSales]);
+  }, [removeSales]);
 
   const handleMarkAsDeliveredAndCollected = useCallback(async (sale) => {
-    const token = Cookies.get('access_token');
     try {
-      await api.post(
-        `/sales/${sale.id}/mark-as-delivered/`,
-        null,
-        {
-          headers: {
-            Authorization: `Token ${token}`,
-          },
-        }
-      );
-      await api.post(
-        `/sales/${sale.id}/mark-as-charged/`,
-        null,
-        {
-          headers: {
-            Authorization: `Token ${token}`,
-          },
-        }
-      );
-      fetchSales(salesFilters);
+      await deliverSale(sale, { charge: true });
+      removeSales([sale.id]);
     } catch (err) {
       console.error(`Error al marcar como entregado y cobrado la venta ${sale.id}:`, err);
     }
-  }, [salesFilters, fetchSales]);
+  }, [removeSales]);
+
+  const selectedSales = useMemo(() => {
+    if (selectedKeys === "all") return currentItems;
+    return filteredAndSearchedSales.filter(sale => selectedKeys.has(String(sale.id)));
+  }, [selectedKeys, currentItems, filteredAndSearchedSales]);
+
+  const handleOpenBulk = useCallback((mode) => {
+    setBulkMode(mode);
+    resetDelivery();
+    onBulkOpen();
+  }, [resetDelivery, onBulkOpen]);
+
+  const handleCloseBulk = useCallback(() => {
+    if (isDelivering) return;
+    resetDelivery();
+    onBulkClose();
+  }, [isDelivering, resetDelivery, onBulkClose]);
+
+  // Entrega (y cobra) las ventas seleccionadas con varios pedidos en paralelo.
+  // Las que fallan quedan seleccionadas para reintentarlas.
+  const handleConfirmBulk = useCallback(async () => {
+    const charge = bulkMode === "deliver-and-collect";
+    const { succeeded, failed } = await runDelivery(selectedSales, (sale) => (
+      deliverSale(sale, { charge, delivered: deliveredRef.current })
+    ));
+
+    removeSales(succeeded.map(({ item }) => item.id));
+    failed.forEach(({ item, error }) => {
+      console.error(`Error al procesar la venta ${item.id}:`, error);
+    });
+    if (failed.length === 0) {
+      resetDelivery();
+      onBulkClose();
+    } else {
+      setSelectedKeys(new Set(failed.map(({ item }) => String(item.id))));
+    }
+  }, [bulkMode, runDelivery, resetDelivery, selectedSales, removeSales, onBulkClose]);
 
   const columns = [
     { key: 'id', label: '#', sortable: false },
@@ -237,6 +286,16 @@ export default function PendingDeliveriesPage() {
       <div className="flex flex-col md:flex-row md:justify-between items-start md:items-center mb-6">
         <p className="text-2xl font-bold mb-4 md:mb-0">Repartir</p>
         <div className="flex flex-wrap gap-2">
+          {selectedSales.length > 0 && (
+            <>
+              <Button color="primary" className="rounded-md" onPress={() => handleOpenBulk("deliver")}>
+                Entregar seleccionadas ({selectedSales.length})
+              </Button>
+              <Button color="success" className="rounded-md" onPress={() => handleOpenBulk("deliver-and-collect")}>
+                Entregar y cobrar seleccionadas
+              </Button>
+            </>
+          )}
           {/* <Tooltip content="Exportar ventas">
             <Button variant="bordered" className="rounded-md border-1.5">
               <IconDownload className="h-4 mr-1" />
@@ -274,6 +333,9 @@ export default function PendingDeliveriesPage() {
             shadow="none"
             // isCompact
             removeWrapper
+            selectionMode="multiple"
+            selectedKeys={selectedKeys}
+            onSelectionChange={setSelectedKeys}
           >
             <TableHeader columns={columns}>
               {(column) => (
@@ -386,6 +448,47 @@ export default function PendingDeliveriesPage() {
         </ModalContent>
       </Modal>
 
+      {/* Modal de Entrega Masiva */}
+      <Modal
+        isOpen={isBulkOpen}
+        onOpenChange={handleCloseBulk}
+        aria-labelledby="modal-bulk-title"
+        placement="center"
+        size="sm"
+      >
+        <ModalContent>
+          <ModalHeader>
+            {bulkMode === "deliver-and-collect" ? "Entregar y Cobrar" : "Entregar"}
+          </ModalHeader>
+          <ModalBody>
+            <p>
+              {bulkMode === "deliver-and-collect"
+                ? `¿Marcar ${selectedSales.length} ventas como entregadas y cobradas?`
+                : `¿Marcar ${selectedSales.length} ventas como entregadas?`}
+            </p>
+            <BulkProgress
+              label="Ventas procesadas"
+              done={bulkDeliver.done}
+              total={bulkDeliver.total}
+              running={bulkDeliver.running}
+              failed={bulkDeliver.failed}
+            />
+          </ModalBody>
+          <ModalFooter>
+            <Button variant="light" color="danger" onPress={handleCloseBulk} disabled={isDelivering}>
+              Cancelar
+            </Button>
+            <Button
+              color="success"
+              onPress={handleConfirmBulk}
+              disabled={isDelivering || selectedSales.length === 0}
+            >
+              {isDelivering ? <Spinner size="sm" /> : bulkDeliver.failed.length ? "Reintentar" : "Confirmar"}
+            </Button>
+          </ModalFooter>
+        </ModalContent>
+      </Modal>
+
       {/* Modal para Ver Detalles */}
       <Modal size="2xl" isOpen={isViewOpen} onOpenChange={onViewClose} aria-labelledby="view-modal-title" placement="center">
         <ModalContent>
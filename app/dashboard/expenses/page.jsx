@@ -32,7 +32,7 @@ import {
   IconChevronDown,
   IconEdit,
 } from "@tabler/icons-react";
-import { useState, useMemo, useCallback, useEffect } from "react";
+import { useState, useMemo, useCallback } from "react";
 import api from "@/app/axios";
 import Cookies from "js-cookie";
 import { useRouter } from "next/navigation";
@@ -40,6 +40,15 @@ import useExpenses from "@/app/hooks/useExpenses";
 import useExpenseCategories from "@/app/hooks/useExpenseCategories";
 import useSuppliers from "@/app/hooks/useSuppliers";
 import toast from "react-hot-toast";
+import RowsPerPageSelect from "@/app/components/RowsPerPageSelect";
+import { tableWindowProps } from "@/app/tableWindow";
+import { currencyFormatter } from "@/app/utils";
+
+const dateFormatter = new Intl.DateTimeFormat("es-AR", {
+  day: "2-digit",
+  month: "2-digit",
+  year: "numeric",
+});
 
 export default function ExpensesPage() {
   const router = useRouter();
@@ -54,14 +63,13 @@ export default function ExpensesPage() {
 
   // Estado para búsqueda y ordenamiento
   const [searchQuery, setSearchQuery] = useState("");
-  const [debouncedSearchQuery, setDebouncedSearchQuery] = useState(searchQuery);
   const [sortDescriptor, setSortDescriptor] = useState({
     column: null,
     direction: null,
   });
 
   // Paginación
-  const rowsPerPage = 10;
+  const [rowsPerPage, setRowsPerPage] = useState(10);
   const [page, setPage] = useState(1);
 
   // Estados para eliminación de gastos
@@ -89,24 +97,12 @@ export default function ExpensesPage() {
     error: suppliersError,
   } = useSuppliers();
 
-  // Implementación del debouncing para la búsqueda
-  useEffect(() => {
-    const handler = setTimeout(() => {
-      setDebouncedSearchQuery(searchQuery);
-    }, 500); // 500ms de retraso
-
-    // Limpiar el timeout si el componente se desmonta o si searchQuery cambia antes de 500ms
-    return () => {
-      clearTimeout(handler);
-    };
-  }, [searchQuery]);
-
-  // Memoización de filtros aplicados usando debouncedSearchQuery y sortDescriptor
+  // Memoización de filtros aplicados; useExpenses espera a que se deje de escribir
   const appliedFilters = useMemo(() => {
     const newFilters = { ...filters };
 
-    if (debouncedSearchQuery) {
-      newFilters.search = debouncedSearchQuery;
+    if (searchQuery) {
+      newFilters.search = searchQuery;
     }
 
     if (sortDescriptor.column) {
@@ -126,15 +122,14 @@ export default function ExpensesPage() {
     }
 
     return newFilters;
-  }, [filters, debouncedSearchQuery, sortDescriptor]);
+  }, [filters, searchQuery, sortDescriptor]);
 
   const {
     expenses,
     totalCount,
     loading: expensesLoading,
     error: expensesError,
-    refetch: fetchExpenses
-  } = useExpenses(appliedFilters, (page - 1) * rowsPerPage);
+  } = useExpenses(appliedFilters, (page - 1) * rowsPerPage, rowsPerPage);
 
   // Función para aplicar los filtros
   const applyFilters = useCallback(() => {
@@ -192,14 +187,14 @@ export default function ExpensesPage() {
           Authorization: `Token ${token}`,
         },
       });
-      fetchExpenses(appliedFilters, (page - 1) * rowsPerPage, rowsPerPage);
+      // El interceptor de queryCache vuelve a pedir los gastos después del DELETE.
       onClose();
       toast.success("Gasto eliminado correctamente.");
     } catch (error) {
       console.error("Error al eliminar gasto:", error);
       toast.error("Ocurrió un error al eliminar el gasto.");
     }
-  }, [expenseToDelete, fetchExpenses, appliedFilters, page, onClose]);
+  }, [expenseToDelete, onClose]);
 
   // Definición de columnas de la tabla
   const columns = [
@@ -214,22 +209,12 @@ export default function ExpensesPage() {
 
   const formatDate = useCallback((dateString) => {
     if (!dateString) return "";
-    const date = new Date(dateString);
-    return date.toLocaleDateString("es-AR", {
-      day: "2-digit",
-      month: "2-digit",
-      year: "numeric",
-    });
+    return dateFormatter.format(new Date(dateString));
   }, []);
 
   const formatAmount = useCallback((amount) => {
     if (amount == null || isNaN(amount)) return "";
-    return parseFloat(amount).toLocaleString("es-AR", {
-      style: "currency",
-      currency: "ARS",
-      minimumFractionDigits: 2,
-      maximumFractionDigits: 2,
-    });
+    return currencyFormatter.format(parseFloat(amount));
   }, []);
 
   // Generación de filas para la tabla
@@ -283,6 +268,11 @@ export default function ExpensesPage() {
     setPage(newPage);
   }, []);
 
+  const handleRowsPerPageChange = useCallback((value) => {
+    setRowsPerPage(value);
+    setPage(1);
+  }, []);
+
   const handleSortChange = useCallback((columnKey) => {
     setSortDescriptor((prev) => {
       if (prev.column === columnKey) {
@@ -408,7 +398,7 @@ export default function ExpensesPage() {
             className="border-none min-w-full"
             shadow="none"
             isCompact
-            removeWrapper
+            {...tableWindowProps(rows.length)}
           >
             <TableHeader columns={columns}>
               {(column) => (
@@ -421,27 +411,22 @@ export default function ExpensesPage() {
                 </TableColumn>
               )}
             </TableHeader>
-            <TableBody>
-              {rows.map((item) => (
+            <TableBody items={rows}>
+              {(item) => (
                 <TableRow key={item.id}>
-                  {columns.map((column) => {
-                    if (column.key === "id") {
-                      return <TableCell key={column.key}>{item.id}</TableCell>;
-                    }
-                    if (column.key === "actions") {
-                      return <TableCell key={column.key}>{item.actions}</TableCell>;
-                    }
-                    return (
-                      <TableCell
-                        key={column.key}
-                        className="min-w-[80px] sm:min-w-[100px]"
-                      >
-                        {item[column.key]}
-                      </TableCell>
-                    );
-                  })}
+                  {(columnKey) => (
+                    <TableCell
+                      className={
+                        columnKey === "id" || columnKey === "actions"
+                          ? undefined
+                          : "min-w-[80px] sm:min-w-[100px]"
+                      }
+                    >
+                      {item[columnKey]}
+                    </TableCell>
+                  )}
                 </TableRow>
-              ))}
+              )}
             </TableBody>
           </Table>
         )}
@@ -452,9 +437,12 @@ export default function ExpensesPage() {
         !expensesError &&
         expenses.length !== 0 && (
           <div className="flex flex-col sm:flex-row items-center justify-between mt-4">
-            <p className="text-sm text-muted-foreground mb-2 sm:mb-0">
-              Mostrando {expenses.length} de {totalCount} gastos
-            </p>
+            <div className="flex items-center gap-3 mb-2 sm:mb-0">
+              <p className="text-sm text-muted-foreground">
+                Mostrando {expenses.length} de {totalCount} gastos
+              </p>
+              <RowsPerPageSelect value={rowsPerPage} onChange={handleRowsPerPageChange} />
+            </div>
             <Pagination
               total={totalPages}
               initialPage={page}
@@ -32,13 +32,16 @@ import {
   IconChevronDown,
   IconEdit,
 } from "@tabler/icons-react";
-import { useState, useMemo, useCallback, useEffect } from "react";
+import { useState, useMemo, useCallback } from "react";
 import api from "@/app/axios";
 import Cookies from "js-cookie";
 import { useRouter } from "next/navigation";
 import useProducts from "@/app/hooks/useProducts";
 import useProductBrands from "@/app/hooks/useProductBrands";
 import useProductCategories from "@/app/hooks/useProductCategories";
+import RowsPerPageSelect from "@/app/components/RowsPerPageSelect";
+import { tableWindowProps } from "@/app/tableWindow";
+import { currencyFormatter } from "@/app/utils";
 
 export default function ProductsPage() {
   const router = useRouter();
@@ -53,14 +56,13 @@ export default function ProductsPage() {
 
   // Estado para búsqueda y ordenamiento
   const [searchQuery, setSearchQuery] = useState("");
-  const [debouncedSearchQuery, setDebouncedSearchQuery] = useState(searchQuery); // Nuevo estado para debounced search
   const [sortDescriptor, setSortDescriptor] = useState({
     column: null,
     direction: null,
   });
 
   // Paginación
-  const rowsPerPage = 10;
+  const [rowsPerPage, setRowsPerPage] = useState(10);
   const [page, setPage] = useState(1);
 
   // Estados para eliminación de productos
@@ -77,14 +79,6 @@ export default function ProductsPage() {
   } = useDisclosure();
 
   // Hooks para obtener datos
-  const {
-    products,
-    totalCount,
-    loading: productsLoading,
-    error: productsError,
-    fetchProducts,
-  } = useProducts(filters, (page - 1) * rowsPerPage);
-
   const {
     productBrands: brands,
     loading: brandsLoading,
@@ -97,24 +91,12 @@ export default function ProductsPage() {
     error: categoriesError,
   } = useProductCategories();
 
-  // Implementación del debouncing para la búsqueda
-  useEffect(() => {
-    const handler = setTimeout(() => {
-      setDebouncedSearchQuery(searchQuery);
-    }, 500); // 500ms de retraso
-
-    // Limpiar el timeout si el componente se desmonta o si searchQuery cambia antes de 500ms
-    return () => {
-      clearTimeout(handler);
-    };
-  }, [searchQuery]);
-
-  // Memoización de filtros aplicados usando debouncedSearchQuery
+  // Memoización de filtros aplicados; useProducts espera a que se deje de escribir
   const appliedFilters = useMemo(() => {
     const newFilters = { ...filters };
 
-    if (debouncedSearchQuery) {
-      newFilters.search = debouncedSearchQuery;
+    if (searchQuery) {
+      newFilters.search = searchQuery;
     }
 
     if (sortDescriptor.column) {
@@ -135,12 +117,14 @@ export default function ProductsPage() {
     }
 
     return newFilters;
-  }, [filters, debouncedSearchQuery, sortDescriptor]);
+  }, [filters, searchQuery, sortDescriptor]);
 
-  // Uso del hook useEffect para manejar las peticiones a la API
-  useEffect(() => {
-    fetchProducts(appliedFilters, (page - 1) * rowsPerPage, rowsPerPage);
-  }, [appliedFilters, fetchProducts, page, rowsPerPage]);
+  const {
+    products,
+    totalCount,
+    loading: productsLoading,
+    error: productsError,
+  } = useProducts(appliedFilters, (page - 1) * rowsPerPage, rowsPerPage);
 
   // Función para aplicar los filtros
   const applyFilters = () => {
@@ -198,13 +182,13 @@ export default function ProductsPage() {
           Authorization: `Token ${token}`,
         },
       });
-      fetchProducts(appliedFilters, (page - 1) * rowsPerPage, rowsPerPage);
+      // El interceptor de queryCache vuelve a pedir los productos después del DELETE.
       onClose();
     } catch (error) {
       console.error("Error al eliminar el producto:", error);
       // Puedes manejar el error de manera más específica aquí
     }
-  }, [productToDelete, fetchProducts, appliedFilters, onClose, page, rowsPerPage]);
+  }, [productToDelete, onClose]);
 
   // Definición de columnas de la tabla
   const columns = [
@@ -227,10 +211,10 @@ export default function ProductsPage() {
         barcode: product.barcode,
         name: product.name,
         retail_price: product.retail_price != null
-          ? `${parseFloat(product.retail_price).toLocaleString('es-AR', { style: 'currency', currency: 'ARS' })}`
+          ? currencyFormatter.format(parseFloat(product.retail_price))
           : '',
         wholesale_price: product.wholesale_price != null
-          ? `${parseFloat(product.wholesale_price).toLocaleString('es-AR', { style: 'currency', currency: 'ARS' })}`
+          ? currencyFormatter.format(parseFloat(product.wholesale_price))
           : '',
         weight: product.weight ? `${parseFloat(product.weight).toLocaleString('es-AR')} ${product.weight_unit}` : '',
         category: product.category_details?.name || '',
@@ -274,6 +258,11 @@ export default function ProductsPage() {
     setPage(newPage);
   }, []);
 
+  const handleRowsPerPageChange = useCallback((value) => {
+    setRowsPerPage(value);
+    setPage(1);
+  }, []);
+
   const handleSortChange = useCallback((columnKey) => {
     setSortDescriptor((prev) => {
       if (prev.column === columnKey) {
@@ -399,7 +388,7 @@ export default function ProductsPage() {
             className="border-none min-w-full"
             shadow="none"
             isCompact
-            removeWrapper
+            {...tableWindowProps(rows.length)}
           >
             <TableHeader columns={columns}>
               {(column) => (
@@ -412,27 +401,22 @@ export default function ProductsPage() {
                 </TableColumn>
               )}
             </TableHeader>
-            <TableBody>
-              {rows.map((item) => (
+            <TableBody items={rows}>
+              {(item) => (
                 <TableRow key={item.id}>
-                  {columns.map((column) => {
-                    if (column.key === "id") {
-                      return <TableCell key={column.key}>{item.id}</TableCell>;
-                    }
-                    if (column.key === "actions") {
-                      return <TableCell key={column.key}>{item.actions}</TableCell>;
-                    }
-                    return (
-                      <TableCell
-                        key={column.key}
-                        className="min-w-[80px] sm:min-w-[100px]"
-                      >
-                        {item[column.key]}
-                      </TableCell>
-                    );
-                  })}
+                  {(columnKey) => (
+                    <TableCell
+                      className={
+                        columnKey === "id" || columnKey === "actions"
+                          ? undefined
+                          : "min-w-[80px] sm:min-w-[100px]"
+                      }
+                    >
+                      {item[columnKey]}
+                    </TableCell>
+                  )}
                 </TableRow>
-              ))}
+              )}
             </TableBody>
           </Table>
         )}
@@ -441,9 +425,12 @@ export default function ProductsPage() {
       {/* Paginación */}
       {!productsLoading && !productsError && rows.length !== 0 && (
         <div className="flex flex-col sm:flex-row items-center justify-between mt-4">
-          <p className="text-sm text-muted-foreground mb-2 sm:mb-0">
-            Mostrando {products.length} de {totalCount} productos
-          </p>
+          <div className="flex items-center gap-3 mb-2 sm:mb-0">
+            <p className="text-sm text-muted-foreground">
+              Mostrando {products.length} de {totalCount} productos
+            </p>
+            <RowsPerPageSelect value={rowsPerPage} onChange={handleRowsPerPageChange} />
+          </div>
           <Pagination
             total={totalPages}
             initialPage={page}
@@ -47,8 +47,19 @@ import { useRouter } from "next/navigation";
 import useReturns from "@/app/hooks/useReturns";
 import useCustomers from "@/app/hooks/useCustomers";
 import useUsers from "@/app/hooks/useUsers";
-import { formatDateForDisplay } from "@/app/utils";
+import { currencyFormatter, formatDateForDisplay } from "@/app/utils";
 import { parseDateTime } from "@internationalized/date";
+import RowsPerPageSelect from "@/app/components/RowsPerPageSelect";
+import { tableWindowProps } from "@/app/tableWindow";
+
+const saleDateFormatter = new Intl.DateTimeFormat("es-AR", {
+  year: "numeric",
+  month: "numeric",
+  day: "numeric",
+  hour: "2-digit",
+  minute: "2-digit",
+  hour12: false,
+});
 
 export default function ReturnsPage() {
   const router = useRouter();
@@ -68,7 +79,7 @@ export default function ReturnsPage() {
     direction: null,
   });
 
-  const rowsPerPage = 10;
+  const [rowsPerPage, setRowsPerPage] = useState(10);
   const [page, setPage] = useState(1);
 
   const [returnToDelete, setReturnToDelete] = useState(null);
@@ -121,7 +132,6 @@ export default function ReturnsPage() {
     totalCount,
     loading: returnsLoading,
     error: returnsError,
-    fetchReturns,
   } = useReturns(appliedFilters, (page - 1) * rowsPerPage, rowsPerPage);
 
   // Función para aplicar los filtros
@@ -193,13 +203,13 @@ export default function ReturnsPage() {
           Authorization: `Token ${token}`,
         },
       });
-      fetchReturns(appliedFilters, (page - 1) * rowsPerPage, rowsPerPage);
+      // El interceptor de queryCache vuelve a pedir las devoluciones después del DELETE.
       onClose();
     } catch (error) {
       console.error("Error al eliminar la devolución:", error);
       // Puedes manejar el error de manera más específica aquí
     }
-  }, [returnToDelete, fetchReturns, appliedFilters, onClose, page, rowsPerPage]);
+  }, [returnToDelete, onClose]);
 
   const handleViewClick = useCallback(
     (returnItem) => {
@@ -239,18 +249,8 @@ export default function ReturnsPage() {
           "#" +
           returnItem.sale_details.id +
           " - " +
-          new Date(returnItem.sale_details.date).toLocaleDateString("es-AR", {
-            year: "numeric",
-            month: "numeric",
-            day: "numeric",
-            hour: "2-digit",
-            minute: "2-digit",
-            hour12: false,
-          }),
-        total: `${parseFloat(returnItem.total).toLocaleString("es-AR", {
-          style: "currency",
-          currency: "ARS",
-        })}`,
+          saleDateFormatter.format(new Date(returnItem.sale_details.date)),
+        total: currencyFormatter.format(parseFloat(returnItem.total)),
         actions: (
           <div className="flex gap-1">
             <Dropdown>
@@ -298,6 +298,11 @@ export default function ReturnsPage() {
     setPage(newPage);
   }, []);
 
+  const handleRowsPerPageChange = useCallback((value) => {
+    setRowsPerPage(value);
+    setPage(1);
+  }, []);
+
   const handleSortChange = useCallback((columnKey) => {
     setSortDescriptor((prev) => {
       if (prev.column === columnKey) {
@@ -392,7 +397,7 @@ export default function ReturnsPage() {
             className="border-none min-w-full"
             shadow="none"
             isCompact
-            removeWrapper
+            {...tableWindowProps(rows.length)}
           >
             <TableHeader columns={columns}>
               {(column) => (
@@ -405,27 +410,22 @@ export default function ReturnsPage() {
                 </TableColumn>
               )}
             </TableHeader>
-            <TableBody>
-              {rows.map((item) => (
+            <TableBody items={rows}>
+              {(item) => (
                 <TableRow key={item.id}>
-                  {columns.map((column) => {
-                    if (column.key === "id") {
-                      return <TableCell key={column.key}>{item.id}</TableCell>;
-                    }
-                    if (column.key === "actions") {
-                      return <TableCell key={column.key}>{item.actions}</TableCell>;
-                    }
-                    return (
-                      <TableCell
-                        key={column.key}
-                        className="min-w-[80px] sm:min-w-[100px]"
-                      >
-                        {item[column.key]}
-                      </TableCell>
-                    );
-                  })}
+                  {(columnKey) => (
+                    <TableCell
+                      className={
+                        columnKey === "id" || columnKey === "actions"
+                          ? undefined
+                          : "min-w-[80px] sm:min-w-[100px]"
+                      }
+                    >
+                      {item[columnKey]}
+                    </TableCell>
+                  )}
                 </TableRow>
-              ))}
+              )}
             </TableBody>
           </Table>
         )}
@@ -434,9 +434,12 @@ export default function ReturnsPage() {
       {/* Paginación */}
       {!returnsLoading && !returnsError && rows.length !== 0 && (
         <div className="flex flex-col sm:flex-row items-center justify-between mt-4">
-          <p className="text-sm text-muted-foreground mb-2 sm:mb-0">
-            Mostrando {returns.length} de {totalCount} devoluciones
-          </p>
+          <div className="flex items-center gap-3 mb-2 sm:mb-0">
+            <p className="text-sm text-muted-foreground">
+              Mostrando {returns.length} de {totalCount} devoluciones
+            </p>
+            <RowsPerPageSelect value={rowsPerPage} onChange={handleRowsPerPageChange} />
+          </div>
           <Pagination
             total={totalPages}
             initialPage={page}
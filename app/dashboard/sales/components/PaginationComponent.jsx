@@ -1,6 +1,7 @@
 "use client";
 
 import { Pagination } from "@nextui-org/react";
+import RowsPerPageSelect from "@/app/components/RowsPerPageSelect";
 
 const PaginationComponent = ({
   totalPages,
@@ -8,12 +9,17 @@ const PaginationComponent = ({
   onPageChange,
   totalCount,
   displayedCount,
+  rowsPerPage,
+  onRowsPerPageChange,
 }) => {
   return (
     <div className="flex flex-col sm:flex-row items-center justify-between mt-4">
-      <p className="text-sm text-muted-foreground mb-2 sm:mb-0">
-        Mostrando {displayedCount} de {totalCount} ventas
-      </p>
+      <div className="flex items-center gap-3 mb-2 sm:mb-0">
+        <p className="text-sm text-muted-foreground">
+          Mostrando {displayedCount} de {totalCount} ventas
+        </p>
+        <RowsPerPageSelect value={rowsPerPage} onChange={onRowsPerPageChange} />
+      </div>
       <Pagination
         total={totalPages}
         initialPage={currentPage}
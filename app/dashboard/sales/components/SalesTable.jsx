@@ -20,6 +20,8 @@ import {
   IconDots,
 } from "@tabler/icons-react";
 import { useMemo, useCallback } from "react";
+import { tableWindowProps } from "@/app/tableWindow";
+import { currencyFormatter } from "@/app/utils";
 
 const STATE_CHOICES = [
   { id: "creada", name: "Creada" },
@@ -44,6 +46,15 @@ const PAYMENT_METHOD_CHOICES = [
   { id: "cuenta_corriente", name: "Cuenta Corriente" },
 ];
 
+const dateFormatter = new Intl.DateTimeFormat("es-AR", {
+  year: "numeric",
+  month: "numeric",
+  day: "numeric",
+  hour: "2-digit",
+  minute: "2-digit",
+  hour12: false,
+});
+
 const SalesTable = ({
   sales,
   loading,
@@ -94,24 +105,11 @@ const SalesTable = ({
 
       return {
         id: sale.id,
-        date: new Date(sale.date).toLocaleString("es-AR", {
-          year: "numeric",
-          month: "numeric",
-          day: "numeric",
-          hour: "2-digit",
-          minute: "2-digit",
-          hour12: false,
-        }),
+        date: dateFormatter.format(new Date(sale.date)),
         customer: sale.customer_details?.name || "",
         seller: sale.user_details?.username || "",
-        total: `${parseFloat(sale.total).toLocaleString("es-AR", {
-          style: "currency",
-          currency: "ARS",
-        })}`,
-        total_collected: `${parseFloat(sale.total_collected).toLocaleString("es-AR", {
-          style: "currency",
-          currency: "ARS",
-        })}`,
+        total: currencyFormatter.format(parseFloat(sale.total)),
+        total_collected: currencyFormatter.format(parseFloat(sale.total_collected)),
         sale_type:
           SALE_TYPE_CHOICES.find((item) => item.id === sale.sale_type)?.name ||
           sale.sale_type,
@@ -191,7 +189,7 @@ const SalesTable = ({
         className="border-none min-w-full"
         shadow="none"
         isCompact
-        removeWrapper
+        {...tableWindowProps(rows.length)}
       >
         <TableHeader columns={columns}>
           {(column) => (
@@ -204,31 +202,22 @@ const SalesTable = ({
             </TableColumn>
           )}
         </TableHeader>
-        <TableBody>
-          {rows.map((item) => (
+        <TableBody items={rows}>
+          {(item) => (
             <TableRow key={item.id}>
-              {columns.map((column) => {
-                if (column.key === "id") {
-                  return (
-                    <TableCell key={column.key}>{item.id}</TableCell>
-                  );
-                }
-                if (column.key === "actions") {
-                  return (
-                    <TableCell key={column.key}>{item.actions}</TableCell>
-                  );
-                }
-                return (
-                  <TableCell
-                    key={column.key}
-                    className="min-w-[80px] sm:min-w-[100px]"
-                  >
-                    {item[column.key]}
-                  </TableCell>
-                );
-              })}
+              {(columnKey) => (
+                <TableCell
+                  className={
+                    columnKey === "id" || columnKey === "actions"
+                      ? undefined
+                      : "min-w-[80px] sm:min-w-[100px]"
+                  }
+                >
+                  {item[columnKey]}
+                </TableCell>
+              )}
             </TableRow>
-          ))}
+          )}
         </TableBody>
       </Table>
     </div>
@@ -65,7 +65,7 @@ export default function SalesPage() {
     column: null,
     direction: null,
   });
-  const rowsPerPage = 10;
+  const [rowsPerPage, setRowsPerPage] = useState(10);
   const [page, setPage] = useState(1);
 
   const { customers, loading: customersLoading, error: customersError } = useCustomers();
@@ -112,13 +112,8 @@ export default function SalesPage() {
     totalCount,
     loading: salesLoading,
     error: salesError,
-    fetchSales,
   } = useSales(appliedFilters, (page - 1) * rowsPerPage, rowsPerPage);
 
-  useEffect(() => {
-    fetchSales(appliedFilters, (page - 1) * rowsPerPage, rowsPerPage);
-  }, [filters, searchQuery, sortDescriptor, page, fetchSales, appliedFilters]);
-
   const applyFilters = useCallback(
     (newFilters) => {
       const updatedFilters = {};
@@ -187,14 +182,14 @@ export default function SalesPage() {
           Authorization: `Token ${token}`,
         },
       });
-      fetchSales(appliedFilters, (page - 1) * rowsPerPage, rowsPerPage);
+      // El interceptor de queryCache vuelve a pedir las ventas después del POST.
       setSaleToCancel(null);
       toast.success("Venta cancelada exitosamente.");
     } catch (error) {
       console.error("Error al cancelar la venta:", error);
       toast.error("Error al cancelar la venta.");
     }
-  }, [saleToCancel, token, fetchSales, appliedFilters, page]);
+  }, [saleToCancel, token]);
 
   const handleViewClick = useCallback((sale) => {
     setSaleToView(sale);
@@ -219,6 +214,11 @@ export default function SalesPage() {
     setPage(newPage);
   }, []);
 
+  const handleRowsPerPageChange = useCallback((value) => {
+    setRowsPerPage(value);
+    setPage(1);
+  }, []);
+
   const handleSortChange = useCallback((columnKey) => {
     setSortDescriptor((prev) => {
       if (prev.column === columnKey) {
@@ -261,6 +261,8 @@ export default function SalesPage() {
         onPageChange={handlePageChangeFunc}
         totalCount={totalCount}
         displayedCount={sales.length}
+        rowsPerPage={rowsPerPage}
+        onRowsPerPageChange={handleRowsPerPageChange}
       />
 
       {/* Modales */}
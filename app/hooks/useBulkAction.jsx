@@ -0,0 +1,31 @@
+import { useState, useCallback } from 'react';
+import { runBulk } from '../bulkActions';
+
+const IDLE = { running: false, done: 0, total: 0, failed: [] };
+
+// Estado de una operación masiva (cobrar o entregar varias ventas) para
+// mostrar el avance y las fallas mientras corre `runBulk`.
+const useBulkAction = () => {
+  const [progress, setProgress] = useState(IDLE);
+
+  const run = useCallback(async (items, task) => {
+    setProgress({ running: true, done: 0, total: items.length, failed: [] });
+    const result = await runBulk(items, task, {
+      onProgress: ({ done, result }) => {
+        setProgress((prev) => ({
+          ...prev,
+          done,
+          failed: result.ok ? prev.failed : [...prev.failed, result],
+        }));
+      },
+    });
+    setProgress({ running: false, done: items.length, total: items.length, failed: result.failed });
+    return result;
+  }, []);
+
+  const reset = useCallback(() => setProgress(IDLE), []);
+
+  return { ...progress, run, reset };
+};
+
+export default useBulkAction;
@@ -0,0 +1,41 @@
+import { useState, useEffect, useCallback } from 'react';
+import Cookies from 'js-cookie';
+import { fetchQuery, readQuery, subscribe } from '../queryCache';
+
+// GET compartido a través de `queryCache`: los componentes que piden lo
+// mismo comparten un único pedido y, si hay datos vencidos, se muestran
+// mientras se vuelven a pedir. Con `url` null no pide nada.
+const useCachedQuery = (url, params = {}) => {
+  const token = Cookies.get('access_token');
+  const paramsKey = JSON.stringify(params);
+  const [state, setState] = useState(() => (url ? readQuery(url, params, token) : {}));
+
+  useEffect(() => {
+    if (!url) {
+      setState({});
+      return undefined;
+    }
+    const currentParams = JSON.parse(paramsKey);
+    const update = () => setState(readQuery(url, currentParams, token));
+    const unsubscribe = subscribe(url, currentParams, token, update);
+    update();
+    fetchQuery(url, currentParams, token).catch(() => {});
+    return unsubscribe;
+  }, [url, paramsKey, token]);
+
+  const refetch = useCallback(
+    () => (url ? fetchQuery(url, JSON.parse(paramsKey), token, { force: true }).catch(() => {}) : Promise.resolve()),
+    [url, paramsKey, token]
+  );
+
+  return {
+    data: state.data,
+    // Sólo se muestra "cargando" cuando no hay nada que mostrar todavía.
+    loading: Boolean(url) && state.data === undefined && (state.fetching || !state.error),
+    // Si falla una revalidación se siguen mostrando los datos anteriores.
+    error: state.data === undefined ? state.error : null,
+    refetch,
+  };
+};
+
+export default useCachedQuery;
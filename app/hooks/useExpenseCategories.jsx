@@ -1,46 +1,26 @@
-import { useState, useEffect, useCallback } from 'react';
-import api from '../axios';
-import Cookies from 'js-cookie';
+import { useMemo } from 'react';
+import useCachedQuery from './useCachedQuery';
 
 const useExpenseCategories = (offset = 0, limit = 100000) => {
-  const [expenseCategories, setExpenseCategories] = useState([]);
-  const [totalCount, setTotalCount] = useState(0);
-  const [loading, setLoading] = useState(false);
-  const [error, setError] = useState(null);
+  const { data, loading, error, refetch } = useCachedQuery('/expense-categories/', { offset, limit });
 
-  const fetchExpenseCategories = useCallback(async (offset, limit) => {
-    setLoading(true);
-    setError(null);
+  const expenseCategories = useMemo(() => data?.results || [], [data]);
 
-    const token = Cookies.get('access_token');
-    try {
-      const response = await api.get('/expense-categories/', {
-        headers: {
-          Authorization: `Token ${token}`,
-        },
-        params: {
-          offset: offset,
-          limit: limit,
-        },
-      });
-      setExpenseCategories(response.data.results || []);
-      setTotalCount(response.data.count);
-    } catch (err) {
-      if (err.response && err.response.data.detail === "Usted no tiene permiso para realizar esta acción.") {
-        setError("No tiene permisos para esta acción.");
-      } else {
-        setError("Error al cargar las categorías de gasto.");
-      }
-    } finally {
-      setLoading(false);
+  const errorMessage = useMemo(() => {
+    if (!error) return null;
+    if (error.response && error.response.data.detail === "Usted no tiene permiso para realizar esta acción.") {
+      return "No tiene permisos para esta acción.";
     }
-  }, []);
+    return "Error al cargar las categorías de gasto.";
+  }, [error]);
 
-  useEffect(() => {
-    fetchExpenseCategories(offset, limit);
-  }, [offset, limit, fetchExpenseCategories]);
-
-  return { expenseCategories, totalCount, loading, error, fetchExpenseCategories };
+  return {
+    expenseCategories,
+    totalCount: data?.count || 0,
+    loading,
+    error: errorMessage,
+    fetchExpenseCategories: refetch,
+  };
 };
 
-export default useExpenseCategories;
\ No newline at end of file
+export default useExpenseCategories;
@@ -1,53 +1,15 @@
-import { useState, useEffect, useCallback } from 'react';
-import api from '../axios';
-import Cookies from 'js-cookie';
+import useListQuery, { listErrorMessage } from './useListQuery';
 
 const useExpenses = (filters = {}, offset = 0, limit = 100000) => {
-  const [expenses, setExpenses] = useState([]);
-  const [totalCount, setTotalCount] = useState(0);
-  const [loading, setLoading] = useState(false);
-  const [error, setError] = useState(null);
-
-  const fetchExpenses = useCallback(async (filters, offset, limit) => {
-    setLoading(true);
-    setError(null);
-
-    const token = Cookies.get('access_token');
-
-    const queryParams = new URLSearchParams();
-
-    Object.keys(filters).forEach((key) => {
-      queryParams.append(key, filters[key]);
-    });
-    queryParams.append('offset', offset);
-    queryParams.append('limit', limit);
-
-    const queryString = `?${queryParams.toString()}`;
-
-    try {
-      const response = await api.get(`/expenses/${queryString}`, {
-        headers: {
-          Authorization: `Token ${token}`,
-        },
-      });
-      setExpenses(response.data.results || []);
-      setTotalCount(response.data.count);
-    } catch (err) {
-      if (err.response && err.response.data.detail === "Usted no tiene permiso para realizar esta acción.") {
-        setError("No tiene permisos para esta acción.");
-      } else {
-        setError("Error al cargar los gastos.");
-      }
-    } finally {
-      setLoading(false);
-    }
-  }, []);
-
-  useEffect(() => {
-    fetchExpenses(filters, offset, limit);
-  }, [filters, offset, limit, fetchExpenses]);
-
-  return { expenses, totalCount, loading, error, refetch: fetchExpenses };
+  const { items, totalCount, loading, error, refetch } = useListQuery('/expenses/', filters, offset, limit);
+
+  return {
+    expenses: items,
+    totalCount,
+    loading,
+    error: listErrorMessage(error, "Error al cargar los gastos."),
+    refetch,
+  };
 };
 
 export default useExpenses;
@@ -0,0 +1,93 @@
+import { useState, useEffect, useMemo, useCallback } from 'react';
+import Cookies from 'js-cookie';
+import useCachedQuery from './useCachedQuery';
+import { prefetchQuery, setQueryData } from '../queryCache';
+
+export const listUrl = (path, filters, offset, limit) => {
+  const queryParams = new URLSearchParams();
+
+  Object.keys(filters).forEach((key) => {
+    queryParams.append(key, filters[key]);
+  });
+  queryParams.append('offset', offset);
+  queryParams.append('limit', limit);
+
+  return `${path}?${queryParams.toString()}`;
+};
+
+export const listErrorMessage = (error, message) => {
+  if (!error) return null;
+  if (error.response && error.response.data.detail === "Usted no tiene permiso para realizar esta acción.") {
+    return "No tiene permisos para esta acción.";
+  }
+  return message;
+};
+
+// Página de un listado paginado del backend (`{count, results}`).
+//
+// - Los cambios del filtro `search` (lo que se escribe en el buscador) esperan
+//   `debounceMs` sin cambios antes de pedir; el resto de los filtros, el orden
+//   y la página se piden en el momento.
+// - Al cambiar de página o de filtro se cancela el pedido anterior y su
+//   respuesta ya no puede pisar la nueva (ver `queryCache`).
+// - Las páginas visitadas quedan en el caché y la siguiente se precarga.
+const useListQuery = (path, filters = {}, offset = 0, limit = 0, { debounceMs = 300 } = {}) => {
+  const filtersKey = JSON.stringify(filters);
+  const [applied, setApplied] = useState({ filtersKey, offset, limit });
+
+  useEffect(() => {
+    if (applied.filtersKey === filtersKey && applied.offset === offset && applied.limit === limit) {
+      return undefined;
+    }
+    // Sólo se espera al texto de búsqueda; el orden, los filtros de
+    // selección y la página se aplican en el momento.
+    const { search: appliedSearch, ...appliedRest } = JSON.parse(applied.filtersKey);
+    const { search, ...rest } = JSON.parse(filtersKey);
+    if (appliedSearch === search || JSON.stringify(appliedRest) !== JSON.stringify(rest)) {
+      setApplied({ filtersKey, offset, limit });
+      return undefined;
+    }
+    // Un cambio de búsqueda suele venir con la vuelta a la página 1: se esperan los dos juntos.
+    const handler = setTimeout(() => {
+      setApplied({ filtersKey, offset, limit });
+    }, debounceMs);
+    return () => {
+      clearTimeout(handler);
+    };
+  }, [filtersKey, offset, limit, applied, debounceMs]);
+
+  const url = useMemo(
+    () => listUrl(path, JSON.parse(applied.filtersKey), applied.offset, applied.limit),
+    [path, applied]
+  );
+  const { data, loading, error, refetch } = useCachedQuery(url);
+  const count = data?.count;
+
+  useEffect(() => {
+    if (!applied.limit || count === undefined || applied.offset + applied.limit >= count) return;
+    const next = listUrl(path, JSON.parse(applied.filtersKey), applied.offset + applied.limit, applied.limit);
+    prefetchQuery(next, {}, Cookies.get('access_token'));
+  }, [path, applied, count]);
+
+  const items = useMemo(() => data?.results || [], [data]);
+
+  // Actualiza las filas de la página actual sin volver a pedirla.
+  const setItems = useCallback((update) => {
+    setQueryData(url, {}, Cookies.get('access_token'), (prev) => {
+      const results = update(prev.results || []);
+      return { ...prev, results, count: prev.count + results.length - (prev.results || []).length };
+    });
+  }, [url]);
+
+  return {
+    items,
+    totalCount: count || 0,
+    loading,
+    error,
+    // Vuelve a pedir la página actual; los argumentos se ignoran.
+    refetch,
+    setItems,
+  };
+};
+
+export default useListQuery;
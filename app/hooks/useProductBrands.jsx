@@ -1,52 +1,29 @@
-import { useState, useEffect, useCallback } from 'react';
-import api from '../axios';
+import { useMemo } from 'react';
 import Cookies from 'js-cookie';
+import useCachedQuery from './useCachedQuery';
 
 const useProductBrands = (offset = 0, limit = 100000) => {
-  const [productBrands, setProductBrands] = useState([]);
-  const [totalCount, setTotalCount] = useState(0);
-  const [loading, setLoading] = useState(false);
-  const [error, setError] = useState(null);
+  const token = Cookies.get('access_token');
+  const { data, loading, error, refetch } = useCachedQuery(token ? '/product-brands/' : null, { offset, limit });
 
-  const fetchBrands = useCallback(async (offset, limit) => {
-    setLoading(true);
-    setError(null);
+  const productBrands = useMemo(() => data?.results || [], [data]);
 
-    const token = Cookies.get('access_token');
-    if (!token) {
-      setError('Token de acceso no encontrado.');
-      setLoading(false);
-      return;
+  const errorMessage = useMemo(() => {
+    if (!token) return 'Token de acceso no encontrado.';
+    if (!error) return null;
+    if (error.response && error.response.data.detail === "Usted no tiene permiso para realizar esta acción.") {
+      return "No tiene permisos para esta acción.";
     }
+    return "Error al cargar las marcas de productos..";
+  }, [token, error]);
 
-    try {
-      const response = await api.get('/product-brands/', {
-        headers: {
-          Authorization: `Token ${token}`,
-        },
-        params: {
-          offset: offset,
-          limit: limit,
-        },
-      });
-      setProductBrands(response.data.results || []);
-      setTotalCount(response.data.count);
-    } catch (err) {
-      if (err.response && err.response.data.detail === "Usted no tiene permiso para realizar esta acción.") {
-        setError("No tiene permisos para esta acción.");
-      } else {
-        setError("Error al cargar las marcas de productos..");
-      }
-    } finally {
-      setLoading(false);
-    }
-  }, []);
-
-  useEffect(() => {
-    fetchBrands(offset, limit);
-  }, [offset, limit, fetchBrands]);
-
-  return { productBrands, totalCount, loading, error, fetchBrands };
+  return {
+    productBrands,
+    totalCount: data?.count || 0,
+    loading,
+    error: errorMessage,
+    fetchBrands: refetch,
+  };
 };
 
 export default useProductBrands;
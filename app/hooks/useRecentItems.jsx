@@ -0,0 +1,77 @@
+import { useCallback, useSyncExternalStore } from 'react';
+
+const MAX_ITEMS = 40;
+const EMPTY = [];
+
+// Una lista por clave, compartida por todos los componentes que la usan
+// (por ejemplo, el selector de producto de cada fila del POS).
+const stores = new Map();
+
+const read = (key) => {
+  try {
+    return JSON.parse(window.localStorage.getItem(key)) || [];
+  } catch {
+    return [];
+  }
+};
+
+const getStore = (key) => {
+  if (!stores.has(key)) {
+    stores.set(key, { entries: read(key), listeners: new Set() });
+  }
+  return stores.get(key);
+};
+
+const update = (key, change) => {
+  const store = getStore(key);
+  const next = change(store.entries);
+  if (next === store.entries) return;
+  store.entries = next
+    .sort((a, b) => b.count - a.count || b.usedAt - a.usedAt)
+    .slice(0, MAX_ITEMS);
+  try {
+    window.localStorage.setItem(key, JSON.stringify(store.entries));
+  } catch {
+    // Sin localStorage (modo privado, cuota llena) la lista vive sólo en memoria.
+  }
+  store.listeners.forEach((listener) => listener());
+};
+
+// Lo que se elige seguido en esta terminal, guardado en localStorage para
+// mostrarlo al instante. Se ordena por cantidad de usos y, a igualdad, por
+// el más reciente.
+const useRecentItems = (name) => {
+  const key = `lapana:recent:${name}`;
+
+  const subscribe = useCallback((listener) => {
+    const store = getStore(key);
+    store.listeners.add(listener);
+    return () => store.listeners.delete(listener);
+  }, [key]);
+
+  const entries = useSyncExternalStore(subscribe, () => getStore(key).entries, () => EMPTY);
+
+  // Suma un uso del elemento elegido.
+  const remember = useCallback((item) => {
+    update(key, (prev) => {
+      const current = prev.find((entry) => entry.item.id === item.id);
+      const others = prev.filter((entry) => entry.item.id !== item.id);
+      return [...others, { item, count: (current?.count || 0) + 1, usedAt: Date.now() }];
+    });
+  }, [key]);
+
+  // Reemplaza los datos guardados (precio, nombre) por los que acaba de
+  // devolver el backend, sin contar un uso.
+  const refresh = useCallback((items) => {
+    update(key, (prev) => {
+      const byId = new Map(items.map((item) => [item.id, item]));
+      const changed = prev.some((entry) => byId.has(entry.item.id) && JSON.stringify(byId.get(entry.item.id)) !== JSON.stringify(entry.item));
+      if (!changed) return prev;
+      return prev.map((entry) => (byId.has(entry.item.id) ? { ...entry, item: byId.get(entry.item.id) } : entry));
+    });
+  }, [key]);
+
+  return { entries, remember, refresh };
+};
+
+export default useRecentItems;
@@ -6,7 +6,6 @@ import Cookies from 'js-cookie';
 
 const useSalesForCollect = (filters = {}, offset = 0, limit = 10) => {
   const [salesForCollect, setSalesForCollect] = useState([]);
-  const [totalCount, setTotalCount] = useState(0);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState(null);
 
@@ -38,7 +37,6 @@ const useSalesForCollect = (filters = {}, offset = 0, limit = 10) => {
 
       const customers = response.data.customers || [];
       setSalesForCollect(customers);
-      setTotalCount(customers.length);
     } catch (err) {
         if (err.response && err.response.data.detail === "Usted no tiene permiso para realizar esta acción.") {
             setError("No tiene permisos para esta acción.");
@@ -55,7 +53,11 @@ const useSalesForCollect = (filters = {}, offset = 0, limit = 10) => {
     // eslint-disable-next-line react-hooks/exhaustive-deps
   }, [JSON.stringify(filters), offset, limit]);
 
-  return { salesForCollect, totalCount, loading, error, fetchSalesForCollect };
+  // El backend devuelve la página completa, así que el total son los clientes
+  // cargados; se mantiene al día cuando la página cobra ventas sin refrescar.
+  const totalCount = salesForCollect.length;
+
+  return { salesForCollect, totalCount, loading, error, fetchSalesForCollect, setSalesForCollect };
 };
 
 export default useSalesForCollect;
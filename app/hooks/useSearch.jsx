@@ -0,0 +1,80 @@
+import { useState, useEffect, useCallback, useRef } from 'react';
+import axios from 'axios';
+import api from '../axios';
+import Cookies from 'js-cookie';
+
+// Búsqueda paginada contra el backend mientras se escribe: espera
+// `debounceMs` desde la última tecla, cancela el pedido anterior si la
+// búsqueda cambió y trae de a `limit` resultados.
+const useSearch = (url, query, { limit = 20, debounceMs = 250, enabled = true } = {}) => {
+  const [debouncedQuery, setDebouncedQuery] = useState(query);
+  const [state, setState] = useState({ query: null, items: [], count: 0, loading: false, error: null });
+  const controllerRef = useRef(null);
+
+  useEffect(() => {
+    const handler = setTimeout(() => {
+      setDebouncedQuery(query);
+    }, debounceMs);
+    return () => {
+      clearTimeout(handler);
+    };
+  }, [query, debounceMs]);
+
+  const fetchPage = useCallback(async (search, offset) => {
+    controllerRef.current?.abort();
+    const controller = new AbortController();
+    controllerRef.current = controller;
+    setState((prev) => ({ ...prev, loading: true, error: null }));
+
+    const token = Cookies.get('access_token');
+    try {
+      const response = await api.get(url, {
+        headers: {
+          Authorization: `Token ${token}`,
+        },
+        params: {
+          search,
+          offset,
+          limit,
+        },
+        signal: controller.signal,
+      });
+      setState((prev) => ({
+        query: search,
+        items: offset ? [...prev.items, ...(response.data.results || [])] : response.data.results || [],
+        count: response.data.count,
+        loading: false,
+        error: null,
+      }));
+    } catch (err) {
+      if (axios.isCancel(err)) return;
+      setState((prev) => ({ ...prev, loading: false, error: "Error al buscar." }));
+    }
+  }, [url, limit]);
+
+  useEffect(() => {
+    if (!enabled) return undefined;
+    fetchPage(debouncedQuery.trim(), 0);
+    return () => controllerRef.current?.abort();
+  }, [debouncedQuery, enabled, fetchPage]);
+
+  const hasMore = state.items.length < state.count;
+
+  const loadMore = useCallback(() => {
+    if (state.loading || !hasMore || state.query === null) return;
+    fetchPage(state.query, state.items.length);
+  }, [state.loading, state.query, state.items.length, hasMore, fetchPage]);
+
+  return {
+    items: state.items,
+    // La búsqueda de la que son los resultados; difiere de `query` mientras se espera.
+    resultsQuery: state.query,
+    totalCount: state.count,
+    loading: state.loading || debouncedQuery !== query,
+    error: state.error,
+    hasMore,
+    loadMore,
+  };
+};
+
+export default useSearch;
@@ -1,56 +1,34 @@
-import { useState, useEffect, useCallback } from 'react';
-import api from '../axios';
-import Cookies from 'js-cookie';
+import { useMemo } from 'react';
+import useCachedQuery from './useCachedQuery';
 
 const useUsers = (filters = {}, offset = 0, limit = 100000) => {
-  const [users, setUsers] = useState([]);
-  const [totalCount, setTotalCount] = useState(0);
-  const [loading, setLoading] = useState(false);
-  const [error, setError] = useState(null);
+  const queryParams = new URLSearchParams();
 
-  const fetchUsers = useCallback(async (
-    newFilters = {},
-    newOffset = 0,
-    newLimit = 100000
-  ) => {
-    setLoading(true);
-    setError(null);
+  Object.keys(filters).forEach((key) => {
+    queryParams.append(key, filters[key]);
+  });
+  queryParams.append('offset', offset);
+  queryParams.append('limit', limit);
 
-    const token = Cookies.get('access_token');
-    const queryParams = new URLSearchParams();
+  const { data, loading, error, refetch } = useCachedQuery(`/users/?${queryParams.toString()}`);
 
-    Object.keys(newFilters).forEach((key) => {
-      queryParams.append(key, newFilters[key]);
-    });
-    queryParams.append('offset', newOffset);
-    queryParams.append('limit', newLimit);
+  const users = useMemo(() => data?.results || [], [data]);
 
-    const queryString = `?${queryParams.toString()}`;
-    try {
-      const response = await api.get(`/users/${queryString}`, {
-        headers: {
-          Authorization: `Token ${token}`,
-        },
-      });
-      setUsers(response.data.results || []);
-      setTotalCount(response.data.count);
-    } catch (err) {
-      if (err.response && err.response.data.detail === "Usted no tiene permiso para realizar esta acción.") {
-        setError("No tiene permisos para esta acción.");
-      } else {
-        setError("Error al cargar los usuarios.");
-      }
-    } finally {
-      setLoading(false);
+  const errorMessage = useMemo(() => {
+    if (!error) return null;
+    if (error.response && error.response.data.detail === "Usted no tiene permiso para realizar esta acción.") {
+      return "No tiene permisos para esta acción.";
     }
-  }, []);
-
-  useEffect(() => {
-    fetchUsers(filters, offset, limit);
-    // eslint-disable-next-line react-hooks/exhaustive-deps
-  }, [offset, limit, fetchUsers, JSON.stringify(filters)]);
-
-  return { users, totalCount, loading, error, fetchUsers };
+    return "Error al cargar los usuarios.";
+  }, [error]);
+
+  return {
+    users,
+    totalCount: data?.count || 0,
+    loading,
+    error: errorMessage,
+    fetchUsers: refetch,
+  };
 };
 
-export default useUsers;
\ No newline at end of file
+export default useUsers;
@@ -9,7 +9,7 @@ export default function RootLayout({ children }) {
     <html lang="en">
       <body>
         <Toaster />
-        <NextUIProvider>
+        <NextUIProvider reducedMotion="user">
           {children}
         </NextUIProvider>
       </body>
@@ -0,0 +1,193 @@
+import axios from 'axios';
+import api from './axios';
+
+// Cuánto tiempo se considera fresca cada respuesta, por recurso. Pasado ese
+// tiempo se sigue mostrando lo que hay mientras se vuelve a pedir.
+export const RESOURCE_TTL = {
+  'product-categories': 5 * 60 * 1000,
+  'product-brands': 5 * 60 * 1000,
+  'expense-categories': 5 * 60 * 1000,
+  suppliers: 5 * 60 * 1000,
+  users: 2 * 60 * 1000,
+  customers: 60 * 1000,
+  // Listados que cambian desde otras terminales (POS, reparto).
+  sales: 10 * 1000,
+  returns: 10 * 1000,
+};
+const DEFAULT_TTL = 30 * 1000;
+
+// Entradas sin componentes suscritos que se conservan (páginas visitadas o
+// precargadas); se descartan las usadas hace más tiempo.
+const MAX_IDLE_ENTRIES = 50;
+
+const entries = new Map();
+
+export const resourceOf = (url) => url.split('?')[0].split('/').filter(Boolean)[0] || '';
+
+const keyFor = (url, params, token) => {
+  const query = new URLSearchParams(params || {}).toString();
+  return `${token || ''} ${url}${query ? `${url.includes('?') ? '&' : '?'}${query}` : ''}`;
+};
+
+const getEntry = (url, params, token) => {
+  const key = keyFor(url, params, token);
+  let entry = entries.get(key);
+  if (!entry) {
+    entry = {
+      key,
+      url,
+      params,
+      token,
+      resource: resourceOf(url),
+      data: undefined,
+      error: null,
+      updatedAt: 0,
+      usedAt: Date.now(),
+      stale: true,
+      promise: null,
+      controller: null,
+      // Se invalidó mientras había un pedido en curso: al terminar, se repite.
+      invalidated: false,
+      listeners: new Set(),
+    };
+    entries.set(key, entry);
+    pruneIdle();
+  }
+  entry.usedAt = Date.now();
+  return entry;
+};
+
+const pruneIdle = () => {
+  const idle = [...entries.values()].filter((entry) => !entry.listeners.size && !entry.promise);
+  idle
+    .sort((a, b) => a.usedAt - b.usedAt)
+    .slice(0, Math.max(0, idle.length - MAX_IDLE_ENTRIES))
+    .forEach((entry) => entries.delete(entry.key));
+};
+
+const notify = (entry) => entry.listeners.forEach((listener) => listener());
+
+const isFresh = (entry) =>
+  !entry.stale && Date.now() - entry.updatedAt < (RESOURCE_TTL[entry.resource] ?? DEFAULT_TTL);
+
+// Pide la entrada al backend. Si ya hay un pedido en curso para la misma
+// clave, todos esperan ese mismo pedido.
+const revalidate = (entry) => {
+  if (entry.promise) return entry.promise;
+  const controller = new AbortController();
+  const promise = api
+    .get(entry.url, {
+      headers: { Authorization: `Token ${entry.token}` },
+      params: entry.params,
+      signal: controller.signal,
+    })
+    .then((response) => {
+      entry.data = response.data;
+      entry.error = null;
+      entry.updatedAt = Date.now();
+      entry.stale = entry.invalidated;
+      return response.data;
+    })
+    .catch((err) => {
+      // Un pedido cancelado no es un error: la entrada queda vencida.
+      if (!axios.isCancel(err)) entry.error = err;
+      throw err;
+    })
+    .finally(() => {
+      // Si se canceló, puede que ya haya otro pedido en curso para la entrada.
+      if (entry.promise !== promise) return;
+      entry.promise = null;
+      entry.controller = null;
+      notify(entry);
+      if (entry.invalidated) {
+        entry.invalidated = false;
+        if (entry.listeners.size) revalidate(entry).catch(() => {});
+      }
+    });
+  entry.promise = promise;
+  entry.controller = controller;
+  notify(entry);
+  return promise;
+};
+
+const cancel = (entry) => {
+  entry.controller.abort();
+  entry.promise = null;
+  entry.controller = null;
+  entry.invalidated = false;
+};
+
+export const subscribe = (url, params, token, listener) => {
+  const entry = getEntry(url, params, token);
+  entry.listeners.add(listener);
+  return () => {
+    entry.listeners.delete(listener);
+    // Nadie espera ya esta respuesta (se cambió de página o de filtro): se
+    // cancela el pedido en vez de dejarlo ocupar la conexión.
+    if (!entry.listeners.size && entry.controller) cancel(entry);
+  };
+};
+
+export const readQuery = (url, params, token) => {
+  const entry = entries.get(keyFor(url, params, token));
+  if (!entry) return { data: undefined, error: null, fetching: false, fresh: false };
+  entry.usedAt = Date.now();
+  return {
+    data: entry.data,
+    error: entry.error,
+    fetching: Boolean(entry.promise),
+    fresh: isFresh(entry),
+  };
+};
+
+// Devuelve los datos en caché si están frescos y, si no, los pide.
+// `force` ignora el TTL (lo usan los fetchX de los hooks).
+export const fetchQuery = (url, params, token, { force = false } = {}) => {
+  const entry = getEntry(url, params, token);
+  if (!force && isFresh(entry)) return Promise.resolve(entry.data);
+  return revalidate(entry);
+};
+
+// Pide en segundo plano algo que probablemente se use enseguida (la página
+// siguiente de un listado). No lo cancela nadie: queda en el caché.
+export const prefetchQuery = (url, params, token) => {
+  fetchQuery(url, params, token).catch(() => {});
+};
+
+// Reemplaza los datos guardados sin pedirlos, para reflejar un cambio que
+// ya se conoce (por ejemplo, sacar las ventas recién entregadas).
+export const setQueryData = (url, params, token, update) => {
+  const entry = entries.get(keyFor(url, params, token));
+  if (!entry || entry.data === undefined) return;
+  entry.data = update(entry.data);
+  notify(entry);
+};
+
+// Marca como vencidas las entradas del recurso y vuelve a pedir las que
+// tienen componentes montados; el resto se pide cuando se vuelva a usar.
+// Con `refetch: false` tampoco se piden las montadas, porque la página ya
+// actualizó sus filas con `setQueryData`.
+export const invalidateResource = (resource, { refetch = true } = {}) => {
+  entries.forEach((entry) => {
+    if (entry.resource !== resource) return;
+    entry.stale = true;
+    if (!refetch) return;
+    if (entry.promise) {
+      entry.invalidated = true;
+    } else if (entry.listeners.size) {
+      revalidate(entry).catch(() => {});
+    }
+  });
+};
+
+// Cualquier alta, edición o baja que responda bien vence el caché de su
+// recurso: después de POST /customers/ o DELETE /customers/5/ se vuelve a
+// pedir la lista de clientes. Los pedidos con `invalidate: false` se saltean
+// (la página se encarga de actualizar sus filas).
+api.interceptors.response.use((response) => {
+  const method = (response.config.method || 'get').toLowerCase();
+  if (!['get', 'head', 'options'].includes(method) && response.config.invalidate !== false) {
+    invalidateResource(resourceOf(response.config.url || ''));
+  }
+  return response;
+});
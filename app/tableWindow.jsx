@@ -0,0 +1,32 @@
+// Tablas del dashboard con muchas filas.
+//
+// Con páginas grandes la tabla se virtualiza: NextUI monta sólo las filas
+// visibles más unas de margen y las reemplaza al desplazarse dentro de un
+// contenedor de alto fijo. Para que la virtualización funcione las filas
+// tienen que pasarse con `<TableBody items={rows}>` y no con `rows.map`.
+
+export const ROWS_PER_PAGE_OPTIONS = [10, 50, 100, 1000, 10000];
+
+// Hasta esta cantidad de filas la tabla se pinta entera, como siempre.
+const WINDOW_FROM = 50;
+
+// Alto de una fila compacta con botones de acción (botón de 40px + padding).
+export const ROW_HEIGHT = 48;
+
+const MAX_TABLE_HEIGHT = 600;
+
+// Props de `<Table>` según la cantidad de filas de la página.
+export const tableWindowProps = (rowCount) => {
+  if (rowCount <= WINDOW_FROM) {
+    return { removeWrapper: true };
+  }
+  // El contenedor que scrollea es el wrapper de NextUI: no se puede quitar,
+  // sólo dejarlo sin padding ni sombra para que se vea igual.
+  return {
+    isVirtualized: true,
+    isHeaderSticky: true,
+    rowHeight: ROW_HEIGHT,
+    maxTableHeight: MAX_TABLE_HEIGHT,
+    classNames: { wrapper: "p-0 rounded-none shadow-none" },
+  };
+};
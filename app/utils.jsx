@@ -5,6 +5,13 @@ export function cn(...inputs) {
   return twMerge(clsx(...inputs));
 }
 
+// Precios en pesos. Se reutiliza un formateador: `toLocaleString` con opciones
+// arma uno nuevo en cada llamada y las páginas grandes formatean miles de celdas.
+export const currencyFormatter = new Intl.NumberFormat("es-AR", {
+  style: "currency",
+  currency: "ARS",
+});
+
 export const capitalize = (str) => {
   if (typeof str !== "string") return "";
   return str.charAt(0).toUpperCase() + str.slice(1).toLowerCase();
@@ -0,0 +1,39 @@
+from support.api import ApiError
+from support.records import customer_payload, mismatches
+
+
+async def create_customer(ctx):
+    payload = customer_payload(ctx.data)
+    created = await ctx.create("customers", payload)
+    row = await ctx.call("GET", f"/customers/{created['id']}/")
+    assert not mismatches(row, payload), mismatches(row, payload)
+
+
+async def edit_customer(ctx):
+    created = await ctx.create("customers", customer_payload(ctx.data))
+    changes = customer_payload(
+        ctx.data,
+        name=ctx.data.name("Juan Pérez Modificado"),
+        email=ctx.data.email("juan.perez.modificado@example.com"),
+        phone_number=ctx.data.phone("+5491198765432"),
+        address="Avenida Siempre Viva 742",
+        customer_type="minorista",
+    )
+    await ctx.call("PUT", f"/customers/{created['id']}/", changes)
+    row = await ctx.call("GET", f"/customers/{created['id']}/")
+    assert not mismatches(row, changes), mismatches(row, changes)
+
+
+async def delete_customer(ctx):
+    created = await ctx.create("customers", customer_payload(ctx.data))
+    await ctx.call("DELETE", f"/customers/{created['id']}/")
+    ctx.forget("customers", created)
+    try:
+        await ctx.call("GET", f"/customers/{created['id']}/")
+    except ApiError as e:
+        assert e.status == 404, e
+    else:
+        raise AssertionError("El cliente sigue existiendo después de borrarlo.")
+
+
+CASES = [create_customer, edit_customer, delete_customer]
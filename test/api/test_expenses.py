@@ -0,0 +1,38 @@
+from support.api import ApiError
+from support.records import EXPENSE_CATEGORY, SUPPLIER, expense_payload, mismatches
+
+
+async def _payload(ctx, **overrides):
+    category = await ctx.lookup("expense-categories", EXPENSE_CATEGORY)
+    supplier = await ctx.lookup("suppliers", SUPPLIER)
+    return expense_payload(ctx.data, category, supplier, **overrides)
+
+
+async def create_expense(ctx):
+    payload = await _payload(ctx)
+    created = await ctx.create("expenses", payload)
+    row = await ctx.call("GET", f"/expenses/{created['id']}/")
+    assert not mismatches(row, payload), mismatches(row, payload)
+
+
+async def edit_expense(ctx):
+    created = await ctx.create("expenses", await _payload(ctx))
+    changes = await _payload(ctx, amount="2500.75", description=ctx.data.name("Gasto editado de prueba"))
+    await ctx.call("PUT", f"/expenses/{created['id']}/", changes)
+    row = await ctx.call("GET", f"/expenses/{created['id']}/")
+    assert not mismatches(row, changes), mismatches(row, changes)
+
+
+async def delete_expense(ctx):
+    created = await ctx.create("expenses", await _payload(ctx))
+    await ctx.call("DELETE", f"/expenses/{created['id']}/")
+    ctx.forget("expenses", created)
+    try:
+        await ctx.call("GET", f"/expenses/{created['id']}/")
+    except ApiError as e:
+        assert e.status == 404, e
+    else:
+        raise AssertionError("El gasto sigue existiendo después de borrarlo.")
+
+
+CASES = [create_expense, edit_expense, delete_expense]
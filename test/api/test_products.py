@@ -0,0 +1,46 @@
+from support.api import ApiError
+from support.records import PRODUCT_BRAND, PRODUCT_CATEGORY, mismatches, product_payload
+
+
+async def _payload(ctx, **overrides):
+    category = await ctx.lookup("product-categories", PRODUCT_CATEGORY)
+    brand = await ctx.lookup("product-brands", PRODUCT_BRAND)
+    return product_payload(ctx.data, category, brand, **overrides)
+
+
+async def create_product(ctx):
+    payload = await _payload(ctx)
+    created = await ctx.create("products", payload)
+    row = await ctx.call("GET", f"/products/{created['slug']}/")
+    assert not mismatches(row, payload), mismatches(row, payload)
+
+
+async def edit_product(ctx):
+    created = await ctx.create("products", await _payload(ctx))
+    changes = await _payload(
+        ctx,
+        barcode=ctx.data.barcode("9876543210987"),
+        name=ctx.data.name("Pan Integral Premium"),
+        retail_price="120.00",
+        wholesale_price="100.00",
+        description="Pan integral premium con ingredientes seleccionados.",
+    )
+    updated = await ctx.call("PUT", f"/products/{created['slug']}/", changes)
+    ctx.track("products", updated)
+    row = await ctx.call("GET", f"/products/{updated['slug']}/")
+    assert not mismatches(row, changes), mismatches(row, changes)
+
+
+async def delete_product(ctx):
+    created = await ctx.create("products", await _payload(ctx))
+    await ctx.call("DELETE", f"/products/{created['slug']}/")
+    ctx.forget("products", created)
+    try:
+        await ctx.call("GET", f"/products/{created['slug']}/")
+    except ApiError as e:
+        assert e.status == 404, e
+    else:
+        raise AssertionError("El producto sigue existiendo después de borrarlo.")
+
+
+CASES = [create_product, edit_product, delete_product]
@@ -1,28 +1,36 @@
-from selenium import webdriver
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import json
 import urllib.parse
 
-options = Options()
-options.add_argument('--start-maximized')
+from support.config import BASE_URL, credentials_for
+from support.flow import run_script
+from support.profiler import step
+from support.session import save_session
 
-driver = webdriver.Chrome(options=options)
 
-try:
-    driver.get("http://localhost:3000/auth/login")
+def run(driver, data):
+    step("Abrir login")
+    username, password = credentials_for("ADMIN")
+    driver.get(f"{BASE_URL}/auth/login")
 
     wait = WebDriverWait(driver, 10)
+    step("Completar credenciales")
     username_field = wait.until(EC.presence_of_element_located((By.XPATH, "//input[@placeholder='Nombre de usuario']")))
 
-    username_field.send_keys("lucasleone03")
+    username_field.send_keys(username)
 
     password_field = driver.find_element(By.XPATH, "//input[@placeholder='********']")
 
-    password_field.send_keys("admin12345")
+    password_field.send_keys(password)
 
+    step("Iniciar sesión")
     login_button = driver.find_element(By.XPATH, "//button[@type='submit']")
 
     login_button.click()
@@ -37,6 +45,7 @@ try:
     else:
         print("Error en el inicio de sesión.")
 
+    step("Leer cookies")
     cookies = driver.get_cookies()
     print("\nCookies actuales en el navegador:")
     for cookie in cookies:
@@ -60,8 +69,10 @@ try:
     else:
         print("\nCookie 'access_token' no encontrada.")
 
-except Exception as e:
-    print("Ocurrió un error:", e)
+    # El resto de los scripts de la corrida reutilizan esta sesión.
+    if user_cookie and token_cookie:
+        save_session("ADMIN", {"user": user_data, "access_token": access_token})
+
 
-finally:
-    driver.quit()
+if __name__ == "__main__":
+    run_script(run)
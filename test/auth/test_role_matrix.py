@@ -0,0 +1,21 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from support.contexts import print_matrix, run_matrix
+from support.flow import run_script
+from support.profiler import step
+
+
+def run(driver, data):
+    # Un contexto aislado por rol dentro de este mismo Chrome, todos a la vez.
+    step("Recorrer rol × ruta")
+    report = run_matrix(driver)
+    print_matrix(report)
+    if report["failures"]:
+        raise AssertionError(f"{len(report['failures'])} combinaciones de rol y ruta no coinciden con el middleware.")
+
+
+if __name__ == "__main__":
+    run_script(run)
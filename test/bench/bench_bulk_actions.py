@@ -0,0 +1,203 @@
+"""Mide cuánto tardan desde la UI el cobro y la entrega masivos con latencia inyectada.
+
+Uso: python test/bench/bench_bulk_actions.py [--sales 40] [--latency 300] [--jitter 100]
+                                             [--error-rate 0] [-n 3] [--report archivo.json]
+
+Levanta el backend simulado en NEXT_PUBLIC_API_URL con una demora en los
+``POST /sales/{id}/mark-as-*/`` (como un celular con datos móviles) y carga un
+cliente con ``--sales`` ventas abiertas y una página de ventas pendientes de
+entrega. Mide, desde que se confirma hasta que el modal se cierra, "Cobrar
+Totalmente" en /dashboard/collect y "Entregar y cobrar seleccionadas" en
+/dashboard/delivery. Junto al tiempo total informa la suma de los tiempos del
+backend para esos pedidos, que es lo que tardaría mandarlos de a uno. Las
+corridas quedan en la base de ``support.results`` con el origen "bulk".
+"""
+import argparse
+import datetime
+import json
+import os
+import statistics
+import sys
+import time
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium.webdriver.common.by import By
+
+from support.backend import MockBackend
+from support.config import API_URL
+from support.driver import create_driver
+from support.netwaits import watch_network
+from support.results import DEFAULT_DB, record_results
+from support.session import clear_sessions, start_session
+from support.waits import wait_for, wait_for_modal_open, wait_for_table_rows
+
+ACTION_PATH = r"^/sales/\d+/mark-as-"
+
+# El modal se cierra si todo salió bien; si no, queda abierto con la lista de fallas.
+_BULK_FINISHED = """
+const dialog = document.querySelector('[role="dialog"]');
+if (!dialog) return {failed: 0};
+const alert = dialog.querySelector('[role="alert"]');
+return alert ? {failed: alert.querySelectorAll("li").length} : null;
+"""
+
+_SELECT_ALL = """
+const box = document.querySelector(`table[aria-label="${arguments[0]}"] thead input[type="checkbox"]`);
+box.click();
+"""
+
+
+def add_open_sales(store, name, count, state):
+    """Un cliente nuevo con ``count`` ventas de hoy en ``state``, sin detalles (venta rápida)."""
+    user = next(iter(store.tables["users"].values()))
+    customer = store.insert("customers", store.prepare("customers", {"name": name}))
+    # delivery/page.jsx filtra por la fecha de hoy en UTC-3.
+    today = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(hours=3)
+    for i in range(count):
+        sale = store.prepare("sales", {
+            "date": today.replace(microsecond=0).isoformat(),
+            "customer": customer["id"],
+            "payment_method": "efectivo",
+            "sale_type": "minorista",
+            "total": 1000 + i,
+        }, user=user)
+        sale["state"] = state
+        store.insert("sales", sale)
+    return customer
+
+
+def backend_ms(backend, start):
+    """Tiempos del backend de las acciones sobre ventas registradas desde ``start``."""
+    with backend.server.stats_lock:
+        entries = list(backend.server.log)[start:]
+    return [e["ms"] for e in entries if e["method"] == "POST" and "/mark-as-" in e["path"]]
+
+
+def run_bulk(driver, backend, open_modal):
+    """Confirma la operación del modal ya abierto y espera a que termine."""
+    network = watch_network(driver)
+    open_modal()
+    wait_for_modal_open(driver)
+    with backend.server.stats_lock:
+        log_start = len(backend.server.log)
+    mark = network.mark()
+    confirm = driver.find_element(By.XPATH, "//*[@role='dialog']//button[normalize-space()='Confirmar']")
+    start = time.perf_counter()
+    confirm.click()
+    outcome = wait_for(driver, _BULK_FINISHED, timeout=300, message="La operación masiva no terminó.")
+    elapsed = (time.perf_counter() - start) * 1000
+    network.wait_for_idle(quiet_ms=300, timeout=30)
+    posts = [r for r in network.responses_since(mark) if r["method"] == "POST" and "/mark-as-" in r["url"]]
+    server = backend_ms(backend, log_start)
+    return {
+        "wall_ms": elapsed,
+        "serial_ms": sum(server),
+        "requests": len(posts),
+        "failed": outcome["failed"],
+    }
+
+
+def measure_collect(driver, backend, sales, iteration):
+    name = f"Cliente Cobranza {iteration}"
+    add_open_sales(backend.store, name, sales, "entregada")
+    start_session(driver, "/dashboard/collect")
+    wait_for_table_rows(driver, table_label="Cobranza", timeout=30)
+
+    def open_modal():
+        row = driver.find_element(By.XPATH, f"//table[@aria-label='Cobranza']//tr[td[normalize-space()='{name}']]")
+        row.find_element(By.TAG_NAME, "button").click()
+        wait_for(
+            driver,
+            "return [...document.querySelectorAll('[role=\"menuitem\"]')].find((i) => i.textContent.includes('Cobrar Totalmente'));",
+            message="No se abrió el menú de cobranza.",
+        ).click()
+
+    return run_bulk(driver, backend, open_modal)
+
+
+def measure_delivery(driver, backend, sales, iteration):
+    add_open_sales(backend.store, f"Cliente Reparto {iteration}", sales, "pendiente_entrega")
+    start_session(driver, "/dashboard/delivery")
+    label = "Ventas Pendientes de Entrega"
+    wait_for_table_rows(driver, table_label=label, timeout=30)
+
+    def open_modal():
+        driver.execute_script(_SELECT_ALL, label)
+        wait_for(
+            driver,
+            "return [...document.querySelectorAll('button')].find((b) => b.textContent.trim() === 'Entregar y cobrar seleccionadas');",
+            message="No apareció la acción masiva de reparto.",
+        ).click()
+
+    return run_bulk(driver, backend, open_modal)
+
+
+SCENARIOS = {"cobrar": measure_collect, "repartir": measure_delivery}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sales", type=int, default=40, help="Ventas abiertas del cliente a cobrar.")
+    parser.add_argument("--deliveries", type=int, default=10, help="Ventas pendientes de entrega (una página).")
+    parser.add_argument("--latency", type=float, default=300, help="Demora de cada acción sobre una venta, en ms.")
+    parser.add_argument("--jitter", type=float, default=100, help="Demora extra aleatoria, en ms.")
+    parser.add_argument("--error-rate", type=float, default=0, help="Proporción de acciones que responden 503.")
+    parser.add_argument("-n", "--iterations", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--report", help="Guardar los resultados en JSON.")
+    parser.add_argument("--results", default=DEFAULT_DB, metavar="DB", help="Base SQLite de resultados (ver perf_history.py).")
+    parser.add_argument("--no-results", action="store_true", help="No guardar las corridas en la base de resultados.")
+    args = parser.parse_args(argv)
+
+    rule = {
+        "method": "POST",
+        "path": ACTION_PATH,
+        "latency_ms": args.latency,
+        "jitter_ms": args.jitter,
+        "error_rate": args.error_rate,
+        "error_status": 503,
+    }
+    api = urlsplit(API_URL)
+    backend = MockBackend(api.hostname, api.port or 80, seed=args.seed, size="empty",
+                          rules=[rule], prefix=api.path.rstrip("/"))
+    backend.start()
+    # Cada backend simulado nuevo emite tokens nuevos.
+    clear_sessions()
+
+    counts = {"cobrar": args.sales, "repartir": args.deliveries}
+    runs = {scenario: [] for scenario in SCENARIOS}
+    driver = create_driver()
+    try:
+        for iteration in range(1, args.iterations + 1):
+            for scenario, measure in SCENARIOS.items():
+                runs[scenario].append(measure(driver, backend, counts[scenario], iteration))
+    finally:
+        driver.quit()
+        backend.stop()
+
+    print(f"Latencia inyectada: {args.latency:.0f} ms + hasta {args.jitter:.0f} ms, errores {args.error_rate:.0%}")
+    print(f"{'Operación':<12}{'Pedidos':>9}{'Total':>11}{'En serie':>11}{'Mejora':>9}{'Fallas':>8}")
+    for scenario, samples in runs.items():
+        wall = statistics.median(s["wall_ms"] for s in samples)
+        serial = statistics.median(s["serial_ms"] for s in samples)
+        requests = statistics.median(s["requests"] for s in samples)
+        failed = max(s["failed"] for s in samples)
+        print(f"{scenario:<12}{requests:>9.0f}{wall:>9.0f}ms{serial:>9.0f}ms{serial / wall:>8.1f}x{failed:>8}")
+
+    if not args.no_results:
+        rows = [
+            (f"bulk-{scenario}", "", metric, sample[metric])
+            for scenario, samples in runs.items()
+            for sample in samples
+            for metric in ("wall_ms", "requests", "failed")
+        ]
+        record_results("bulk", rows, args.results)
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump({"rule": rule, "counts": counts, "runs": runs}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
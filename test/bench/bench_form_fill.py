@@ -0,0 +1,117 @@
+"""Compara el llenado tecla por tecla contra ``fill_form`` en los formularios de alta.
+
+Uso: python test/bench/bench_form_fill.py [-n ITERACIONES] [--report archivo.json]
+
+No envía los formularios: sólo mide el llenado y verifica que los valores
+quedaron cargados.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from support.data import DataNamespace
+from support.driver import create_driver
+from support.forms import fill_form, find_field, read_form, wait_for_field
+from support.session import start_session
+
+FORMS = {
+    "productos": ("/dashboard/products/create", lambda data: {
+        "Código de Barras": data.barcode("123456789013"),
+        "Nombre del Producto": data.name("Pan Negro"),
+        "Precio Minorista": "100.00",
+        "Precio Mayorista": "90.00",
+        "Descripción del Producto": "Pan integral saludable",
+    }),
+    "clientes": ("/dashboard/customers/create", lambda data: {
+        "Ingrese el nombre del cliente": data.name("Juan Paerez"),
+        "Ingrese el correo electrónico": data.email("juan.aperez@example.com"),
+        "Ingrese el número de celular": data.phone("+54911122345678"),
+        "Ingrese la dirección del cliente": "Calle Falsa 123",
+    }),
+    "gastos": ("/dashboard/expenses/create", lambda data: {
+        "Monto del Gasto": "1000.50",
+        "Descripción del Gasto": data.name("Compra de insumos de prueba"),
+    }),
+}
+
+
+def count_commands(driver):
+    """Envuelve ``driver.execute`` para contar los round trips a chromedriver."""
+    counter = {"commands": 0}
+    execute = driver.execute
+
+    def counted(*args, **kwargs):
+        counter["commands"] += 1
+        return execute(*args, **kwargs)
+
+    driver.execute = counted
+    return counter
+
+
+def fill_per_key(driver, values):
+    for key, value in values.items():
+        find_field(driver, key).send_keys(value)
+
+
+def fill_direct(driver, values):
+    fill_form(driver, values)
+
+
+def measure(driver, counter, path, values, fill):
+    start_session(driver, path)
+    wait_for_field(driver, next(iter(values)))
+    counter["commands"] = 0
+    start = time.perf_counter()
+    fill(driver, values)
+    elapsed = time.perf_counter() - start
+    commands = counter["commands"]
+    if read_form(driver, values) != values:
+        raise AssertionError(f"Los valores no quedaron cargados en {path}.")
+    return elapsed, commands
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--iterations", type=int, default=5)
+    parser.add_argument("--report", help="Guardar los resultados en JSON.")
+    args = parser.parse_args(argv)
+
+    driver = create_driver()
+    counter = count_commands(driver)
+    data = DataNamespace()
+    results = {}
+    try:
+        for form, (path, build) in FORMS.items():
+            results[form] = {}
+            for mode, fill in (("por_tecla", fill_per_key), ("fill_form", fill_direct)):
+                times, commands = [], []
+                for _ in range(args.iterations):
+                    elapsed, count = measure(driver, counter, path, build(data), fill)
+                    times.append(elapsed)
+                    commands.append(count)
+                results[form][mode] = {
+                    "median": statistics.median(times),
+                    "commands": max(commands),
+                }
+    finally:
+        driver.quit()
+
+    print(f"{'formulario':<12}{'modo':<12}{'mediana':>10}{'comandos':>10}")
+    for form, modes in results.items():
+        for mode, result in modes.items():
+            print(f"{form:<12}{mode:<12}{result['median']:>9.3f}s{result['commands']:>10}")
+        speedup = modes["por_tecla"]["median"] / modes["fill_form"]["median"]
+        print(f"{'':<12}{'mejora':<12}{speedup:>9.1f}x")
+
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""Mide los pedidos y el tiempo de cambio de página de los listados del dashboard.
+
+Uso: python test/bench/bench_list_paging.py [--pages /dashboard/products,...] [--latency 200]
+                                            [--query "pan lac"] [--key-interval 80] [-n 3]
+                                            [--report archivo.json]
+
+Levanta el backend simulado en NEXT_PUBLIC_API_URL con ``--latency`` ms en
+los GET de listados y, en cada página:
+
+- escribe ``--query`` en el buscador a ``--key-interval`` ms por tecla,
+  cuenta los GET del listado (antes, uno por cada cambio de filtro) y
+  verifica que la tabla muestra el resultado de la búsqueda completa y no una
+  respuesta atrasada de una búsqueda parcial;
+- pasa a la página siguiente y mide el tiempo hasta que cambia la primera fila
+  (con la página ya precargada no espera a la red);
+- vuelve a la primera, que tiene que salir del caché sin pedirla.
+
+Termina con código 1 si alguna tabla quedó mostrando una respuesta atrasada.
+
+Las corridas quedan en la base de ``support.results`` con el origen "lists".
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+
+from support.api import api_request
+from support.backend import MockBackend
+from support.config import API_URL
+from support.driver import create_driver
+from support.netwaits import watch_network
+from support.results import DEFAULT_DB, record_results
+from support.session import clear_sessions, get_session, start_session
+from support.waits import wait_for, wait_for_table_rows
+
+# Ruta, recurso de la API, aria-label de la tabla y del buscador.
+PAGES = {
+    "/dashboard/products": ("/products/", "Productos", "Buscar productos"),
+    "/dashboard/customers": ("/customers/", "Clientes", "Buscar clientes"),
+    "/dashboard/expenses": ("/expenses/", "Gastos", "Buscar gastos"),
+}
+SIZE = {"products": 120, "customers": 120, "sales": 0, "expenses": 120}
+ROWS_PER_PAGE = 10
+
+_FIRST_ROW = """
+const row = document.querySelector(`table[aria-label="${arguments[0]}"] tbody tr[data-key]`);
+return row ? row.getAttribute("data-key") : null;
+"""
+
+# Arma la medición antes del clic: el reloj arranca con el pointerdown y para
+# cuando la primera fila de la tabla es otra.
+_ARM_NEXT_PAGE = """
+const label = arguments[0];
+const first = () => document.querySelector(`table[aria-label="${label}"] tbody tr[data-key]`)?.getAttribute("data-key");
+const before = first();
+let start = null;
+document.addEventListener("pointerdown", () => { start = performance.now(); }, { once: true, capture: true });
+window.__lapanaNextPage = new Promise((resolve) => {
+  const check = () => {
+    const now = first();
+    if (start !== null && now && now !== before) {
+      observer.disconnect();
+      resolve(performance.now() - start);
+    }
+  };
+  const observer = new MutationObserver(check);
+  observer.observe(document.body, { childList: true, subtree: true, attributes: true });
+});
+"""
+
+_AWAIT_NEXT_PAGE = """
+const done = arguments[arguments.length - 1];
+window.__lapanaNextPage.then(done);
+"""
+
+
+def page_item(driver, number):
+    return wait_for(
+        driver,
+        "return document.querySelector(`[aria-label=\"pagination item ${args}\"]`);",
+        args=number,
+        message=f"No está la página {number} en la paginación.",
+    )
+
+
+def list_gets(network, mark, resource):
+    """Offsets de los GET del listado llegados desde ``mark``."""
+    offsets = []
+    for response in network.responses_since(mark):
+        parts = urlsplit(response["url"])
+        if response["method"] == "GET" and parts.path.endswith(resource):
+            offsets.append(int(parse_qs(parts.query).get("offset", ["0"])[0]))
+    return offsets
+
+
+def first_row(driver, table_label):
+    return driver.execute_script(_FIRST_ROW, table_label)
+
+
+def expected_first_row(resource, token, **params):
+    query = urlencode({**params, "limit": ROWS_PER_PAGE})
+    results = api_request("GET", f"{resource}?{query}", token=token)["results"]
+    return str(results[0]["id"]) if results else None
+
+
+def measure_typing(driver, network, labels, resource, token, query, interval):
+    table_label, search_label = labels
+    field = driver.find_element(By.CSS_SELECTOR, f'input[aria-label="{search_label}"]')
+    field.click()
+    mark = network.mark()
+    for char in query:
+        field.send_keys(char)
+        time.sleep(interval / 1000)
+    network.wait_for_idle(quiet_ms=800, timeout=30)
+    requests = len(list_gets(network, mark, resource))
+    stale = first_row(driver, table_label) != expected_first_row(resource, token, search=query, offset=0)
+    field.send_keys(*[Keys.BACKSPACE] * len(query))
+    network.wait_for_idle(quiet_ms=800, timeout=30)
+    return {"keystrokes": len(query), "search_requests": requests, "stale_page": int(stale)}
+
+
+def measure_page_change(driver, network, table_label, resource, number):
+    driver.execute_script(_ARM_NEXT_PAGE, table_label)
+    mark = network.mark()
+    page_item(driver, number).click()
+    elapsed = driver.execute_async_script(_AWAIT_NEXT_PAGE)
+    network.wait_for_idle(quiet_ms=300, timeout=30)
+    # Pedidos de la página que se abrió; los de la siguiente son la precarga.
+    return elapsed, list_gets(network, mark, resource).count((number - 1) * ROWS_PER_PAGE)
+
+
+def measure_paging(driver, network, table_label, resource):
+    # Se da tiempo a la precarga de la página 2, como un usuario que lee la primera.
+    network.wait_for_idle(quiet_ms=300, timeout=30)
+    next_ms, next_requests = measure_page_change(driver, network, table_label, resource, 2)
+    back_ms, back_requests = measure_page_change(driver, network, table_label, resource, 1)
+    return {
+        "next_page_ms": next_ms,
+        "next_page_requests": next_requests,
+        "back_page_ms": back_ms,
+        "back_page_requests": back_requests,
+    }
+
+
+def measure_page(driver, path, args, token):
+    resource, table_label, search_label = PAGES[path]
+    network = watch_network(driver)
+    start_session(driver, path)
+    wait_for_table_rows(driver, table_label=table_label, timeout=30)
+    result = measure_typing(driver, network, (table_label, search_label), resource, token, args.query, args.key_interval)
+    result.update(measure_paging(driver, network, table_label, resource))
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", default=",".join(PAGES), help="Listados a medir, separados por coma.")
+    parser.add_argument("--latency", type=float, default=200, help="Demora de los GET de listados, en ms.")
+    parser.add_argument("--query", default="pan lac", help="Texto a escribir en el buscador.")
+    parser.add_argument("--key-interval", type=float, default=80, help="Milisegundos entre teclas.")
+    parser.add_argument("-n", "--iterations", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--report", help="Guardar los resultados en JSON.")
+    parser.add_argument("--results", default=DEFAULT_DB, metavar="DB", help="Base SQLite de resultados (ver perf_history.py).")
+    parser.add_argument("--no-results", action="store_true", help="No guardar las corridas en la base de resultados.")
+    args = parser.parse_args(argv)
+
+    paths = args.pages.split(",")
+    resources = "|".join(PAGES[path][0].strip("/") for path in paths)
+    rule = {"method": "GET", "path": rf"^/({resources})/$", "latency_ms": args.latency}
+    api = urlsplit(API_URL)
+    backend = MockBackend(api.hostname, api.port or 80, seed=args.seed, size=SIZE,
+                          rules=[rule], prefix=api.path.rstrip("/"))
+    backend.start()
+    # Cada backend simulado nuevo emite tokens nuevos.
+    clear_sessions()
+
+    runs = {path: [] for path in paths}
+    driver = create_driver()
+    try:
+        token = get_session()["access_token"]
+        for _ in range(args.iterations):
+            for path in paths:
+                runs[path].append(measure_page(driver, path, args, token))
+    finally:
+        driver.quit()
+        backend.stop()
+
+    print(f"Latencia de listados: {args.latency:.0f} ms; búsqueda de {len(args.query)} teclas cada {args.key_interval:.0f} ms")
+    print(f"{'Listado':<24}{'Teclas':>8}{'GET búsq.':>11}{'Pág. sig.':>11}{'GET':>5}{'Volver':>9}{'GET':>5}{'Atrasada':>10}")
+    for path, samples in runs.items():
+        keys = samples[0]["keystrokes"]
+        search = statistics.median(s["search_requests"] for s in samples)
+        next_ms = statistics.median(s["next_page_ms"] for s in samples)
+        next_requests = max(s["next_page_requests"] for s in samples)
+        back_ms = statistics.median(s["back_page_ms"] for s in samples)
+        back_requests = max(s["back_page_requests"] for s in samples)
+        stale = sum(s["stale_page"] for s in samples)
+        print(
+            f"{path:<24}{keys:>8}{search:>11.0f}{next_ms:>9.0f}ms{next_requests:>5}"
+            f"{back_ms:>7.0f}ms{back_requests:>5}{stale:>10}"
+        )
+    print("GET búsq.: pedidos del listado mientras se escribe; GET: pedidos de la página abierta (0 si salió del caché).")
+
+    if not args.no_results:
+        rows = [
+            (f"list{path[len('/dashboard'):]}", "", metric, value)
+            for path, samples in runs.items()
+            for sample in samples
+            for metric, value in sample.items()
+        ]
+        record_results("lists", rows, args.results)
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump({"rule": rule, "runs": runs}, f, indent=2)
+    return 1 if any(s["stale_page"] for samples in runs.values() for s in samples) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
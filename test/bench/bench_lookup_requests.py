@@ -0,0 +1,147 @@
+"""Cuenta los pedidos a la API de una secuencia de navegación dentro de la app.
+
+Uso: python test/bench/bench_lookup_requests.py [--sequence /dashboard/products,/,...] [-n 3]
+                                                [--fail-on-repeats] [--report archivo.json]
+
+La primera ruta se abre con una carga completa y las siguientes con
+navegación del lado del cliente (el link del sidebar o ``router.push``), como
+al moverse por el dashboard. Para cada paso se cuentan los GET a la API y,
+aparte, los de datos de referencia (categorías, marcas, proveedores, clientes,
+usuarios). Las corridas quedan en la base de ``support.results`` con el
+origen "requests": corriéndolo en dos commits, ``perf_history.py compare``
+muestra la diferencia.
+"""
+import argparse
+import json
+import os
+import sys
+from collections import Counter
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from support.config import API_URL
+from support.driver import create_driver
+from support.netwaits import watch_network
+from support.results import DEFAULT_DB, record_results
+from support.session import start_session
+from support.waits import wait_for, wait_for_spinner_gone
+
+SEQUENCE = [
+    "/dashboard/products",
+    "/dashboard/expenses",
+    "/",
+    "/dashboard/returns",
+    "/dashboard/products",
+    "/dashboard/expenses",
+    "/dashboard/returns",
+]
+
+# Los recursos de los hooks que comparten el caché de app/queryCache.jsx.
+LOOKUP_RESOURCES = {"product-categories", "product-brands", "suppliers", "expense-categories", "customers", "users"}
+
+_NAVIGATE_SCRIPT = """
+const path = arguments[0];
+const link = [...document.querySelectorAll("a[href]")].find((a) => a.getAttribute("href") === path);
+if (link) { link.click(); return "link"; }
+window.next.router.push(path);
+return "router";
+"""
+
+
+def api_path(url):
+    """``/customers/?offset=0&limit=10`` para una URL de la API, None para el resto."""
+    if not url.startswith(f"{API_URL}/"):
+        return None
+    parts = urlsplit(url[len(API_URL):])
+    return f"{parts.path}?{parts.query}" if parts.query else parts.path
+
+
+def resource_of(path):
+    return path.split("?")[0].strip("/").split("/")[0]
+
+
+def navigate(driver, network, path, first):
+    mark = network.mark()
+    if first:
+        start_session(driver, path)
+        how = "carga"
+    else:
+        how = driver.execute_script(_NAVIGATE_SCRIPT, path)
+        wait_for(driver, "return location.pathname === args ? true : null;", args=path, message=f"No se llegó a {path}.")
+    wait_for_spinner_gone(driver, timeout=30)
+    network.wait_for_idle(quiet_ms=500, timeout=30)
+    gets = [api_path(r["url"]) for r in network.responses_since(mark) if r["method"] == "GET" and api_path(r["url"])]
+    return {
+        "path": path,
+        "how": how,
+        "api_requests": len(gets),
+        "lookup_requests": sum(resource_of(p) in LOOKUP_RESOURCES for p in gets),
+        "requests": gets,
+    }
+
+
+def run_sequence(driver, sequence):
+    network = watch_network(driver)
+    steps = [navigate(driver, network, path, index == 0) for index, path in enumerate(sequence)]
+    lookups = Counter(p for step in steps for p in step["requests"] if resource_of(p) in LOOKUP_RESOURCES)
+    return {
+        "steps": steps,
+        "api_requests": sum(step["api_requests"] for step in steps),
+        "lookup_requests": sum(step["lookup_requests"] for step in steps),
+        "repeats": {path: count for path, count in lookups.items() if count > 1},
+    }
+
+
+def rows(runs):
+    for run in runs:
+        yield "lookup-requests", "", "api_requests", run["api_requests"]
+        yield "lookup-requests", "", "lookup_requests", run["lookup_requests"]
+        for index, step in enumerate(run["steps"], 1):
+            for metric in ("api_requests", "lookup_requests"):
+                yield "lookup-requests", f"{index} {step['path']}", metric, step[metric]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sequence", help="Rutas separadas por coma (por defecto, productos, gastos, POS y devoluciones).")
+    parser.add_argument("-n", "--iterations", type=int, default=3, help="Veces que se recorre la secuencia, cada una desde cero.")
+    parser.add_argument("--fail-on-repeats", action="store_true", help="Terminar con código 1 si un dato de referencia se pidió dos veces.")
+    parser.add_argument("--report", help="Guardar los resultados en JSON.")
+    parser.add_argument("--results", default=DEFAULT_DB, metavar="DB", help="Base SQLite de resultados (ver perf_history.py).")
+    parser.add_argument("--no-results", action="store_true", help="No guardar las corridas en la base de resultados.")
+    args = parser.parse_args(argv)
+
+    sequence = args.sequence.split(",") if args.sequence else SEQUENCE
+    runs = []
+    for _ in range(args.iterations):
+        # Un navegador nuevo por vuelta, para que nada quede en memoria de la anterior.
+        driver = create_driver()
+        try:
+            runs.append(run_sequence(driver, sequence))
+        finally:
+            driver.quit()
+
+    last = runs[-1]
+    print(f"{'Paso':<4}{'Ruta':<26}{'Navegación':<12}{'GET API':>8}{'Referencia':>12}")
+    for index, step in enumerate(last["steps"], 1):
+        print(f"{index:<4}{step['path']:<26}{step['how']:<12}{step['api_requests']:>8}{step['lookup_requests']:>12}")
+    print(f"\nTotal: {last['api_requests']} GET a la API, {last['lookup_requests']} de datos de referencia")
+    repeats = Counter()
+    for run in runs:
+        repeats.update(run["repeats"])
+    if repeats:
+        print("Datos de referencia pedidos más de una vez en la secuencia:")
+        for path, count in repeats.most_common():
+            print(f"  {path}: {count / len(runs):.1f} veces por vuelta")
+
+    if not args.no_results:
+        record_results("requests", list(rows(runs)), args.results)
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump({"sequence": sequence, "runs": runs}, f, indent=2)
+    return 1 if args.fail_on_repeats and repeats else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
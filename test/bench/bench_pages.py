@@ -0,0 +1,168 @@
+"""Mide el rendimiento de carga de las páginas del dashboard y del POS.
+
+Uso: python test/bench/bench_pages.py [-n ITERACIONES] [--routes /dashboard,...]
+                                      [--baseline archivo.json] [--update-baseline]
+
+Cada ruta se carga ``n`` veces con la caché HTTP vacía (fría) y ``n`` veces con
+la caché ya cargada (tibia). Con ``--baseline`` se comparan las medianas contra
+el archivo de referencia y el script termina con código 1 si alguna página
+empeoró más de lo tolerado. Las iteraciones quedan además en la base de
+resultados de ``support.results`` para compararlas entre commits.
+"""
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from support.config import BASE_URL
+from support.driver import create_driver
+from support.perf import cdp_metrics, clear_cache, compare, install_observers, page_metrics, summarize, wait_until_loaded
+from support.results import DEFAULT_DB, page_rows, record_results
+from support.session import start_session
+
+ROUTES = [
+    "/dashboard",
+    "/dashboard/products",
+    "/dashboard/sales",
+    "/dashboard/customers",
+    "/dashboard/statistics",
+    "/dashboard/collect",
+    "/dashboard/delivery",
+    "/",
+]
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pages-baseline.json")
+
+# Diferencia absoluta mínima para considerar una regresión, por unidad.
+DEFAULT_FLOORS = {
+    "ttfb": 50,
+    "dom_content_loaded": 50,
+    "load": 50,
+    "fcp": 50,
+    "lcp": 50,
+    "long_task_ms": 50,
+    "script_ms": 50,
+    "layout_ms": 20,
+    "style_ms": 20,
+    "task_ms": 50,
+    "long_tasks": 1,
+    "transfer_kb": 20,
+    "heap_mb": 2,
+    "nodes": 200,
+    "listeners": 50,
+}
+
+
+def load_route(driver, route):
+    before = cdp_metrics(driver)
+    driver.get(f"{BASE_URL}{route}")
+    wait_until_loaded(driver)
+    return page_metrics(driver, before)
+
+
+def measure_route(driver, route, iterations):
+    cold = []
+    for _ in range(iterations):
+        clear_cache(driver)
+        cold.append(load_route(driver, route))
+    # Una carga para llenar la caché antes de medir en tibio.
+    load_route(driver, route)
+    warm = [load_route(driver, route) for _ in range(iterations)]
+    return {"cold": cold, "warm": warm}
+
+
+def check(results, baseline, tolerance):
+    failures = []
+    if tolerance is None:
+        tolerance = baseline.get("tolerance", 0.2)
+    tolerances = baseline.get("tolerances", {})
+    floors = {**DEFAULT_FLOORS, **baseline.get("floors", {})}
+    for route, modes in results.items():
+        for mode, metrics in modes.items():
+            reference = baseline.get("routes", {}).get(route, {}).get(mode)
+            if not reference:
+                continue
+            for regression in compare(metrics, reference, tolerance, tolerances, floors):
+                failures.append({"route": route, "mode": mode, **regression})
+    return failures
+
+
+def print_results(results):
+    columns = ["ttfb", "fcp", "lcp", "load", "long_task_ms", "script_ms", "heap_mb", "nodes"]
+    print(f"{'Ruta':<24}{'Modo':<6}" + "".join(f"{c:>13}" for c in columns))
+    for route, modes in results.items():
+        for mode, metrics in modes.items():
+            values = "".join(
+                f"{metrics[c]:>13.1f}" if metrics.get(c) is not None else f"{'-':>13}" for c in columns
+            )
+            print(f"{route:<24}{mode:<6}{values}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--iterations", type=int, default=5)
+    parser.add_argument("--routes", help="Rutas separadas por coma (por defecto, todas).")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Archivo de referencia.")
+    parser.add_argument("--update-baseline", action="store_true", help="Guarda esta corrida como referencia.")
+    parser.add_argument("--tolerance", type=float, help="Tolerancia relativa (0.2 = 20%%); por defecto la del archivo de referencia.")
+    parser.add_argument("--report", help="Guardar los resultados en JSON.")
+    parser.add_argument("--results", default=DEFAULT_DB, metavar="DB", help="Base SQLite de resultados (ver perf_history.py).")
+    parser.add_argument("--no-results", action="store_true", help="No guardar las iteraciones en la base de resultados.")
+    args = parser.parse_args(argv)
+
+    routes = args.routes.split(",") if args.routes else ROUTES
+    driver = create_driver()
+    samples = {}
+    try:
+        start_session(driver, "/dashboard")
+        install_observers(driver)
+        for route in routes:
+            samples[route] = measure_route(driver, route, args.iterations)
+            print(f"Medida {route}")
+    finally:
+        driver.quit()
+
+    results = {route: {mode: summarize(values) for mode, values in modes.items()} for route, modes in samples.items()}
+    if not args.no_results:
+        record_results("pages", page_rows(samples), args.results)
+
+    print()
+    print_results(results)
+
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.update_baseline:
+        baseline = {"tolerance": args.tolerance or 0.2, "tolerances": {}, "floors": {}, "routes": {}}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        baseline.setdefault("routes", {}).update(results)
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2)
+        print(f"\nReferencia guardada en {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\nNo hay referencia en {args.baseline}; usar --update-baseline para crearla.")
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    failures = check(results, baseline, args.tolerance)
+    if failures:
+        print("\nRegresiones contra la referencia:")
+        for f in failures:
+            print(
+                f"  {f['route']} ({f['mode']}) {f['metric']}: {f['value']:.1f} "
+                f"> {f['allowed']:.1f} (referencia {f['baseline']:.1f})"
+            )
+        return 1
+    print("\nSin regresiones contra la referencia.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""Compara el recorrido rol × ruta del middleware en contextos aislados contra un Chrome por caso.
+
+Uso: python test/bench/bench_role_matrix.py [--tabs N] [--por-rol] [--report archivo.json]
+
+Por defecto la referencia es lo que costaría con los scripts actuales: un
+Chrome nuevo por rol y ruta. Con ``--por-rol`` se usa un Chrome por rol.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from support.contexts import discover_routes, print_matrix, run_matrix, run_matrix_per_browser
+from support.driver import create_driver
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tabs", type=int, default=2, help="Pestañas por contexto.")
+    parser.add_argument("--por-rol", action="store_true", help="Referencia con un Chrome por rol en lugar de uno por ruta.")
+    parser.add_argument("--sin-referencia", action="store_true", help="Sólo la corrida con contextos.")
+    parser.add_argument("--report", help="Guarda los dos recorridos en JSON.")
+    args = parser.parse_args()
+
+    routes = discover_routes()
+    start = time.perf_counter()
+    driver = create_driver()
+    launch = time.perf_counter() - start
+    try:
+        contexts = run_matrix(driver, routes=routes, tabs=args.tabs)
+    finally:
+        driver.quit()
+    contexts["wall_time"] += launch
+    print_matrix(contexts)
+
+    report = {"routes": routes, "contexts": contexts}
+    if not args.sin_referencia:
+        baseline = run_matrix_per_browser(create_driver, routes=routes, per_route=not args.por_rol)
+        report["per_browser"] = baseline
+        label = "un Chrome por rol" if args.por_rol else "un Chrome por rol y ruta"
+        print()
+        print(f"Contextos aislados (1 Chrome, {args.tabs} pestañas por rol): {contexts['wall_time']:.2f}s")
+        print(f"{label.capitalize()}: {baseline['wall_time']:.2f}s")
+        print(f"Speedup: {baseline['wall_time'] / contexts['wall_time']:.2f}x")
+        if baseline["failures"]:
+            print(f"La referencia tuvo {len(baseline['failures'])} combinaciones distintas de lo esperado.")
+
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(report, f, indent=2)
+    return 1 if contexts["failures"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+"""Mide cómo escalan el POS y los listados con 1k, 10k y 100k productos y clientes.
+
+Uso: python test/bench/bench_scaling.py [--sizes 1000,10000,100000] [-n 3] [--mock]
+                                        [--out directorio]
+
+Para cada tamaño se cargan productos y clientes (con ``--mock`` en el backend
+simulado, si no a través de la API con ``support.seeder``) y se mide en el POS
+y en los listados: tiempo hasta interactivo, latencia de tecla a resultados en
+los Autocomplete, duración de los frames al scrollear y heap de JS. Deja un
+CSV, un JSON y, si está matplotlib, un gráfico por métrica contra la cantidad
+de filas.
+"""
+import argparse
+import asyncio
+import csv
+import json
+import os
+import statistics
+import sys
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+
+from support.backend import MockBackend
+from support.config import API_URL, BASE_URL
+from support.driver import create_driver
+from support.http import AsyncClient, login
+from support.perf import cdp_metrics, install_observers, keystroke_latencies, scroll_frame_times, time_to_interactive
+from support.seeder import Seeder, plan
+from support.session import clear_sessions, start_session
+
+SIZES = [1_000, 10_000, 100_000]
+
+_TABLE_READY = """
+if (document.querySelector('[aria-label="Loading"], [aria-label^="Cargando"]')) return false;
+const table = document.querySelector('table[aria-label="{label}"]');
+return table && table.querySelector("tbody").textContent.trim().length > 0;
+"""
+
+LIST_PAGES = {
+    "/dashboard/products": _TABLE_READY.replace("{label}", "Productos"),
+    "/dashboard/customers": _TABLE_READY.replace("{label}", "Clientes"),
+    "/dashboard/expenses": _TABLE_READY.replace("{label}", "Gastos"),
+    "/dashboard/returns": _TABLE_READY.replace("{label}", "Devoluciones"),
+}
+
+POS_READY = """
+return Boolean(document.querySelector('input[placeholder="Cliente"]'));
+"""
+
+# Texto a teclear en cada Autocomplete del POS; coincide con los nombres del seed.
+CUSTOMER_QUERY = "alm"
+PRODUCT_QUERY = "med"
+
+METRICS = ["tti", "customer_key_ms", "product_key_ms", "frame_p95", "janky_frames", "heap_mb", "nodes"]
+
+
+def measure_list(driver, path, ready):
+    driver.get(f"{BASE_URL}{path}")
+    result = {"tti": time_to_interactive(driver, ready)}
+    result.update(scroll_frame_times(driver))
+    result.update({k: v for k, v in cdp_metrics(driver).items() if k in ("heap_mb", "nodes")})
+    return result
+
+
+def measure_pos(driver):
+    driver.get(f"{BASE_URL}/")
+    result = {"tti": time_to_interactive(driver, POS_READY)}
+
+    customer = driver.find_element(By.XPATH, "//input[@placeholder='Cliente']")
+    customer.click()
+    result["customer_key_ms"] = statistics.median(keystroke_latencies(driver, customer, CUSTOMER_QUERY))
+    result.update(scroll_frame_times(driver, '[role="listbox"]'))
+    customer.send_keys(Keys.ESCAPE)
+
+    add_detail = driver.find_element(By.XPATH, "//p[text()='Detalles de la Venta']/following-sibling::*//button")
+    add_detail.click()
+    product = driver.find_element(By.XPATH, "//input[@aria-label='Producto']")
+    product.click()
+    result["product_key_ms"] = statistics.median(keystroke_latencies(driver, product, PRODUCT_QUERY))
+    result.update({k: v for k, v in cdp_metrics(driver).items() if k in ("heap_mb", "nodes")})
+    return result
+
+
+def measure(driver, iterations):
+    pages = {"/": measure_pos, **{path: lambda d, p=path, r=ready: measure_list(d, p, r) for path, ready in LIST_PAGES.items()}}
+    results = {}
+    for path, fn in pages.items():
+        samples = [fn(driver) for _ in range(iterations)]
+        keys = {k for sample in samples for k in sample}
+        results[path] = {k: statistics.median(s[k] for s in samples if k in s) for k in keys}
+        print(f"  {path}: " + ", ".join(f"{k}={results[path][k]:.1f}" for k in METRICS if k in results[path]))
+    return results
+
+
+async def seed_api(size, manifest):
+    data = plan(seed=size, preset={"products": size, "customers": size, "sales": 0, "expenses": 0, "months": 1})
+    # Los pedidos fijos no cambian lo que se mide y multiplicarían los pedidos por seis.
+    data["standing-orders"] = []
+    async with AsyncClient(size=32, timeout=60) as client:
+        seeder = Seeder(client, await login(client), manifest, concurrency=32)
+        return await seeder.run(data)
+
+
+async def teardown_api(created, manifest):
+    async with AsyncClient(size=32, timeout=60) as client:
+        seeder = Seeder(client, await login(client), manifest, concurrency=32)
+        await seeder.teardown(created)
+
+
+def run_size(size, args):
+    if args.mock:
+        api = urlsplit(API_URL)
+        backend = MockBackend(
+            api.hostname,
+            api.port or 80,
+            size={"products": size, "customers": size, "sales": 200, "expenses": 200},
+            prefix=api.path.rstrip("/"),
+        )
+        backend.start()
+        # Cada backend simulado nuevo emite tokens nuevos.
+        clear_sessions()
+    else:
+        manifest = os.path.join(args.out, f".seed-{size}.json")
+        created = asyncio.run(seed_api(size, manifest))
+
+    driver = create_driver()
+    try:
+        start_session(driver, "/dashboard")
+        install_observers(driver)
+        return measure(driver, args.iterations)
+    finally:
+        driver.quit()
+        if args.mock:
+            backend.stop()
+        else:
+            asyncio.run(teardown_api(created, manifest))
+            os.remove(manifest)
+
+
+def write_outputs(results, out):
+    rows = [
+        {"rows": size, "page": page, **metrics}
+        for size, pages in results.items()
+        for page, metrics in pages.items()
+    ]
+    with open(os.path.join(out, "scaling.json"), "w") as f:
+        json.dump(rows, f, indent=2)
+    with open(os.path.join(out, "scaling.csv"), "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["rows", "page", *METRICS, "frame_p50", "frame_max"], extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+
+    try:
+        import matplotlib
+
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print("matplotlib no está instalado: quedan scaling.csv y scaling.json para graficar.")
+        return
+
+    pages = sorted({row["page"] for row in rows})
+    plotted = [m for m in METRICS if any(m in row for row in rows)]
+    fig, axes = plt.subplots(len(plotted), 1, figsize=(8, 3 * len(plotted)))
+    for ax, metric in zip(axes, plotted):
+        for page in pages:
+            points = [(row["rows"], row[metric]) for row in rows if row["page"] == page and metric in row]
+            if points:
+                ax.plot(*zip(*points), marker="o", label=page)
+        ax.set_xscale("log")
+        ax.set_xlabel("filas")
+        ax.set_ylabel(metric)
+        ax.legend(fontsize="small")
+    fig.tight_layout()
+    fig.savefig(os.path.join(out, "scaling.png"))
+    print(f"Gráfico en {os.path.join(out, 'scaling.png')}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)), help="Cantidades de productos y clientes.")
+    parser.add_argument("-n", "--iterations", type=int, default=3)
+    parser.add_argument("--mock", action="store_true", help="Levantar el backend simulado en NEXT_PUBLIC_API_URL.")
+    parser.add_argument("--out", default="scaling", help="Directorio de resultados.")
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.out, exist_ok=True)
+    results = {}
+    for size in map(int, args.sizes.split(",")):
+        print(f"{size} productos y clientes")
+        results[size] = run_size(size, args)
+    write_outputs(results, args.out)
+
+
+if __name__ == "__main__":
+    main()
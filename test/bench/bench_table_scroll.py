@@ -0,0 +1,183 @@
+"""Mide el scroll y los nodos del DOM de las tablas del dashboard con páginas de 10k filas.
+
+Uso: python test/bench/bench_table_scroll.py [--rows 12000] [--rows-per-page 10000]
+                                             [--pages /dashboard/products,...] [--frames 120]
+                                             [--step 400] [-n 3] [--report archivo.json]
+
+Levanta el backend simulado en NEXT_PUBLIC_API_URL con ``--rows`` productos,
+clientes, ventas, gastos y devoluciones. En cada listado elige
+``--rows-per-page`` en "Filas por página" y, con la página cargada, informa:
+
+- las filas de la página y las que quedaron montadas en el DOM (con la tabla
+  virtualizada, sólo las visibles más el margen);
+- los nodos del documento según CDP;
+- la duración de los frames al desplazar la tabla ``--step`` píxeles por
+  frame durante ``--frames`` frames, y las filas montadas al terminar.
+
+Con ``--rows-per-page 50`` (o menos) la tabla se pinta entera, como antes,
+y sirve de comparación. Las corridas quedan en la base de ``support.results``
+con el origen "tables".
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from support.backend import MockBackend
+from support.config import API_URL
+from support.driver import create_driver
+from support.perf import cdp_metrics, scroll_frame_times
+from support.results import DEFAULT_DB, record_results
+from support.session import clear_sessions, start_session
+from support.waits import wait_for, wait_for_option, wait_for_table_rows
+
+# Ruta, aria-label de la tabla y sustantivo del "Mostrando X de Y ...".
+PAGES = {
+    "/dashboard/products": ("Productos", "productos"),
+    "/dashboard/customers": ("Clientes", "clientes"),
+    "/dashboard/sales": ("Ventas", "ventas"),
+    "/dashboard/expenses": ("Gastos", "gastos"),
+    "/dashboard/returns": ("Devoluciones", "devoluciones"),
+}
+
+_ROWS_PER_PAGE_TRIGGER = """
+return [...document.querySelectorAll('button[data-slot="trigger"]')]
+  .find((b) => /^\\d+ filas$/.test(b.textContent.trim())) || null;
+"""
+
+_SHOWING = """
+const p = [...document.querySelectorAll("p")].find((el) => el.textContent.trim().endsWith(` ${args.noun}`));
+const match = p && p.textContent.match(/Mostrando (\\d+) de/);
+return match && Number(match[1]) === args.rows ? Number(match[1]) : null;
+"""
+
+_MOUNTED_ROWS = """
+return document.querySelectorAll(`table[aria-label="${arguments[0]}"] tbody tr[data-key]`).length;
+"""
+
+# Cada fila montada conserva sus acciones (los locators buscan por aria-label).
+_ROWS_WITHOUT_ACTIONS = """
+const rows = document.querySelectorAll(`table[aria-label="${arguments[0]}"] tbody tr[data-key]`);
+return [...rows].filter((row) => !row.querySelector("button")).length;
+"""
+
+
+def add_returns(store, count, seed=0):
+    """``count`` devoluciones de una unidad sobre ventas con cliente elegidas al azar."""
+    rng = random.Random(seed)
+    user = next(iter(store.tables["users"].values()))
+    sales = [s for s in store.tables["sales"].values() if s["customer"] and s["sale_details"]]
+    for _ in range(count):
+        sale = rng.choice(sales)
+        store.insert("returns", store.prepare("returns", {
+            "sale": sale["id"],
+            "date": sale["date"],
+            "return_details": [{"product": sale["sale_details"][0]["product"], "quantity": 1}],
+        }, user=user))
+
+
+def choose_rows_per_page(driver, rows_per_page):
+    wait_for(driver, _ROWS_PER_PAGE_TRIGGER, message="No está el selector de filas por página.").click()
+    wait_for_option(driver, f"{rows_per_page} filas").click()
+
+
+def measure_page(driver, path, args):
+    table_label, noun = PAGES[path]
+    start_session(driver, path)
+    wait_for_table_rows(driver, table_label=table_label, timeout=60)
+    choose_rows_per_page(driver, args.rows_per_page)
+    shown = wait_for(
+        driver,
+        _SHOWING,
+        args={"noun": noun, "rows": args.rows_per_page},
+        timeout=300,
+        message=f"La tabla {table_label} no mostró {args.rows_per_page} filas.",
+    )
+    wait_for_table_rows(driver, table_label=table_label, timeout=60)
+
+    result = {
+        "rows": shown,
+        "rows_mounted": driver.execute_script(_MOUNTED_ROWS, table_label),
+        "nodes": cdp_metrics(driver)["nodes"],
+    }
+    result.update(scroll_frame_times(driver, f'table[aria-label="{table_label}"]', args.frames, args.step))
+    result["rows_mounted_after_scroll"] = driver.execute_script(_MOUNTED_ROWS, table_label)
+    result["rows_without_actions"] = driver.execute_script(_ROWS_WITHOUT_ACTIONS, table_label)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=12000, help="Filas de cada recurso en el backend simulado.")
+    parser.add_argument("--rows-per-page", type=int, default=10000, help="Opción a elegir en \"Filas por página\".")
+    parser.add_argument("--pages", default=",".join(PAGES), help="Listados a medir, separados por coma.")
+    parser.add_argument("--frames", type=int, default=120, help="Frames de scroll a medir.")
+    parser.add_argument("--step", type=int, default=400, help="Píxeles desplazados por frame.")
+    parser.add_argument("-n", "--iterations", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--report", help="Guardar los resultados en JSON.")
+    parser.add_argument("--results", default=DEFAULT_DB, metavar="DB", help="Base SQLite de resultados (ver perf_history.py).")
+    parser.add_argument("--no-results", action="store_true", help="No guardar las corridas en la base de resultados.")
+    args = parser.parse_args(argv)
+
+    # Las ventas canceladas no salen en el listado por defecto: se cargan de más.
+    size = {"products": args.rows, "customers": args.rows, "sales": args.rows * 6 // 5, "expenses": args.rows}
+    api = urlsplit(API_URL)
+    backend = MockBackend(api.hostname, api.port or 80, seed=args.seed, size=size, prefix=api.path.rstrip("/"))
+    add_returns(backend.store, args.rows, args.seed)
+    backend.start()
+    # Cada backend simulado nuevo emite tokens nuevos.
+    clear_sessions()
+
+    paths = args.pages.split(",")
+    runs = {path: [] for path in paths}
+    driver = create_driver()
+    try:
+        driver.execute_cdp_cmd("Performance.enable", {})
+        for _ in range(args.iterations):
+            for path in paths:
+                runs[path].append(measure_page(driver, path, args))
+    finally:
+        driver.quit()
+        backend.stop()
+
+    print(f"{args.rows_per_page} filas por página; scroll de {args.frames} frames a {args.step} px por frame")
+    print(f"{'Listado':<24}{'Filas':>8}{'Montadas':>10}{'Nodos':>9}{'p50':>8}{'p95':>8}{'Máx':>8}{'Lentos':>8}")
+    for path, samples in runs.items():
+        rows = samples[0]["rows"]
+        mounted = max(max(s["rows_mounted"], s["rows_mounted_after_scroll"]) for s in samples)
+        nodes = statistics.median(s["nodes"] for s in samples)
+        p50 = statistics.median(s.get("frame_p50", 0) for s in samples)
+        p95 = statistics.median(s.get("frame_p95", 0) for s in samples)
+        worst = max(s.get("frame_max", 0) for s in samples)
+        janky = statistics.median(s.get("janky_frames", 0) for s in samples)
+        print(
+            f"{path:<24}{rows:>8}{mounted:>10}{nodes:>9.0f}{p50:>6.1f}ms{p95:>6.1f}ms"
+            f"{worst:>6.0f}ms{janky:>8.0f}"
+        )
+    print("Montadas: máximo de filas en el DOM antes y después del scroll; Lentos: frames de más de 50 ms.")
+    without_actions = sum(s["rows_without_actions"] for samples in runs.values() for s in samples)
+    if without_actions:
+        print(f"Atención: {without_actions} filas montadas sin botones de acción.")
+
+    if not args.no_results:
+        rows = [
+            (f"table{path[len('/dashboard'):]}", str(args.rows_per_page), metric, value)
+            for path, samples in runs.items()
+            for sample in samples
+            for metric, value in sample.items()
+        ]
+        record_results("tables", rows, args.results)
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump({"rows": args.rows, "rows_per_page": args.rows_per_page, "runs": runs}, f, indent=2)
+    return 1 if without_actions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
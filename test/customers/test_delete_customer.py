@@ -1,71 +1,49 @@
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import time
-
-options = Options()
-options.add_argument('--start-maximized')
-
-driver = webdriver.Chrome(options=options)
-
-try:
-    driver.get("http://localhost:3000/auth/login")
-    wait = WebDriverWait(driver, 10)
-
-    # Inicio de sesión
-    username_field = wait.until(
-        EC.presence_of_element_located(
-            (By.XPATH, "//input[@placeholder='Nombre de usuario']")
-        )
-    )
-    username_field.send_keys("lucasleone03")
-
-    password_field = driver.find_element(By.XPATH, "//input[@placeholder='********']")
-    password_field.send_keys("admin12345")
-
-    login_button = driver.find_element(By.XPATH, "//button[@type='submit']")
-    login_button.click()
-
-    wait.until(EC.url_contains("/dashboard"))
-    print("¡Inicio de sesión exitoso!")
+import os
+import sys
 
-    # Navegar a Clientes
-    clientes_link = wait.until(EC.element_to_be_clickable((By.LINK_TEXT, "Clientes")))
-    clientes_link.click()
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-    wait.until(EC.url_contains("/dashboard/customers"))
-    print("Navegado a la página de Clientes.")
-
-    # Esperar a que la tabla esté presente
-    wait.until(EC.presence_of_element_located((By.XPATH, "//table")))
-
-    # Eliminar el primer cliente
-    first_delete_button = wait.until(
-        EC.element_to_be_clickable(
-            (By.XPATH, "(//button[contains(@aria-label, 'Eliminar cliente')])[1]")
-        )
-    )
-    first_delete_button.click()
-    print("Hiciste clic en el botón de eliminar del primer cliente.")
-
-    # Confirmar eliminación
-    confirm_delete_button = wait.until(
-        EC.element_to_be_clickable(
-            (By.XPATH, "//button[contains(text(), 'Eliminar')]")
-        )
-    )
-    confirm_delete_button.click()
-    print("Confirmaste la eliminación en el modal.")
-
-    # Esperar a que el botón se vuelva obsoleto
-    wait.until(EC.staleness_of(first_delete_button))
-    print("Cliente eliminado exitosamente.")
-
-
-except Exception as e:
-    print("Ocurrió un error:", e)
+from selenium.webdriver.common.by import By
 
-finally:
-    driver.quit()
+from support.fixtures import customer_record, fetch
+from support.flow import run_script
+from support.forms import fill_form, wait_for_field
+from support.netwaits import watch_network
+from support.profiler import step
+from support.session import start_session
+from support.waits import wait_for_button, wait_for_modal_open
+
+
+def run(driver, data):
+    # El cliente a borrar se crea por la API; el flujo no depende de la primera fila.
+    with customer_record(data) as customer:
+        step("Abrir listado")
+        start_session(driver, "/dashboard/customers")
+        print("Navegado a la página de Clientes.")
+
+        network = watch_network(driver)
+
+        step("Buscar cliente")
+        wait_for_field(driver, "Buscar clientes")
+        fill_form(driver, {"Buscar clientes": customer["name"]})
+
+        step("Eliminar")
+        delete_button = wait_for_button(driver, f"Eliminar cliente {customer['name']}")
+        delete_button.click()
+        print(f"Hiciste clic en el botón de eliminar de {customer['name']}.")
+
+        step("Confirmar")
+        # Confirmar eliminación
+        modal = wait_for_modal_open(driver)
+        confirm_delete_button = modal.find_element(By.XPATH, ".//button[contains(text(), 'Eliminar')]")
+        with network.expect_response("DELETE", f"/customers/{customer['id']}/", status=204) as saved:
+            confirm_delete_button.click()
+        network.wait_for_response("GET", "/customers/", after=saved["response"])
+        print("Confirmaste la eliminación en el modal.")
+        if fetch("customers", customer) is not None:
+            raise AssertionError("El cliente sigue existiendo en la API.")
+        print("Cliente eliminado exitosamente.")
+
+
+if __name__ == "__main__":
+    run_script(run)
@@ -1,91 +1,51 @@
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.keys import Keys
-import time
-import json
-import urllib.parse
-
-options = Options()
-options.add_argument('--start-maximized')
-
-driver = webdriver.Chrome(options=options)
-
-try:
-    driver.get("http://localhost:3000/auth/login")
-
-    wait = WebDriverWait(driver, 10)
-    username_field = wait.until(EC.presence_of_element_located((By.XPATH, "//input[@placeholder='Nombre de usuario']")))
-    username_field.send_keys("lucasleone03")
-
-    password_field = driver.find_element(By.XPATH, "//input[@placeholder='********']")
-    password_field.send_keys("admin12345")
-
-    login_button = driver.find_element(By.XPATH, "//button[@type='submit']")
-    login_button.click()
-
-    wait.until(EC.url_contains("/dashboard"))
+import os
+import sys
 
-    current_url = driver.current_url
-    print("URL actual después del inicio de sesión:", current_url)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-    if "/dashboard" in current_url:
-        print("¡Inicio de sesión exitoso!")
-    else:
-        print("Error en el inicio de sesión.")
-        driver.quit()
-        exit()
-
-    expenses_link = wait.until(EC.element_to_be_clickable((By.LINK_TEXT, "Gastos")))
-    expenses_link.click()
-
-    wait.until(EC.url_contains("/dashboard/expenses"))
-
-    print("Navegado a la página de Gastos.")
-
-    new_expense_button = wait.until(EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Nuevo Gasto')]")))
-    new_expense_button.click()
-
-    wait.until(EC.url_contains("/dashboard/expenses/create"))
-
-    print("Navegado a la página de Crear Gasto.")
+from selenium.webdriver.common.by import By
 
-    amount_field = wait.until(EC.presence_of_element_located((By.XPATH, "//input[@aria-label='Monto del Gasto']")))
-    amount_field.send_keys("1000.50")
+from support.fixtures import created_by_ui
+from support.flow import run_script
+from support.forms import fill_form, wait_for_field
+from support.netwaits import watch_network
+from support.profiler import step
+from support.session import start_session
+from support.waits import select_autocomplete
 
-    date_field = driver.find_element(By.XPATH, "//input[@aria-label='Fecha del Gasto']")
 
-    description_field = driver.find_element(By.XPATH, "//textarea[@aria-label='Descripción del Gasto']")
-    description_field.send_keys("Compra de insumos de prueba")
+def run(driver, data):
+    description = data.name("Compra de insumos de prueba")
+    # Lo que crea el formulario se busca por nombre y se borra al terminar.
+    with created_by_ui("expenses", description, field="description"):
+        step("Abrir formulario")
+        start_session(driver, "/dashboard/expenses/create")
+        print("Navegado a la página de Crear Gasto.")
 
-    category_name = "Negocio"
-    category_input = driver.find_element(By.XPATH, "//input[@aria-label='Categoría del Gasto']")
-    category_input.click()
-    category_input.send_keys(category_name)
+        network = watch_network(driver)
 
-    category_input.send_keys(Keys.DOWN)
-    category_input.send_keys(Keys.ENTER)
+        step("Completar campos")
+        wait_for_field(driver, "Monto del Gasto")
+        fill_form(driver, {
+            "Monto del Gasto": "1000.50",
+            "Descripción del Gasto": description,
+        })
 
-    supplier_name = "YPF"
-    supplier_input = driver.find_element(By.XPATH, "//input[@aria-label='Proveedor del Gasto']")
-    supplier_input.click()
-    supplier_input.send_keys(supplier_name)
+        step("Elegir categoría y proveedor")
+        select_autocomplete(driver, "Categoría del Gasto", "Negocio")
 
-    supplier_input.send_keys(Keys.DOWN)
-    supplier_input.send_keys(Keys.ENTER)
+        select_autocomplete(driver, "Proveedor del Gasto", "YPF")
 
-    create_button = driver.find_element(By.XPATH, "//button[contains(., 'Crear Gasto')]")
-    create_button.click()
+        step("Guardar")
+        create_button = driver.find_element(By.XPATH, "//button[contains(., 'Crear Gasto')]")
+        with network.expect_response("POST", "/expenses/", status=201) as saved:
+            create_button.click()
 
-    wait.until(EC.url_contains("/dashboard/expenses"))
+        # La lista a la que vuelve la página después de guardar.
+        network.wait_for_response("GET", "/expenses/", after=saved["response"])
 
-    print("Gasto creado exitosamente.")
+        print("Gasto creado exitosamente.")
 
-except Exception as e:
-    print("Ocurrió un error:", e)
 
-finally:
-    driver.quit()
+if __name__ == "__main__":
+    run_script(run)
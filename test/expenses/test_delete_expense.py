@@ -1,65 +1,47 @@
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.keys import Keys
-import time
-
-options = Options()
-options.add_argument("--start-maximized")
+import os
+import sys
 
-driver = webdriver.Chrome(options=options)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-try:
-    driver.get("http://localhost:3000/auth/login")
-
-    wait = WebDriverWait(driver, 10)
-    username_field = wait.until(
-        EC.presence_of_element_located(
-            (By.XPATH, "//input[@placeholder='Nombre de usuario']")
-        )
-    )
-    username_field.send_keys("lucasleone03")
+from selenium.webdriver.common.by import By
 
-    password_field = driver.find_element(By.XPATH, "//input[@placeholder='********']")
-    password_field.send_keys("admin12345")
+from support.fixtures import expense_record, fetch
+from support.flow import run_script
+from support.forms import fill_form, wait_for_field
+from support.netwaits import watch_network
+from support.profiler import step
+from support.session import start_session
+from support.waits import wait_for_button, wait_for_modal_open
 
-    login_button = driver.find_element(By.XPATH, "//button[@type='submit']")
-    login_button.click()
 
-    wait.until(EC.url_contains("/dashboard"))
-    print("¡Inicio de sesión exitoso!")
+def run(driver, data):
+    with expense_record(data) as expense:
+        step("Abrir listado")
+        start_session(driver, "/dashboard/expenses")
+        print("Navegado a la página de Gastos.")
 
-    expenses_link = wait.until(EC.element_to_be_clickable((By.LINK_TEXT, "Gastos")))
-    expenses_link.click()
+        network = watch_network(driver)
 
-    wait.until(EC.url_contains("/dashboard/expenses"))
-    print("Navegado a la página de Gastos.")
+        step("Buscar gasto")
+        wait_for_field(driver, "Buscar gastos")
+        fill_form(driver, {"Buscar gastos": expense["description"]})
+        step("Eliminar")
+        delete_button = wait_for_button(driver, f"Eliminar gasto {expense['description']}")
+        delete_button.click()
 
-    wait.until(EC.presence_of_element_located((By.XPATH, "//table")))
-    first_delete_button = wait.until(
-        EC.element_to_be_clickable(
-            (By.XPATH, "(//button[contains(@aria-label, 'Eliminar gasto')])[1]")
-        )
-    )
-    first_delete_button.click()
+        step("Confirmar")
+        confirm_modal = wait_for_modal_open(driver)
 
-    confirm_modal = wait.until(
-        EC.visibility_of_element_located(
-            (By.XPATH, "(//button[contains(@aria-label, 'Confirmar eliminar gasto')])")
+        confirm_delete_button = confirm_modal.find_element(
+            By.XPATH, ".//button[contains(@aria-label, 'Confirmar eliminar gasto')]"
         )
-    )
-
-    confirm_delete_button = confirm_modal.find_element(
-        By.XPATH, "//button[contains(., 'Eliminar')]"
-    )
-    confirm_delete_button.click()
-
-    print("Gasto eliminado exitosamente.")
+        with network.expect_response("DELETE", f"/expenses/{expense['id']}/", status=204) as saved:
+            confirm_delete_button.click()
+        network.wait_for_response("GET", "/expenses/", after=saved["response"])
+        if fetch("expenses", expense) is not None:
+            raise AssertionError("El gasto sigue existiendo en la API.")
+        print("Gasto eliminado exitosamente.")
 
-except Exception as e:
-    print("Ocurrió un error:", e)
 
-finally:
-    driver.quit()
+if __name__ == "__main__":
+    run_script(run)
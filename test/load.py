@@ -0,0 +1,58 @@
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from support.config import API_URL
+from support.load import DEFAULT_MIX, MUTATING, parse_mix, print_load_report, run_load
+from support.results import DEFAULT_DB, load_rows, record_results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Genera contra la API el tráfico que produce el frontend, sin navegador.")
+    parser.add_argument("--base-url", default=API_URL, help="URL de la API (backend simulado o staging).")
+    parser.add_argument("-u", "--users", type=int, default=10, help="Usuarios virtuales concurrentes.")
+    parser.add_argument("-d", "--duration", type=float, default=60, help="Duración en segundos.")
+    parser.add_argument("--ramp-up", type=float, default=0, help="Segundos para escalonar el arranque de los usuarios.")
+    parser.add_argument("--think", type=float, default=1.0, help="Pausa media entre acciones, en segundos.")
+    parser.add_argument("--connections", type=int, help="Conexiones del pool (por defecto, una por usuario).")
+    parser.add_argument(
+        "--mix",
+        help=f"Pesos de los escenarios, por ejemplo 'pos_sale=30,statistics=0'. Escenarios: {', '.join(DEFAULT_MIX)}.",
+    )
+    parser.add_argument("--read-only", action="store_true", help="No generar ventas ni marcar cobros o entregas.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--report", help="Guardar el reporte en JSON.")
+    parser.add_argument("--results", default=DEFAULT_DB, metavar="DB", help="Base SQLite de resultados (ver perf_history.py).")
+    parser.add_argument("--no-results", action="store_true", help="No guardar la corrida en la base de resultados.")
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix)
+    if args.read_only:
+        for name in MUTATING:
+            mix[name] = 0
+
+    report = asyncio.run(run_load(
+        base_url=args.base_url,
+        users=args.users,
+        duration=args.duration,
+        think=args.think,
+        mix=mix,
+        seed=args.seed,
+        connections=args.connections,
+        ramp_up=args.ramp_up,
+    ))
+    print_load_report(report)
+    if not args.no_results:
+        record_results("load", load_rows(report), args.results)
+
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import argparse
+import datetime
+import json
+import os
+import sys
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from support.backend import MockBackend
+from support.config import API_URL
+
+
+def parse_latency(spec):
+    # "/products/=150" o "/sales/statistics/=300+200" (base + jitter en ms)
+    path, value = spec.rsplit("=", 1)
+    latency, _, jitter = value.partition("+")
+    return {"path": path, "latency_ms": float(latency), "jitter_ms": float(jitter or 0)}
+
+
+def parse_error(spec):
+    # "/sales/=0.1" o "/sales/=0.1:503" (proporción de pedidos y status)
+    path, value = spec.rsplit("=", 1)
+    rate, _, status = value.partition(":")
+    return {"path": path, "error_rate": float(rate), "error_status": int(status or 500)}
+
+
+def main():
+    api = urlsplit(API_URL)
+    parser = argparse.ArgumentParser(description="Backend REST simulado para correr la app sin Django.")
+    parser.add_argument("--host", default=api.hostname or "127.0.0.1")
+    parser.add_argument("--port", type=int, default=api.port or 8000)
+    parser.add_argument("--prefix", default=api.path, help="Prefijo de las rutas, por defecto el de NEXT_PUBLIC_API_URL.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--size", default="small", choices=["empty", "small"])
+    parser.add_argument("--now", help="Fecha y hora de referencia (ISO) para datos reproducibles.")
+    parser.add_argument("--fixtures", help="JSON con registros a cargar además de los generados.")
+    parser.add_argument("--config", help="JSON con reglas de latencia y errores ({\"rules\": [...]}).")
+    parser.add_argument("--latency", action="append", default=[], metavar="RUTA=MS[+JITTER]")
+    parser.add_argument("--error", action="append", default=[], metavar="RUTA=PROPORCION[:STATUS]")
+    parser.add_argument("--default-limit", type=int, help="Límite cuando el pedido no manda ?limit=.")
+    args = parser.parse_args()
+
+    rules = [parse_latency(spec) for spec in args.latency] + [parse_error(spec) for spec in args.error]
+    if args.config:
+        with open(args.config) as f:
+            rules += json.load(f).get("rules", [])
+    fixtures = None
+    if args.fixtures:
+        with open(args.fixtures) as f:
+            fixtures = json.load(f)
+
+    backend = MockBackend(
+        host=args.host,
+        port=args.port,
+        seed=args.seed,
+        size=args.size,
+        fixtures=fixtures,
+        rules=rules,
+        prefix=args.prefix,
+        default_limit=args.default_limit,
+        now=datetime.datetime.fromisoformat(args.now) if args.now else None,
+    )
+    print(f"Backend simulado escuchando en {backend.url}")
+    try:
+        backend.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        backend.server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Compara los resultados de rendimiento guardados entre commits.
+
+Uso: python test/perf_history.py compare [HEAD] [--base REF | --rolling N] [--alpha 0.05] [--threshold 0.1]
+     python test/perf_history.py trend FLUJO [--step PASO] [--metric duration]
+     python test/perf_history.py runs
+
+Los resultados los guardan run.py (con --profile o --network), bench_pages.py
+y load.py en la base SQLite de ``support.results``. ``compare`` termina con
+código 1 si algún flujo o paso empeoró de forma significativa.
+"""
+import argparse
+import datetime
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from support.results import DEFAULT_DB, ResultsStore, ancestors, compare_samples, environment, resolve_commit
+
+BAR_WIDTH = 40
+
+
+def describe(row):
+    step = f" › {row['step']}" if row["step"] else ""
+    return f"{row['flow']}{step} [{row['metric']}]"
+
+
+def cmd_compare(store, args):
+    env = args.env or environment()
+    head = resolve_commit(args.head)
+    if args.base:
+        base_commits = [resolve_commit(args.base)]
+    else:
+        # Los últimos N commits anteriores que tienen corridas en este entorno.
+        candidates = ancestors(head, args.search)
+        base_commits = store.commits_with_data(candidates, env)[:args.rolling]
+    if not base_commits:
+        print(f"No hay corridas de referencia en el entorno {env}.")
+        return 0
+
+    base = store.samples(base_commits, env)
+    current = store.samples([head], env, include_dirty=args.include_dirty)
+    if args.filter:
+        base = {key: values for key, values in base.items() if args.filter in key[0]}
+        current = {key: values for key, values in current.items() if args.filter in key[0]}
+    if not current:
+        matching = f" de flujos con '{args.filter}'" if args.filter else ""
+        print(f"No hay corridas{matching} de {head[:10]} en el entorno {env}.")
+        return 0
+
+    rows = compare_samples(base, current, alpha=args.alpha, threshold=args.threshold, min_runs=args.min_runs)
+    regressions = [row for row in rows if row["status"] == "regresión"]
+    improvements = [row for row in rows if row["status"] == "mejora"]
+    insufficient = [row for row in rows if row["status"] == "insuficiente"]
+
+    label = base_commits[0][:10] if args.base else f"{len(base_commits)} commits anteriores"
+    print(f"{head[:10]} contra {label} ({env})")
+    print(f"{len(rows)} métricas comparadas: {len(regressions)} regresiones, {len(improvements)} mejoras, "
+          f"{len(insufficient)} sin corridas suficientes (mínimo {args.min_runs} por lado)")
+
+    shown = rows if args.all else regressions + improvements
+    if shown:
+        print()
+        print(f"{'Flujo / paso / métrica':<70}{'antes':>11}{'ahora':>11}{'cambio':>9}{'p':>8}  Estado")
+        for row in shown:
+            p = f"{row['p']:.3f}" if "p" in row else "-"
+            print(
+                f"{describe(row)[:70]:<70}{row['base']:>11.3f}{row['head']:>11.3f}"
+                f"{row['change']:>+8.0%}{p:>8}  {row['status']}"
+            )
+    return 1 if regressions else 0
+
+
+def cmd_trend(store, args):
+    env = args.env or environment()
+    points = store.trend(args.flow, args.step, args.metric, env, args.limit)
+    if not points:
+        print(f"No hay valores de {args.flow} [{args.metric}] en el entorno {env}.")
+        return 0
+    top = max(point["median"] for point in points) or 1
+    print(f"{args.flow}{' › ' + args.step if args.step else ''} [{args.metric}] en {env}")
+    for point in points:
+        day = datetime.datetime.fromtimestamp(point["created"]).strftime("%Y-%m-%d %H:%M")
+        bar = "█" * max(1, round(point["median"] / top * BAR_WIDTH))
+        print(f"{point['commit'][:10]}  {day}  {point['median']:>10.3f}  ({point['runs']:>2})  {bar}")
+    return 0
+
+
+def cmd_runs(store, args):
+    print(f"{'Id':>5}  {'Commit':<12}{'Origen':<8}{'Métricas':>9}  {'Fecha':<17} Entorno")
+    for run_id, commit, dirty, env, source, created, count in store.runs(args.limit):
+        day = datetime.datetime.fromtimestamp(created).strftime("%Y-%m-%d %H:%M")
+        mark = "*" if dirty else " "
+        print(f"{run_id:>5}  {commit[:10]}{mark} {source:<8}{count:>9}  {day:<17} {env}")
+    print("\n* corrida con cambios sin commitear")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", default=DEFAULT_DB, help="Base SQLite de resultados.")
+    parser.add_argument("--env", help="Entorno a comparar (por defecto, el de esta máquina).")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    compare = commands.add_parser("compare", help="Compara un commit contra otro o contra los anteriores.")
+    compare.add_argument("head", nargs="?", default="HEAD")
+    base = compare.add_mutually_exclusive_group()
+    base.add_argument("--base", help="Commit de referencia.")
+    base.add_argument("--rolling", type=int, default=5, help="Commits anteriores con corridas que forman la referencia.")
+    compare.add_argument("--search", type=int, default=50, help="Cuántos commits hacia atrás buscar corridas.")
+    compare.add_argument("--alpha", type=float, default=0.05, help="Nivel de significación de la prueba de Mann-Whitney.")
+    compare.add_argument("--threshold", type=float, default=0.1, help="Empeoramiento relativo mínimo de la mediana (0.1 = 10%%).")
+    compare.add_argument("--min-runs", type=int, default=3, help="Valores mínimos por lado para probar.")
+    compare.add_argument("--include-dirty", action="store_true", help="Contar las corridas de HEAD con cambios sin commitear.")
+    compare.add_argument("-k", "--filter", help="Solo los flujos cuyo nombre contiene este texto.")
+    compare.add_argument("--all", action="store_true", help="Mostrar también las métricas sin cambios.")
+
+    trend = commands.add_parser("trend", help="Mediana por commit de una métrica.")
+    trend.add_argument("flow", help="Flujo, ruta de bench_pages o 'api' para load.py.")
+    trend.add_argument("--step", default="", help="Paso del flujo, modo (cold/warm) o endpoint.")
+    trend.add_argument("--metric", default="duration")
+    trend.add_argument("--limit", type=int, default=30)
+
+    runs = commands.add_parser("runs", help="Últimas corridas guardadas.")
+    runs.add_argument("--limit", type=int, default=20)
+
+    args = parser.parse_args()
+    with ResultsStore(args.db) as store:
+        handler = {"compare": cmd_compare, "trend": cmd_trend, "runs": cmd_runs}[args.command]
+        return handler(store, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
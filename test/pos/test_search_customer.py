@@ -0,0 +1,37 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium.webdriver.common.by import By
+
+from support.fixtures import customer_record
+from support.flow import run_script
+from support.profiler import step
+from support.session import start_session
+from support.soak import POS_READY
+from support.waits import wait_for, wait_for_option
+
+
+def run(driver, data):
+    # El backend también busca por email; el selector muestra sólo el nombre.
+    with customer_record(data) as customer:
+        step("Abrir POS")
+        start_session(driver, "/", role="SELLER")
+        wait_for(driver, POS_READY, timeout=30, message="El POS no terminó de cargar.")
+        print("Navegado al POS.")
+
+        step("Buscar cliente por email")
+        # Parte del email que no está en el nombre, con mayúsculas: los
+        # resultados del backend no se pueden volver a filtrar por la etiqueta.
+        tag = customer["email"].split("+", 1)[1].split("@", 1)[0]
+        query = f"Aperez+{tag.upper()}"
+        field = driver.find_element(By.XPATH, "//input[@placeholder='Cliente']")
+        field.click()
+        field.send_keys(query)
+        wait_for_option(driver, customer["name"], timeout=15).click()
+        print(f"Cliente '{customer['name']}' encontrado buscando '{query}'.")
+
+
+if __name__ == "__main__":
+    run_script(run)
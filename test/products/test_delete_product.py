@@ -1,54 +1,43 @@
-from selenium import webdriver
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.keys import Keys
-import time
 
-options = Options()
-options.add_argument("--start-maximized")
-driver = webdriver.Chrome(options=options)
+from support.fixtures import fetch, product_record
+from support.flow import run_script
+from support.forms import fill_form, wait_for_field
+from support.netwaits import watch_network
+from support.profiler import step
+from support.session import start_session
+from support.waits import wait_for_button, wait_for_modal_open
+
 
-try:
-    driver.get("http://localhost:3000/auth/login")
-    wait = WebDriverWait(driver, 10)
-    username_field = wait.until(
-        EC.presence_of_element_located(
-            (By.XPATH, "//input[@placeholder='Nombre de usuario']")
-        )
-    )
-    username_field.send_keys("lucasleone03")
-    password_field = driver.find_element(By.XPATH, "//input[@placeholder='********']")
-    password_field.send_keys("admin12345")
-    login_button = driver.find_element(By.XPATH, "//button[@type='submit']")
-    login_button.click()
-    wait.until(EC.url_contains("/dashboard"))
-    print("¡Inicio de sesión exitoso!")
-    products_link = wait.until(EC.element_to_be_clickable((By.LINK_TEXT, "Productos")))
-    products_link.click()
-    wait.until(EC.url_contains("/dashboard/products"))
-    print("Navegado a la página de Productos.")
-    wait.until(EC.presence_of_element_located((By.XPATH, "//table")))
-    first_delete_button = wait.until(
-        EC.element_to_be_clickable(
-            (By.XPATH, "(//button[contains(@aria-label, 'Eliminar producto')])[1]")
-        )
-    )
-    first_delete_button.click()
-    print("Hiciste clic en el botón de eliminar del primer producto.")
-    confirm_delete_button = wait.until(
-        EC.element_to_be_clickable(
-            (By.XPATH, "//button[contains(text(), 'Eliminar')]")
-        )
-    )
-    confirm_delete_button.click()
-    print("Confirmaste la eliminación en el modal.")
-    wait.until(EC.staleness_of(first_delete_button))
-    print("Producto eliminado exitosamente.")
+def run(driver, data):
+    with product_record(data) as product:
+        step("Abrir listado")
+        start_session(driver, "/dashboard/products")
+        print("Navegado a la página de Productos.")
+        network = watch_network(driver)
+        step("Buscar producto")
+        wait_for_field(driver, "Buscar productos")
+        fill_form(driver, {"Buscar productos": product["name"]})
+        step("Eliminar")
+        delete_button = wait_for_button(driver, f"Eliminar producto {product['name']}")
+        delete_button.click()
+        print(f"Hiciste clic en el botón de eliminar de {product['name']}.")
+        step("Confirmar")
+        modal = wait_for_modal_open(driver)
+        confirm_delete_button = modal.find_element(By.XPATH, ".//button[contains(text(), 'Eliminar')]")
+        with network.expect_response("DELETE", f"/products/{product['slug']}/", status=204) as saved:
+            confirm_delete_button.click()
+        network.wait_for_response("GET", "/products/", after=saved["response"])
+        print("Confirmaste la eliminación en el modal.")
+        if fetch("products", product) is not None:
+            raise AssertionError("El producto sigue existiendo en la API.")
+        print("Producto eliminado exitosamente.")
 
-except Exception as e:
-    print("Ocurrió un error:", e)
 
-finally:
-    driver.quit()
+if __name__ == "__main__":
+    run_script(run)
@@ -0,0 +1,9 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from support.api_suite import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+"""Deja el POS en uso durante horas y falla si la memoria del navegador crece sin techo.
+
+Uso: python test/soak.py [-d 4h] [--interval 60] [--warmup 5m] [--limit heap_mb=5]
+                         [--samples muestras.jsonl] [--report soak.json] [--no-mock]
+
+Por defecto levanta el backend simulado en NEXT_PUBLIC_API_URL. El cajero
+agrega y quita detalles, cambia de cliente y crea ventas; cada ``--interval``
+segundos se fuerza un GC y se toman heap de JS, nodos DOM, listeners y nodos
+separados. Termina con código 1 si alguna métrica sube, pasado el
+calentamiento, más que su límite por hora y de forma sostenida.
+"""
+import argparse
+import json
+import os
+import sys
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from support.backend import MockBackend
+from support.config import API_URL
+from support.driver import create_driver
+from support.session import clear_sessions, start_session
+from support.soak import (
+    DEFAULT_LIMITS,
+    POS_READY,
+    analyze,
+    append_sample,
+    format_sample,
+    parse_duration,
+    parse_limits,
+    print_soak_report,
+    run_soak,
+)
+from support.waits import wait_for
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-d", "--duration", default="1h", help="Duración: 4h, 30m, 90s o segundos.")
+    parser.add_argument("--interval", default="60s", help="Intervalo entre muestras de memoria.")
+    parser.add_argument("--warmup", default="5m", help="Tiempo inicial que no entra en las pendientes.")
+    parser.add_argument(
+        "--limit",
+        action="append",
+        default=[],
+        metavar="METRICA=POR_HORA",
+        help=f"Crecimiento tolerado por hora. Métricas: {', '.join(DEFAULT_LIMITS)}.",
+    )
+    parser.add_argument("--role", default="SELLER", help="Rol con el que se abre el POS.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-mock", action="store_true", help="Usar el backend que ya corre en NEXT_PUBLIC_API_URL.")
+    parser.add_argument("--samples", help="Agregar cada muestra a este archivo JSONL mientras corre.")
+    parser.add_argument("--report", help="Guardar el reporte en JSON.")
+    args = parser.parse_args()
+
+    limits = parse_limits(args.limit)
+    warmup = parse_duration(args.warmup)
+
+    backend = None
+    if not args.no_mock:
+        api = urlsplit(API_URL)
+        backend = MockBackend(api.hostname, api.port or 80, prefix=api.path.rstrip("/"))
+        backend.start()
+        # Cada backend simulado nuevo emite tokens nuevos.
+        clear_sessions()
+
+    def on_sample(sample):
+        print(format_sample(sample), flush=True)
+        if args.samples:
+            append_sample(args.samples, sample)
+
+    driver = create_driver()
+    try:
+        start_session(driver, "/", role=args.role)
+        wait_for(driver, POS_READY, timeout=30, message="El POS no terminó de cargar.")
+        report = run_soak(
+            driver,
+            parse_duration(args.duration),
+            interval=parse_duration(args.interval),
+            seed=args.seed,
+            on_sample=on_sample,
+        )
+    finally:
+        driver.quit()
+        if backend:
+            backend.stop()
+
+    analysis = analyze(report["samples"], warmup, limits)
+    print_soak_report(report, analysis)
+
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump({**report, "warmup": warmup, "analysis": analysis}, f, indent=2)
+
+    if analysis["leaks"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
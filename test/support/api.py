@@ -0,0 +1,37 @@
+import json
+import urllib.error
+import urllib.request
+
+from .config import API_URL
+
+
+class ApiError(Exception):
+    def __init__(self, status, body):
+        super().__init__(f"HTTP {status}: {body}")
+        self.status = status
+        self.body = body
+
+
+def urllib_transport(method, url, body, headers, timeout):
+    """Hace el pedido y devuelve ``(status, bytes)`` sin levantar por el código HTTP."""
+    request = urllib.request.Request(url, data=body, headers=headers, method=method)
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return response.status, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.read()
+
+
+# support.har lo reemplaza para grabar o reproducir los pedidos hechos desde Python.
+transport = urllib_transport
+
+
+def api_request(method, path, data=None, token=None, timeout=10):
+    headers = {"Content-Type": "application/json", "Accept": "application/json"}
+    if token:
+        headers["Authorization"] = f"Token {token}"
+    body = json.dumps(data).encode() if data is not None else None
+    status, payload = transport(method, f"{API_URL}{path}", body, headers, timeout)
+    if status >= 400:
+        raise ApiError(status, payload.decode(errors="replace"))
+    return json.loads(payload) if payload else None
@@ -0,0 +1,154 @@
+import argparse
+import asyncio
+import glob
+import importlib.util
+import os
+import time
+import traceback
+import uuid
+
+from .api import ApiError
+from .config import API_URL
+from .data import DataNamespace
+from .http import AsyncClient, login
+from .records import detail_path, find_by_name
+
+TEST_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+API_DIR = os.path.join(TEST_DIR, "api")
+
+
+class ApiCase:
+    """Contexto de un caso de la suite de API.
+
+    Los registros creados con ``create`` se borran al terminar el caso, aunque
+    falle, así los casos no dependen de lo que haya en la base ni entre sí.
+    """
+
+    def __init__(self, client, token, data, lookups):
+        self.client = client
+        self.token = token
+        self.data = data
+        self._lookups = lookups
+        self._created = []
+
+    async def call(self, method, path, payload=None):
+        return await self.client.call(method, path, payload, self.token)
+
+    async def lookup(self, resource, name):
+        """Id de la categoría, marca o proveedor ``name``; se consulta una vez por corrida."""
+        key = (resource, name)
+        if key not in self._lookups:
+            self._lookups[key] = asyncio.ensure_future(
+                self.call("GET", f"/{resource}/?offset=0&limit=100000")
+            )
+        row = find_by_name(await self._lookups[key], name)
+        if row is None:
+            raise LookupError(f"No existe {resource} '{name}'.")
+        return row["id"]
+
+    async def create(self, resource, payload):
+        row = await self.call("POST", f"/{resource}/", payload)
+        self._created.append((resource, row))
+        return row
+
+    def track(self, resource, row):
+        """Reemplaza el registro seguido (por ejemplo, después de un PUT que cambia el slug)."""
+        self.forget(resource, row)
+        self._created.append((resource, row))
+
+    def forget(self, resource, row):
+        self._created = [(r, old) for r, old in self._created if old["id"] != row["id"] or r != resource]
+
+    async def cleanup(self):
+        for resource, row in reversed(self._created):
+            try:
+                await self.call("DELETE", detail_path(resource, row))
+            except ApiError as e:
+                if e.status != 404:
+                    raise
+        self._created.clear()
+
+
+def discover_cases(pattern=None):
+    """Devuelve ``(nombre, función)`` de los casos listados en ``CASES`` de test/api/test_*.py."""
+    cases = []
+    for path in sorted(glob.glob(os.path.join(API_DIR, "test_*.py"))):
+        name = os.path.relpath(path, TEST_DIR)
+        spec = importlib.util.spec_from_file_location("api_cases." + os.path.basename(path)[:-3], path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        for case in module.CASES:
+            label = f"{name}::{case.__name__}"
+            if not pattern or pattern in label:
+                cases.append((label, case))
+    return cases
+
+
+async def run_case(label, case, client, token, lookups, data, slots):
+    async with slots:
+        ctx = ApiCase(client, token, data, lookups)
+        result = {"case": label, "status": "passed", "error": None}
+        start = time.perf_counter()
+        try:
+            await case(ctx)
+        except Exception as e:
+            result["status"] = "failed"
+            result["error"] = f"{type(e).__name__}: {e}"
+            result["traceback"] = traceback.format_exc()
+        finally:
+            try:
+                await ctx.cleanup()
+            except Exception as e:
+                result["cleanup_error"] = f"{type(e).__name__}: {e}"
+        result["duration"] = time.perf_counter() - start
+        status = "OK " if result["status"] == "passed" else "ERR"
+        print(f"[{status}] {label} ({result['duration'] * 1000:.0f} ms)")
+        return result
+
+
+async def run_cases(cases, base_url=API_URL, concurrency=8, role="ADMIN"):
+    start = time.perf_counter()
+    data = DataNamespace(f"api{uuid.uuid4().hex[:4]}")
+    lookups = {}
+    slots = asyncio.Semaphore(concurrency)
+    async with AsyncClient(base_url, size=concurrency) as client:
+        token = await login(client, role)
+        results = await asyncio.gather(
+            *(run_case(label, case, client, token, lookups, data, slots) for label, case in cases)
+        )
+        connections = dict(client.stats)
+    return {
+        "wall_time": time.perf_counter() - start,
+        "passed": sum(r["status"] == "passed" for r in results),
+        "failed": sum(r["status"] == "failed" for r in results),
+        "connections": connections,
+        "results": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Corre los casos de test/api contra la API, sin navegador.")
+    parser.add_argument("--base-url", default=API_URL)
+    parser.add_argument("-c", "--concurrency", type=int, default=8, help="Casos simultáneos (y tamaño del pool).")
+    parser.add_argument("-k", "--filter", help="Solo los casos cuyo nombre contiene este texto.")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Mostrar el traceback de los fallos.")
+    args = parser.parse_args(argv)
+
+    cases = discover_cases(args.filter)
+    if not cases:
+        parser.error("No se encontraron casos.")
+    report = asyncio.run(run_cases(cases, args.base_url, args.concurrency))
+
+    print()
+    for result in report["results"]:
+        if result["status"] == "failed":
+            print(f"{result['case']}: {result['error']}")
+            if args.verbose:
+                print(result["traceback"])
+        if result.get("cleanup_error"):
+            print(f"{result['case']}: no se pudo limpiar ({result['cleanup_error']})")
+    print(
+        f"Casos: {len(report['results'])}  OK: {report['passed']}  Fallidos: {report['failed']}  "
+        f"Tiempo: {report['wall_time']:.2f}s  Conexiones: {report['connections']['connections']}"
+    )
+    return 1 if report["failed"] else 0
@@ -0,0 +1,4 @@
+from .server import FaultInjector, MockBackend
+from .store import Store
+
+__all__ = ["FaultInjector", "MockBackend", "Store"]
@@ -0,0 +1,123 @@
+import datetime
+import random
+from decimal import Decimal
+
+# Datos que los flujos de Selenium esperan encontrar.
+USERS = [
+    ({"username": "lucasleone03", "first_name": "Lucas", "last_name": "Leone",
+      "email": "lucas@example.com", "user_type": "ADMIN"}, "admin12345"),
+    ({"username": "vendedor", "first_name": "Valeria", "last_name": "Díaz",
+      "email": "vendedor@example.com", "user_type": "SELLER"}, "vendedor12345"),
+    ({"username": "repartidor", "first_name": "Ramiro", "last_name": "Sosa",
+      "email": "repartidor@example.com", "user_type": "DELIVERY"}, "repartidor12345"),
+]
+PRODUCT_CATEGORIES = ["Panadería", "Facturas", "Tortas", "Bebidas", "test"]
+PRODUCT_BRANDS = ["Leone", "La Pana", "Genérica", "test marca"]
+EXPENSE_CATEGORIES = ["Negocio", "Insumos", "Servicios"]
+SUPPLIERS = ["YPF", "Molino Cañuelas", "Distribuidora Norte"]
+PRODUCT_NAMES = [
+    "Pan Francés", "Pan Integral", "Medialuna", "Vigilante", "Bizcocho", "Pan de Campo",
+    "Chipá", "Torta Frita", "Alfajor", "Budín", "Prepizza", "Grisín", "Pan Lactal", "Tortita Negra",
+]
+CUSTOMER_NAMES = [
+    "Almacén Don José", "Kiosco El Sol", "Bar La Esquina", "Comedor Santa Ana", "María López",
+    "Juan Pérez", "Carlos Gómez", "Rotisería Sabores", "Club Atlético", "Escuela N°12",
+]
+
+SIZES = {
+    "empty": {"products": 0, "customers": 0, "sales": 0, "expenses": 0},
+    "small": {"products": 30, "customers": 15, "sales": 120, "expenses": 20},
+}
+
+
+def seed_store(store, seed=0, size="small"):
+    """Llena el store con un conjunto de datos determinístico para ``seed``."""
+    rng = random.Random(seed)
+    counts = SIZES[size] if isinstance(size, str) else size
+    now = store.now
+
+    users = [store.add_user(user, password) for user, password in USERS]
+    categories = [store.insert("product-categories", {"name": n, "description": ""}) for n in PRODUCT_CATEGORIES]
+    brands = [store.insert("product-brands", {"name": n, "description": ""}) for n in PRODUCT_BRANDS]
+    expense_categories = [store.insert("expense-categories", {"name": n, "description": ""}) for n in EXPENSE_CATEGORIES]
+    suppliers = [
+        store.insert("suppliers", {"name": n, "phone_number": None, "email": None, "address": None})
+        for n in SUPPLIERS
+    ]
+
+    products = []
+    for i in range(counts["products"]):
+        name = f"{PRODUCT_NAMES[i % len(PRODUCT_NAMES)]} {i // len(PRODUCT_NAMES) + 1}"
+        retail = Decimal(rng.randint(200, 5000))
+        products.append(store.insert("products", store.prepare("products", {
+            "barcode": f"779{seed % 1000:03d}{i:07d}",
+            "name": name,
+            "retail_price": retail,
+            "wholesale_price": (retail * Decimal("0.85")).quantize(Decimal("1")),
+            "category": rng.choice(categories)["id"],
+            "brand": rng.choice(brands)["id"],
+        })))
+
+    customers = []
+    for i in range(counts["customers"]):
+        base = CUSTOMER_NAMES[i % len(CUSTOMER_NAMES)]
+        customers.append(store.insert("customers", {
+            "name": base if i < len(CUSTOMER_NAMES) else f"{base} {i}",
+            "email": f"cliente{i}@example.com",
+            "phone_number": f"+549351{rng.randint(1000000, 9999999)}",
+            "address": f"Calle {rng.randint(1, 200)} N°{rng.randint(1, 3000)}",
+            "customer_type": rng.choice(["minorista", "mayorista"]),
+        }))
+
+    for customer in customers[: len(customers) // 3]:
+        for day in range(6):
+            if products:
+                store.insert("standing-orders", store.prepare("standing-orders", {
+                    "customer": customer["id"],
+                    "day_of_week": day,
+                    "details": [
+                        {"product": p["id"], "quantity": rng.randint(1, 20)}
+                        for p in rng.sample(products, min(3, len(products)))
+                    ],
+                }))
+
+    for i in range(counts["expenses"]):
+        date = (now - datetime.timedelta(days=rng.randint(0, 60))).date()
+        store.insert("expenses", store.prepare("expenses", {
+            "amount": rng.randint(1000, 90000),
+            "date": date.isoformat(),
+            "description": f"Gasto {i + 1}",
+            "category": rng.choice(expense_categories)["id"],
+            "supplier": rng.choice(suppliers)["id"],
+        }))
+
+    states = ["creada", "pendiente_entrega", "entregada", "cobrada", "cobrada", "cancelada"]
+    for i in range(counts["sales"] if products else 0):
+        date = now - datetime.timedelta(days=rng.randint(0, 60), minutes=rng.randint(0, 600))
+        customer = rng.choice(customers) if customers and rng.random() < 0.6 else None
+        sale_type = customer["customer_type"] if customer else "minorista"
+        details = []
+        for product in rng.sample(products, min(rng.randint(1, 4), len(products))):
+            price = product["wholesale_price"] if sale_type == "mayorista" else product["retail_price"]
+            details.append({"product": product["id"], "price": price, "quantity": rng.randint(1, 12)})
+        sale = store.prepare("sales", {
+            "date": date.isoformat(),
+            "customer": customer["id"] if customer else None,
+            "payment_method": rng.choice(["efectivo", "tarjeta", "transferencia", "qr", "cuenta_corriente"]),
+            "sale_type": sale_type,
+            "sale_details": details,
+        }, user=rng.choice(users))
+        if customer:
+            sale["state"] = rng.choice(states)
+            if sale["state"] == "cobrada":
+                sale["total_collected"] = sale["total"]
+        sale = store.insert("sales", sale)
+        if customer and rng.random() < 0.1:
+            detail = sale["sale_details"][0]
+            store.insert("returns", store.prepare("returns", {
+                "sale": sale["id"],
+                "date": sale["date"],
+                "return_details": [{"product": detail["product"], "quantity": 1}],
+            }, user=rng.choice(users)))
+    return store
+
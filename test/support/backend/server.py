@@ -0,0 +1,440 @@
+import collections
+import json
+import random
+import re
+import threading
+import time
+from decimal import Decimal
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from .seed import seed_store
+from .store import EXACT_FILTERS, SEARCH_FIELDS, Store, ValidationError, parse_date
+
+SALE_ACTIONS = ("cancel", "mark-as-delivered", "mark-as-charged", "mark-as-partial-charged")
+DATE_FILTERED = ("sales", "returns", "expenses")
+
+
+class FaultInjector:
+    """Latencia y errores por endpoint, reproducibles a partir de ``seed``.
+
+    Cada regla es un dict con ``path`` (regex sobre la ruta sin prefijo),
+    ``method`` opcional, ``latency_ms``, ``jitter_ms``, ``error_rate`` y
+    ``error_status``. Se aplican todas las reglas que coinciden: las demoras
+    se suman y cada una sortea su ``error_rate``; si fallan varias, el status
+    es el de la primera. El azar de cada regla depende solo de la semilla y
+    de cuántas veces se aplicó, así que la misma secuencia de pedidos
+    produce las mismas demoras y fallas.
+    """
+
+    def __init__(self, rules=None, seed=0):
+        self.seed = seed
+        self.lock = threading.Lock()
+        self.configure(rules or [])
+
+    def configure(self, rules, seed=None):
+        with self.lock:
+            if seed is not None:
+                self.seed = seed
+            self.rules = [dict(rule, _pattern=re.compile(rule.get("path", ".*"))) for rule in rules]
+            self.counters = collections.Counter()
+
+    def describe(self):
+        return {
+            "seed": self.seed,
+            "rules": [{k: v for k, v in rule.items() if k != "_pattern"} for rule in self.rules],
+        }
+
+    def decide(self, method, path):
+        latency, error = 0, None
+        with self.lock:
+            for index, rule in enumerate(self.rules):
+                if rule.get("method") and rule["method"].upper() != method:
+                    continue
+                if not rule["_pattern"].search(path):
+                    continue
+                self.counters[index] += 1
+                rng = random.Random(f"{self.seed}:{index}:{self.counters[index]}")
+                latency += rule.get("latency_ms", 0) + rng.uniform(0, rule.get("jitter_ms", 0))
+                if rng.random() < rule.get("error_rate", 0) and error is None:
+                    error = rule.get("error_status", 500)
+        return latency / 1000, error
+
+
+class MockServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # El default de socketserver (5) hace que los clientes con pool de
+    # conexiones esperen el reintento del SYN al abrirlas todas juntas.
+    request_queue_size = 128
+
+    def __init__(self, address, store, injector, prefix="", default_limit=None, seed=0, size="small"):
+        super().__init__(address, MockHandler)
+        self.store = store
+        self.injector = injector
+        self.prefix = prefix.rstrip("/")
+        self.default_limit = default_limit
+        self.seed = seed
+        self.size = size
+        self.stats_lock = threading.Lock()
+        self.log = collections.deque(maxlen=100000)
+
+    def reset(self, seed=None, size=None, fixtures=None):
+        self.seed = self.seed if seed is None else seed
+        self.size = size or self.size
+        store = Store(now=self.store.now)
+        seed_store(store, self.seed, self.size)
+        if fixtures:
+            store.load_fixtures(fixtures)
+        self.store = store
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    server_version = "LaPanaMock/1.0"
+    protocol_version = "HTTP/1.1"
+    # Los headers y el cuerpo salen en escrituras separadas; con Nagle activo
+    # cada respuesta keep-alive espera el ACK diferido del cliente (~40 ms).
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    # -- Infraestructura -------------------------------------------------
+
+    def _send(self, status, payload=None):
+        body = b"" if payload is None else json.dumps(payload, default=str).encode()
+        self.send_response(status)
+        self.send_header("Access-Control-Allow-Origin", self.headers.get("Origin") or "*")
+        self.send_header("Access-Control-Allow-Credentials", "true")
+        self.send_header("Access-Control-Allow-Headers", "Authorization, Content-Type")
+        self.send_header("Access-Control-Allow-Methods", "GET, POST, PUT, PATCH, DELETE, OPTIONS")
+        if body:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+        self._status = status
+        self._bytes = len(body)
+
+    def _read_body(self):
+        # Se lee siempre, aunque la ruta no lo use: si queda en el socket, la
+        # conexión keep-alive lo interpreta como el comienzo del próximo pedido.
+        length = int(self.headers.get("Content-Length") or 0)
+        self._raw = self.rfile.read(length) if length else b""
+
+    def _body(self):
+        return json.loads(self._raw) if self._raw.strip() else {}
+
+    def _handle(self, method):
+        started = time.perf_counter()
+        url = urlsplit(self.path)
+        path = url.path
+        if self.server.prefix and path.startswith(self.server.prefix):
+            path = path[len(self.server.prefix):]
+        params = {k: v[-1] for k, v in parse_qs(url.query, keep_blank_values=True).items()}
+        self._status, self._bytes = 0, 0
+        self._read_body()
+
+        try:
+            if method == "OPTIONS":
+                self._send(204)
+            elif path.startswith("/__mock__/"):
+                self._control(method, path, params)
+            else:
+                delay, error = self.server.injector.decide(method, path)
+                if delay:
+                    time.sleep(delay)
+                if error:
+                    self._send(error, {"detail": "Error inyectado por el backend simulado."})
+                else:
+                    self._route(method, path, params)
+        except ValidationError as e:
+            self._send(400, e.errors)
+        except (ValueError, KeyError, TypeError) as e:
+            self._send(400, {"detail": f"Solicitud inválida: {e}"})
+
+        if not path.startswith("/__mock__/"):
+            with self.server.stats_lock:
+                self.server.log.append({
+                    "method": method,
+                    "path": path,
+                    "query": url.query,
+                    "status": self._status,
+                    "bytes": self._bytes,
+                    "ms": (time.perf_counter() - started) * 1000,
+                })
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_PUT(self):
+        self._handle("PUT")
+
+    def do_PATCH(self):
+        self._handle("PATCH")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+    def do_OPTIONS(self):
+        self._handle("OPTIONS")
+
+    # -- Endpoints de control --------------------------------------------
+
+    def _control(self, method, path, params):
+        server = self.server
+        if path == "/__mock__/config/":
+            if method == "POST":
+                body = self._body()
+                server.injector.configure(body.get("rules", []), body.get("seed"))
+            self._send(200, server.injector.describe())
+        elif path == "/__mock__/reset/" and method == "POST":
+            body = self._body()
+            server.reset(body.get("seed"), body.get("size"), body.get("fixtures"))
+            self._send(200, {"seed": server.seed, "size": server.size})
+        elif path == "/__mock__/stats/":
+            with server.stats_lock:
+                if method == "DELETE":
+                    server.log.clear()
+                    self._send(204)
+                else:
+                    self._send(200, {"requests": list(server.log)})
+        else:
+            self._send(404, {"detail": "No encontrado."})
+
+    # -- API ---------------------------------------------------------------
+
+    def _user(self):
+        auth = self.headers.get("Authorization", "")
+        if not auth.startswith("Token "):
+            return None
+        return self.server.store.user_for_token(auth[len("Token "):])
+
+    def _route(self, method, path, params):
+        store = self.server.store
+        parts = [p for p in path.split("/") if p]
+
+        if parts == ["users", "login"] and method == "POST":
+            body = self._body()
+            session = store.login(body.get("username"), body.get("password"))
+            if session:
+                self._send(201, session)
+            else:
+                self._send(400, {"non_field_errors": ["Credenciales inválidas."]})
+            return
+
+        user = self._user()
+        if user is None:
+            self._send(401, {"detail": "Las credenciales de autenticación no se proveyeron."})
+            return
+
+        if not parts or parts[0] not in SEARCH_FIELDS:
+            self._send(404, {"detail": "No encontrado."})
+            return
+        resource = parts[0]
+
+        with store.lock:
+            if resource == "users" and len(parts) == 2 and parts[1] in ("profile", "update-profile", "create-user"):
+                return self._users_extra(method, parts[1], user)
+            if resource == "sales" and len(parts) >= 2:
+                handled = self._sales_extra(method, parts, params, user)
+                if handled:
+                    return
+            if len(parts) == 1:
+                if method == "GET":
+                    return self._list(resource, params)
+                if method == "POST":
+                    return self._create(resource, self._body(), user)
+            elif len(parts) == 2:
+                obj = store.get(resource, parts[1])
+                if obj is None:
+                    self._send(404, {"detail": "No encontrado."})
+                    return
+                if method == "GET":
+                    return self._send(200, store.serialize(resource, obj))
+                if method in ("PUT", "PATCH"):
+                    return self._update(resource, obj, self._body(), user)
+                if method == "DELETE":
+                    store.delete(resource, obj)
+                    return self._send(204)
+            self._send(405, {"detail": f'Método "{method}" no permitido.'})
+
+    def _create(self, resource, body, user):
+        store = self.server.store
+        password = body.get("password")
+        data = store.prepare(resource, body, user=user)
+        if resource == "users":
+            obj = store.add_user(data, password or data["username"])
+        else:
+            obj = store.insert(resource, data)
+        self._send(201, store.serialize(resource, obj))
+
+    def _update(self, resource, obj, body, user):
+        store = self.server.store
+        data = store.prepare(resource, body, current=obj, user=user)
+        data["id"] = obj["id"]
+        if resource == "users" and obj["username"] != data["username"]:
+            store.passwords[data["username"]] = store.passwords.pop(obj["username"], "")
+        obj = store.insert(resource, data)
+        self._send(200, store.serialize(resource, obj))
+
+    def _users_extra(self, method, action, user):
+        store = self.server.store
+        if action == "profile" and method == "GET":
+            return self._send(200, store.serialize("users", user))
+        if action == "update-profile" and method in ("PATCH", "PUT"):
+            return self._update("users", user, self._body(), user)
+        if action == "create-user" and method == "POST":
+            return self._create("users", self._body(), user)
+        self._send(405, {"detail": f'Método "{method}" no permitido.'})
+
+    def _sales_extra(self, method, parts, params, user):
+        store = self.server.store
+        if parts[1] == "statistics" and method == "GET":
+            self._send(200, store.statistics(params))
+        elif parts[1] == "list-by-customer-for-collect" and method == "GET":
+            data = store.list_for_collect()
+            customers = data["customers"]
+            offset = int(params.get("offset") or 0)
+            limit = int(params.get("limit") or 0) or len(customers)
+            data["customers"] = customers[offset:offset + limit]
+            self._send(200, data)
+        elif parts[1] == "create-fast-sale" and method == "POST":
+            body = self._body()
+            body.pop("sale_details", None)
+            self._create("sales", body, user)
+        elif len(parts) == 3 and parts[2] == "update-fast-sale" and method == "PUT":
+            sale = store.get("sales", parts[1])
+            if sale is None:
+                self._send(404, {"detail": "No encontrado."})
+            else:
+                self._update("sales", sale, {**self._body(), "sale_details": []}, user)
+        elif len(parts) == 3 and parts[2] in SALE_ACTIONS and method == "POST":
+            sale = store.get("sales", parts[1])
+            if sale is None:
+                self._send(404, {"detail": "No encontrado."})
+            else:
+                body = self._body() if parts[2] == "mark-as-partial-charged" else {}
+                store.sale_action(sale, parts[2], body)
+                self._send(200, store.serialize("sales", sale))
+        else:
+            return False
+        return True
+
+    def _list(self, resource, params):
+        store = self.server.store
+        rows = store.all(resource)
+
+        for field in EXACT_FILTERS.get(resource, []):
+            if params.get(field) in (None, ""):
+                continue
+            wanted = params[field]
+            if field == "needs_delivery":
+                wanted = {"true": True, "false": False}.get(wanted.lower(), wanted)
+                rows = [r for r in rows if r.get(field) == wanted]
+            else:
+                values = set(wanted.split(","))
+                rows = [r for r in rows if str(store.resolve(resource, r, field)) in values]
+
+        if resource == "returns" and params.get("customer"):
+            rows = [r for r in rows if str(store.resolve(resource, r, "sale__customer")) == params["customer"]]
+
+        if resource in DATE_FILTERED:
+            if params.get("date"):
+                day = parse_date(params["date"])
+                rows = [r for r in rows if parse_date(r["date"]) == day]
+            if params.get("start_date"):
+                start = parse_date(params["start_date"])
+                rows = [r for r in rows if parse_date(r["date"]) >= start]
+            if params.get("end_date"):
+                end = parse_date(params["end_date"])
+                rows = [r for r in rows if parse_date(r["date"]) <= end]
+            amount = "amount" if resource == "expenses" else "total"
+            if params.get("min_total"):
+                rows = [r for r in rows if Decimal(r[amount]) >= Decimal(params["min_total"])]
+            if params.get("max_total"):
+                rows = [r for r in rows if Decimal(r[amount]) <= Decimal(params["max_total"])]
+
+        search = params.get("search", "").strip().lower()
+        if search:
+            fields = SEARCH_FIELDS[resource]
+            rows = [
+                r for r in rows
+                if search in str(r["id"]) and resource in ("sales", "returns")
+                or any(search in str(store.resolve(resource, r, f) or "").lower() for f in fields)
+            ]
+
+        ordering = params.get("ordering")
+        if ordering:
+            for key in reversed(ordering.split(",")):
+                field = key.lstrip("-")
+                rows.sort(
+                    key=lambda r: _sort_key(store.resolve(resource, r, field)),
+                    reverse=key.startswith("-"),
+                )
+        else:
+            rows.sort(key=lambda r: r["id"], reverse=resource in DATE_FILTERED)
+
+        count = len(rows)
+        offset = int(params.get("offset") or 0)
+        limit = int(params.get("limit") or 0) or self.server.default_limit or count
+        page = rows[offset:offset + limit]
+        base = f"http://{self.headers.get('Host', 'localhost')}{self.server.prefix}/{resource}/"
+        self._send(200, {
+            "count": count,
+            "next": f"{base}?limit={limit}&offset={offset + limit}" if offset + limit < count else None,
+            "previous": f"{base}?limit={limit}&offset={max(0, offset - limit)}" if offset > 0 else None,
+            "results": [store.serialize(resource, r) for r in page],
+        })
+
+
+def _sort_key(value):
+    if value is None:
+        return (0, "")
+    try:
+        return (1, Decimal(str(value)))
+    except ArithmeticError:
+        return (2, str(value).lower())
+
+
+class MockBackend:
+    """Levanta el backend simulado en un hilo, para usarlo desde Python."""
+
+    def __init__(self, host="127.0.0.1", port=0, seed=0, size="small", fixtures=None,
+                 rules=None, prefix="", default_limit=None, now=None):
+        store = Store(now=now)
+        seed_store(store, seed, size)
+        if fixtures:
+            store.load_fixtures(fixtures)
+        self.server = MockServer(
+            (host, port), store, FaultInjector(rules, seed),
+            prefix=prefix, default_limit=default_limit, seed=seed, size=size,
+        )
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}{self.server.prefix}"
+
+    @property
+    def store(self):
+        return self.server.store
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,532 @@
+import copy
+import datetime
+import re
+import secrets
+import threading
+import unicodedata
+from decimal import Decimal, ROUND_HALF_UP
+
+# Búsqueda (?search=) por recurso, con la misma notación a__b que usa DRF.
+SEARCH_FIELDS = {
+    "product-categories": ["name"],
+    "product-brands": ["name"],
+    "products": ["name", "barcode"],
+    "customers": ["name", "email", "phone_number"],
+    "standing-orders": [],
+    "expense-categories": ["name"],
+    "suppliers": ["name", "email"],
+    "expenses": ["description", "category__name", "supplier__name"],
+    "sales": ["customer__name", "user__username"],
+    "returns": ["sale__customer__name", "user__username"],
+    "users": ["username", "first_name", "last_name", "email"],
+}
+
+# Filtros por igualdad que aceptan los listados (?category=3&brand=1).
+EXACT_FILTERS = {
+    "products": ["category", "brand"],
+    "customers": ["customer_type"],
+    "standing-orders": ["customer", "day_of_week"],
+    "expenses": ["category", "supplier"],
+    "sales": ["customer", "user", "sale_type", "payment_method", "state", "needs_delivery"],
+    "returns": ["sale", "user", "sale__customer"],
+    "users": ["user_type"],
+}
+
+RELATIONS = {
+    ("products", "category"): "product-categories",
+    ("products", "brand"): "product-brands",
+    ("expenses", "category"): "expense-categories",
+    ("expenses", "supplier"): "suppliers",
+    ("sales", "customer"): "customers",
+    ("sales", "user"): "users",
+    ("returns", "sale"): "sales",
+    ("returns", "user"): "users",
+    ("standing-orders", "customer"): "customers",
+}
+
+LOOKUP_FIELDS = {"products": "slug", "users": "username"}
+
+UNIQUE_FIELDS = [("products", "slug"), ("products", "barcode"), ("users", "username")]
+
+OPEN_SALE_STATES = ("creada", "pendiente_entrega", "entregada", "cobrada_parcial")
+
+
+class ValidationError(Exception):
+    def __init__(self, errors):
+        super().__init__(errors)
+        self.errors = errors
+
+
+def money(value):
+    return str(Decimal(str(value or 0)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP))
+
+
+def slugify(value):
+    value = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode()
+    return re.sub(r"[^a-z0-9]+", "-", value.lower()).strip("-")
+
+
+def parse_date(value):
+    if isinstance(value, datetime.date) and not isinstance(value, datetime.datetime):
+        return value
+    return datetime.date.fromisoformat(str(value)[:10])
+
+
+class Store:
+    """Base de datos en memoria con la forma de las respuestas del backend Django."""
+
+    def __init__(self, now=None):
+        self.now = now or datetime.datetime.now().replace(microsecond=0)
+        self.lock = threading.RLock()
+        self.tables = {resource: {} for resource in SEARCH_FIELDS}
+        self.next_ids = {resource: 1 for resource in SEARCH_FIELDS}
+        self.indexes = {key: {} for key in UNIQUE_FIELDS}
+        self.passwords = {}
+        self.tokens = {}
+
+    # -- Acceso genérico -------------------------------------------------
+
+    def _unindex(self, resource, obj):
+        for (indexed, field), index in self.indexes.items():
+            if indexed == resource:
+                index.pop(str(obj.get(field)), None)
+
+    def insert(self, resource, obj):
+        """Guarda ``obj``; si ya tiene un ``id`` existente lo reemplaza."""
+        with self.lock:
+            obj = dict(obj)
+            if obj.get("id") is None:
+                obj["id"] = self.next_ids[resource]
+            self.next_ids[resource] = max(self.next_ids[resource], obj["id"] + 1)
+            previous = self.tables[resource].get(obj["id"])
+            if previous:
+                self._unindex(resource, previous)
+            self.tables[resource][obj["id"]] = obj
+            for (indexed, field), index in self.indexes.items():
+                if indexed == resource:
+                    index[str(obj.get(field))] = obj["id"]
+            return obj
+
+    def get(self, resource, key):
+        table = self.tables[resource]
+        lookup = LOOKUP_FIELDS.get(resource)
+        if lookup:
+            obj_id = self.indexes[(resource, lookup)].get(str(key))
+            if obj_id is not None:
+                return table[obj_id]
+        try:
+            return table.get(int(key))
+        except (TypeError, ValueError):
+            return None
+
+    def all(self, resource):
+        return list(self.tables[resource].values())
+
+    def delete(self, resource, obj):
+        with self.lock:
+            self.tables[resource].pop(obj["id"], None)
+            self._unindex(resource, obj)
+            if resource == "sales":
+                for ret in [r for r in self.all("returns") if r["sale"] == obj["id"]]:
+                    self.tables["returns"].pop(ret["id"], None)
+
+    # -- Autenticación -----------------------------------------------------
+
+    def add_user(self, user, password):
+        user = self.insert("users", {
+            "first_name": "",
+            "last_name": "",
+            "email": "",
+            "phone_number": "",
+            **user,
+        })
+        self.passwords[user["username"]] = password
+        return user
+
+    def login(self, username, password):
+        with self.lock:
+            if not username or self.passwords.get(username) != password:
+                return None
+            user = self.get("users", username)
+            token = secrets.token_hex(20)
+            self.tokens[token] = user["id"]
+            return {"user": self.serialize("users", user), "access_token": token}
+
+    def user_for_token(self, token):
+        user_id = self.tokens.get(token)
+        return self.tables["users"].get(user_id) if user_id else None
+
+    # -- Serialización -----------------------------------------------------
+
+    def _details(self, resource, key):
+        obj = self.tables[resource].get(key) if key is not None else None
+        return self.serialize(resource, obj) if obj else None
+
+    def serialize(self, resource, obj):
+        data = copy.deepcopy(obj)
+        if resource == "products":
+            data["category_details"] = self._details("product-categories", obj.get("category"))
+            data["brand_details"] = self._details("product-brands", obj.get("brand"))
+        elif resource == "expenses":
+            data["category_details"] = self._details("expense-categories", obj.get("category"))
+            data["supplier_details"] = self._details("suppliers", obj.get("supplier"))
+        elif resource == "standing-orders":
+            for detail in data["details"]:
+                detail["product_details"] = self._details("products", detail["product"])
+        elif resource == "sales":
+            data["customer_details"] = self._details("customers", obj.get("customer"))
+            data["user_details"] = self._details("users", obj.get("user"))
+            for detail in data["sale_details"]:
+                detail["product_details"] = self._details("products", detail["product"])
+            data["total_returns"] = money(self.sale_returns_total(obj))
+            data["total_to_collect"] = money(
+                Decimal(obj["total"]) - self.sale_returns_total(obj) - Decimal(obj["total_collected"])
+            )
+        elif resource == "returns":
+            data["sale_details"] = self._details("sales", obj.get("sale"))
+            data["user_details"] = self._details("users", obj.get("user"))
+            for detail in data["return_details"]:
+                detail["product_details"] = self._details("products", detail["product"])
+        return data
+
+    def resolve(self, resource, obj, path):
+        """Resuelve una ruta estilo ``customer__name`` sobre un objeto guardado."""
+        value = obj
+        parts = path.split("__")
+        for i, part in enumerate(parts):
+            if not isinstance(value, dict):
+                return None
+            value = value.get(part)
+            related = RELATIONS.get((resource, part))
+            if related and i < len(parts) - 1:
+                value = self.tables[related].get(value)
+                resource = related
+        return value
+
+    # -- Validación y reglas de negocio --------------------------------------
+
+    @staticmethod
+    def require(data, *fields):
+        errors = {field: ["Este campo es requerido."] for field in fields if data.get(field) in (None, "")}
+        if errors:
+            raise ValidationError(errors)
+
+    def _check_unique(self, resource, field, value, current=None):
+        obj_id = self.indexes[(resource, field)].get(str(value))
+        if obj_id is not None and (current is None or obj_id != current["id"]):
+            raise ValidationError({field: [f"Ya existe un registro con este {field}."]})
+
+    def _fk(self, resource, value, field):
+        if value in (None, ""):
+            return None
+        if int(value) not in self.tables[resource]:
+            raise ValidationError({field: [f'Clave primaria "{value}" inválida - objeto no existe.']})
+        return int(value)
+
+    def prepare(self, resource, data, current=None, user=None, partial=False):
+        """Normaliza y valida el cuerpo de un POST/PUT/PATCH."""
+        base = dict(current or {})
+        base.update(data)
+        data = base
+        data.pop("id", None)
+
+        if resource in ("product-categories", "product-brands", "expense-categories"):
+            self.require(data, "name")
+            data.setdefault("description", "")
+        elif resource == "suppliers":
+            self.require(data, "name")
+            for field in ("phone_number", "email", "address"):
+                data.setdefault(field, None)
+        elif resource == "customers":
+            self.require(data, "name")
+            data.setdefault("customer_type", "minorista")
+            for field in ("email", "phone_number", "address"):
+                data.setdefault(field, None)
+        elif resource == "products":
+            self.require(data, "barcode", "name", "retail_price", "category", "brand")
+            self._check_unique("products", "barcode", data["barcode"], current)
+            data["category"] = self._fk("product-categories", data["category"], "category")
+            data["brand"] = self._fk("product-brands", data["brand"], "brand")
+            data["retail_price"] = money(data["retail_price"])
+            data["wholesale_price"] = money(data["wholesale_price"]) if data.get("wholesale_price") else None
+            data.setdefault("weight", None)
+            data.setdefault("weight_unit", None)
+            data.setdefault("description", "")
+            if not current or current.get("name") != data["name"]:
+                data["slug"] = self._unique_slug(data["name"])
+        elif resource == "standing-orders":
+            self.require(data, "customer", "day_of_week")
+            data["customer"] = self._fk("customers", data["customer"], "customer")
+            data["day_of_week"] = int(data["day_of_week"])
+            data["details"] = [
+                {"product": self._fk("products", d["product"], "product"), "quantity": str(d["quantity"])}
+                for d in data.get("details", [])
+            ]
+        elif resource == "expenses":
+            self.require(data, "amount", "date", "category", "supplier")
+            data["amount"] = money(data["amount"])
+            data["category"] = self._fk("expense-categories", data["category"], "category")
+            data["supplier"] = self._fk("suppliers", data["supplier"], "supplier")
+            data.setdefault("description", "")
+        elif resource == "sales":
+            data = self._prepare_sale(data, current, user)
+        elif resource == "returns":
+            data = self._prepare_return(data, current, user)
+        elif resource == "users":
+            self.require(data, "username", "user_type")
+            self._check_unique("users", "username", data["username"], current)
+            data["user_type"] = data["user_type"].upper()
+            data.pop("password", None)
+        return data
+
+    def _unique_slug(self, name):
+        base = slugify(name) or "producto"
+        slug, n = base, 1
+        taken = self.indexes[("products", "slug")]
+        while slug in taken:
+            n += 1
+            slug = f"{base}-{n}"
+        return slug
+
+    def _prepare_sale(self, data, current, user):
+        self.require(data, "date", "payment_method", "sale_type")
+        data["customer"] = self._fk("customers", data.get("customer"), "customer")
+        data["date"] = str(data["date"])
+        if "sale_details" in data and data["sale_details"]:
+            details = []
+            for i, d in enumerate(data["sale_details"], start=1):
+                price = Decimal(str(d.get("price") or 0))
+                quantity = Decimal(str(d.get("quantity") or 0))
+                if quantity <= 0:
+                    raise ValidationError({"sale_details": ["La cantidad debe ser mayor a cero."]})
+                details.append({
+                    "id": d.get("id") or i,
+                    "product": self._fk("products", d["product"], "product"),
+                    "price": money(price),
+                    "quantity": str(quantity),
+                    "subtotal": money(price * quantity),
+                })
+            data["sale_details"] = details
+            data["total"] = money(sum(Decimal(d["subtotal"]) for d in details))
+        else:
+            data["sale_details"] = data.get("sale_details") or []
+            self.require(data, "total")
+            data["total"] = money(data["total"])
+        if current is None:
+            data["user"] = user["id"] if user else None
+            data["needs_delivery"] = bool(data.get("needs_delivery", data["customer"] is not None))
+            if data["needs_delivery"]:
+                data["state"] = "pendiente_entrega"
+                data["total_collected"] = money(0)
+            else:
+                data["state"] = "cobrada"
+                data["total_collected"] = data["total"]
+        return data
+
+    def _prepare_return(self, data, current, user):
+        self.require(data, "return_details")
+        data["sale"] = self._fk("sales", data.get("sale"), "sale")
+        data["date"] = str(data.get("date") or self.now.isoformat())
+        details = []
+        for i, d in enumerate(data["return_details"], start=1):
+            product = self.tables["products"].get(self._fk("products", d["product"], "product"))
+            price = Decimal(product["wholesale_price"] or product["retail_price"])
+            quantity = Decimal(str(d["quantity"]))
+            details.append({
+                "id": d.get("id") or i,
+                "product": product["id"],
+                "price": money(price),
+                "quantity": str(quantity),
+                "subtotal": money(price * quantity),
+            })
+        data["return_details"] = details
+        data["total"] = money(sum(Decimal(d["subtotal"]) for d in details))
+        if current is None:
+            data["user"] = user["id"] if user else None
+        return data
+
+    def sale_returns_total(self, sale):
+        return sum(
+            (Decimal(r["total"]) for r in self.tables["returns"].values() if r["sale"] == sale["id"]),
+            Decimal(0),
+        )
+
+    def sale_action(self, sale, action, data):
+        with self.lock:
+            returns_total = self.sale_returns_total(sale)
+            if action == "cancel":
+                sale["state"] = "cancelada"
+            elif action == "mark-as-delivered":
+                sale["state"] = "entregada"
+            elif action == "mark-as-charged":
+                sale["total_collected"] = money(Decimal(sale["total"]) - returns_total)
+                sale["state"] = "cobrada"
+            elif action == "mark-as-partial-charged":
+                self.require(data or {}, "total")
+                collected = Decimal(sale["total_collected"]) + Decimal(str(data["total"]))
+                sale["total_collected"] = money(collected)
+                due = Decimal(sale["total"]) - returns_total
+                sale["state"] = "cobrada" if collected >= due else "cobrada_parcial"
+            else:
+                return None
+            return sale
+
+    # -- Consultas especiales --------------------------------------------
+
+    def list_for_collect(self):
+        customers = {}
+        for sale in sorted(self.tables["sales"].values(), key=lambda s: s["date"]):
+            if sale["customer"] is None or sale["state"] not in OPEN_SALE_STATES:
+                continue
+            customer = self.tables["customers"][sale["customer"]]
+            entry = customers.setdefault(customer["id"], {
+                "id": customer["id"],
+                "name": customer["name"],
+                "total_sales": Decimal(0),
+                "total_discounted": Decimal(0),
+                "total_collected": Decimal(0),
+                "total_to_collect": Decimal(0),
+                "sales_to_collect": [],
+            })
+            serialized = self.serialize("sales", sale)
+            entry["total_sales"] += Decimal(sale["total"])
+            entry["total_discounted"] += Decimal(serialized["total_returns"])
+            entry["total_collected"] += Decimal(sale["total_collected"])
+            entry["total_to_collect"] += Decimal(serialized["total_to_collect"])
+            entry["sales_to_collect"].append({
+                "id": sale["id"],
+                "date": sale["date"],
+                "total": sale["total"],
+                "total_returns": serialized["total_returns"],
+                "total_collected": sale["total_collected"],
+                "total_to_collect": serialized["total_to_collect"],
+                "sale_details": serialized,
+            })
+        result = []
+        for entry in customers.values():
+            for key in ("total_sales", "total_discounted", "total_collected", "total_to_collect"):
+                entry[key] = money(entry[key])
+            result.append(entry)
+        return {"customers": result}
+
+    def statistics_range(self, params):
+        today = self.now.date()
+        if "week" in params:
+            year, week = params["week"].split("-W")
+            start = datetime.date.fromisocalendar(int(year), int(week), 1)
+            return start, start + datetime.timedelta(days=6), "daily"
+        if "month" in params:
+            year, month = (int(x) for x in params["month"].split("-"))
+            start = datetime.date(year, month, 1)
+            end = (start.replace(day=28) + datetime.timedelta(days=4)).replace(day=1) - datetime.timedelta(days=1)
+            return start, end, "daily"
+        if "year" in params:
+            year = int(params["year"])
+            return datetime.date(year, 1, 1), datetime.date(year, 12, 31), "monthly"
+        if "start_date" in params and "end_date" in params:
+            return parse_date(params["start_date"]), parse_date(params["end_date"]), "daily"
+        return today, today, None
+
+    def statistics(self, params):
+        start, end, breakdown = self.statistics_range(params)
+
+        def in_range(value):
+            return start <= parse_date(value) <= end
+
+        sales = [
+            s for s in self.tables["sales"].values()
+            if in_range(s["date"]) and s["state"] not in ("cancelada", "anulada")
+        ]
+        returns = [r for r in self.tables["returns"].values() if in_range(r["date"])]
+        expenses = [e for e in self.tables["expenses"].values() if in_range(e["date"])]
+
+        def totals(sales, returns, expenses):
+            total_sales = sum((Decimal(s["total"]) for s in sales), Decimal(0))
+            total_returns = sum((Decimal(r["total"]) for r in returns), Decimal(0))
+            total_collected = sum((Decimal(s["total_collected"]) for s in sales), Decimal(0))
+            total_expenses = sum((Decimal(e["amount"]) for e in expenses), Decimal(0))
+            return total_sales, total_returns, total_collected, total_expenses
+
+        total_sales, total_returns, total_collected, total_expenses = totals(sales, returns, expenses)
+
+        sold = {}
+        for sale in sales:
+            for detail in sale["sale_details"]:
+                sold[detail["product"]] = sold.get(detail["product"], Decimal(0)) + Decimal(detail["quantity"])
+        most_sold = sorted(sold.items(), key=lambda item: item[1], reverse=True)[:10]
+
+        data = {
+            "total_sales": money(total_sales),
+            "total_sales_count": len(sales),
+            "total_returns_amount": money(total_returns),
+            "total_collected_amount": money(total_collected),
+            "total_expenses": money(total_expenses),
+            "total_profit": money(total_collected - total_expenses),
+            "most_sold_products": [
+                {
+                    "product_name": self.tables["products"][pid]["name"] if pid in self.tables["products"] else "",
+                    "total_quantity_sold": str(quantity),
+                }
+                for pid, quantity in most_sold
+            ],
+        }
+
+        if breakdown == "daily":
+            rows = []
+            day = start
+            while day <= end:
+                same_day = lambda value: parse_date(value) == day  # noqa: E731
+                s, r, c, e = totals(
+                    [x for x in sales if same_day(x["date"])],
+                    [x for x in returns if same_day(x["date"])],
+                    [x for x in expenses if same_day(x["date"])],
+                )
+                rows.append({
+                    "date": day.isoformat(),
+                    "sales_count": sum(1 for x in sales if same_day(x["date"])),
+                    "total_sales": money(s),
+                    "total_collected": money(c),
+                    "total_returns": money(r),
+                    "daily_expenses": money(e),
+                    "daily_profit": money(c - e),
+                })
+                day += datetime.timedelta(days=1)
+            data["daily_breakdown"] = rows
+        elif breakdown == "monthly":
+            rows = []
+            for month in range(1, 13):
+                def same_month(value):
+                    return parse_date(value).month == month
+                s, r, c, e = totals(
+                    [x for x in sales if same_month(x["date"])],
+                    [x for x in returns if same_month(x["date"])],
+                    [x for x in expenses if same_month(x["date"])],
+                )
+                rows.append({
+                    "month": f"{start.year}-{month:02d}",
+                    "sales_count": sum(1 for x in sales if same_month(x["date"])),
+                    "total_sales": money(s),
+                    "total_collected": money(c),
+                    "total_returns": money(r),
+                    "monthly_expenses": money(e),
+                    "monthly_profit": money(c - e),
+                })
+            data["monthly_breakdown"] = rows
+        return data
+
+    # -- Fixtures ------------------------------------------------------------
+
+    def load_fixtures(self, fixtures):
+        """Carga registros ya armados: ``{"products": [...], "users": [...]}``.
+
+        Los usuarios pueden traer ``password``; el resto se guarda tal cual.
+        """
+        with self.lock:
+            for user in fixtures.get("users", []):
+                user = dict(user)
+                self.add_user(user, user.pop("password", user["username"]))
+            for resource, rows in fixtures.items():
+                if resource == "users":
+                    continue
+                for row in rows:
+                    self.insert(resource, row)
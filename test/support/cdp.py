@@ -0,0 +1,66 @@
+import abc
+import threading
+
+import trio
+
+
+class CdpThread(abc.ABC):
+    """Conexión CDP de ``driver.bidi_connection()`` atendida en un hilo propio con trio.
+
+    Los comandos de Selenium no reciben eventos de CDP; esta conexión sí, y
+    corre al costado mientras el flujo sigue usando el driver normalmente.
+    Las subclases habilitan dominios en ``setup`` y consumen eventos en
+    ``listen``.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.error = None
+        self._thread = None
+        self._ready = threading.Event()
+        self._cancel = None
+        self._token = None
+
+    def start(self, timeout=10):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        if not self._ready.wait(timeout) or self.error:
+            raise RuntimeError(f"No se pudo abrir la conexión CDP: {self.error or 'tiempo agotado'}")
+        return self
+
+    def stop(self):
+        if self._cancel is not None and self._thread is not None and self._thread.is_alive():
+            try:
+                trio.from_thread.run_sync(self._cancel.cancel, trio_token=self._token)
+            except trio.RunFinishedError:
+                pass
+        if self._thread is not None:
+            self._thread.join(10)
+            self._thread = None
+
+    @property
+    def alive(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self):
+        try:
+            trio.run(self._serve)
+        except Exception as e:
+            self.error = f"{type(e).__name__}: {e}"
+        finally:
+            self._ready.set()
+
+    async def _serve(self):
+        self._token = trio.lowlevel.current_trio_token()
+        async with self.driver.bidi_connection() as connection:
+            await self.setup(connection.session, connection.devtools)
+            with trio.CancelScope() as self._cancel:
+                self._ready.set()
+                await self.listen(connection.session, connection.devtools)
+
+    async def setup(self, session, devtools):
+        pass
+
+    @abc.abstractmethod
+    async def listen(self, session, devtools):
+        """Consume los eventos de la conexión hasta que se cancele."""
@@ -0,0 +1,25 @@
+import os
+
+BASE_URL = os.environ.get("LAPANA_BASE_URL", "http://localhost:3000").rstrip("/")
+API_URL = os.environ.get("NEXT_PUBLIC_API_URL", "http://localhost:8000/api/v1").rstrip("/")
+
+# Credenciales por rol. Se pueden sobreescribir con LAPANA_<ROL>_USERNAME y
+# LAPANA_<ROL>_PASSWORD para apuntar a otro backend.
+DEFAULT_CREDENTIALS = {
+    "ADMIN": ("lucasleone03", "admin12345"),
+    "SELLER": ("vendedor", "vendedor12345"),
+    "DELIVERY": ("repartidor", "repartidor12345"),
+}
+
+ROLES = tuple(DEFAULT_CREDENTIALS)
+
+
+def credentials_for(role):
+    role = role.upper()
+    if role not in DEFAULT_CREDENTIALS:
+        raise ValueError(f"Rol desconocido: {role}")
+    username, password = DEFAULT_CREDENTIALS[role]
+    return (
+        os.environ.get(f"LAPANA_{role}_USERNAME", username),
+        os.environ.get(f"LAPANA_{role}_PASSWORD", password),
+    )
@@ -0,0 +1,184 @@
+import json
+import os
+import time
+import urllib.request
+from urllib.parse import urlsplit
+
+import trio
+from selenium.webdriver.common.bidi import cdp
+
+from .config import BASE_URL, ROLES
+from .session import get_session, inject_session, session_cookies
+
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "app")
+
+# Rutas que middleware.jsx deja ver a cada rol; el resto va a /dashboard.
+# ADMIN ve todo y /dashboard es de todos. Es la especificación contra la que
+# se compara el middleware, por eso no se lee del .jsx.
+ALLOWED_PATHS = {
+    "SELLER": ["/", "/dashboard/products", "/dashboard/expenses", "/dashboard/sales", "/dashboard/profile"],
+    "DELIVERY": ["/dashboard/returns", "/dashboard/delivery", "/dashboard/collect", "/dashboard/profile"],
+}
+
+# None es un contexto sin sesión: todo lo protegido va a /auth/login.
+MATRIX_ROLES = (None,) + ROLES
+
+
+def discover_routes():
+    """``/``, ``/dashboard`` y cada página de app/dashboard (con su ``create`` si tiene)."""
+    routes = ["/", "/dashboard"]
+    dashboard = os.path.join(APP_DIR, "dashboard")
+    for name in sorted(os.listdir(dashboard)):
+        if os.path.exists(os.path.join(dashboard, name, "page.jsx")):
+            routes.append(f"/dashboard/{name}")
+            if os.path.exists(os.path.join(dashboard, name, "create", "page.jsx")):
+                routes.append(f"/dashboard/{name}/create")
+    return routes
+
+
+def expected_path(role, route):
+    if role is None:
+        return "/auth/login"
+    if role == "ADMIN" or route == "/dashboard":
+        return route
+    allowed = ALLOWED_PATHS.get(role, [])
+    if any(route == path or route.startswith(f"{path}/") for path in allowed):
+        return route
+    return "/dashboard"
+
+
+def cdp_endpoint(driver):
+    """WebSocket del navegador y versión mayor de Chrome, para abrir CDP a nivel browser."""
+    address = driver.capabilities["goog:chromeOptions"]["debuggerAddress"]
+    with urllib.request.urlopen(f"http://{address}/json/version", timeout=10) as response:
+        info = json.load(response)
+    return info["webSocketDebuggerUrl"], info["Browser"].split("/")[1].split(".")[0]
+
+
+async def _visit(session, devtools, url, timeout):
+    with trio.fail_after(timeout):
+        async with session.wait_for(devtools.page.LoadEventFired):
+            await session.execute(devtools.page.navigate(url=url))
+    value, _ = await session.execute(devtools.runtime.evaluate(expression="location.pathname", return_by_value=True))
+    return value.value
+
+
+async def _run_context(conn, devtools, role, session, routes, tabs, timeout, results):
+    context_id = await conn.execute(devtools.target.create_browser_context())
+    try:
+        if session:
+            await conn.execute(devtools.storage.set_cookies(
+                cookies=[
+                    devtools.network.CookieParam(name=c["name"], value=c["value"], url=BASE_URL, path=c["path"])
+                    for c in session_cookies(session)
+                ],
+                browser_context_id=context_id,
+            ))
+        pending = list(routes)
+
+        async def tab():
+            target_id = await conn.execute(devtools.target.create_target(url="about:blank", browser_context_id=context_id))
+            async with conn.open_session(target_id) as page:
+                await page.execute(devtools.page.enable())
+                while pending:
+                    route = pending.pop(0)
+                    start = time.perf_counter()
+                    result = {"role": role or "sin sesión", "route": route, "expected": expected_path(role, route)}
+                    try:
+                        result["actual"] = await _visit(page, devtools, f"{BASE_URL}{route}", timeout)
+                    except trio.TooSlowError:
+                        result["actual"] = None
+                        result["error"] = "La página no terminó de cargar."
+                    result["duration"] = time.perf_counter() - start
+                    result["ok"] = result["actual"] == result["expected"]
+                    results.append(result)
+            await conn.execute(devtools.target.close_target(target_id))
+
+        async with trio.open_nursery() as nursery:
+            for _ in range(min(tabs, len(routes))):
+                nursery.start_soon(tab)
+    finally:
+        await conn.execute(devtools.target.dispose_browser_context(context_id))
+
+
+def run_matrix(driver, roles=MATRIX_ROLES, routes=None, tabs=2, timeout=30):
+    """Recorre rol × ruta en contextos aislados (``Target.createBrowserContext``) del mismo Chrome.
+
+    Cada rol tiene su propio contexto con sus cookies, así que las sesiones no
+    se pisan; los contextos, y ``tabs`` pestañas dentro de cada uno, navegan a
+    la vez.
+    """
+    routes = routes or discover_routes()
+    sessions = {role: get_session(role) if role else None for role in roles}
+    ws_url, version = cdp_endpoint(driver)
+    results = []
+
+    async def main():
+        devtools = cdp.import_devtools(version)
+        async with cdp.open_cdp(ws_url) as conn:
+            async with trio.open_nursery() as nursery:
+                for role in roles:
+                    nursery.start_soon(_run_context, conn, devtools, role, sessions[role], routes, tabs, timeout, results)
+
+    start = time.perf_counter()
+    trio.run(main)
+    return _report(results, time.perf_counter() - start)
+
+
+def run_matrix_per_browser(factory, roles=MATRIX_ROLES, routes=None, per_route=True):
+    """El mismo recorrido como los scripts actuales: un Chrome por rol y ruta (o por rol)."""
+    routes = routes or discover_routes()
+    results = []
+    start = time.perf_counter()
+    for role in roles:
+        batches = [[route] for route in routes] if per_route else [routes]
+        for batch in batches:
+            driver = factory()
+            try:
+                if role:
+                    inject_session(driver, get_session(role))
+                for route in batch:
+                    visit_start = time.perf_counter()
+                    driver.get(f"{BASE_URL}{route}")
+                    actual = urlsplit(driver.current_url).path
+                    expected = expected_path(role, route)
+                    results.append({
+                        "role": role or "sin sesión", "route": route, "expected": expected, "actual": actual,
+                        "ok": actual == expected, "duration": time.perf_counter() - visit_start,
+                    })
+            finally:
+                driver.quit()
+    return _report(results, time.perf_counter() - start)
+
+
+def _report(results, wall_time):
+    results.sort(key=lambda r: (r["role"], r["route"]))
+    return {
+        "wall_time": wall_time,
+        "checks": len(results),
+        "failures": [r for r in results if not r["ok"]],
+        "results": results,
+    }
+
+
+def print_matrix(report):
+    routes = sorted({r["route"] for r in report["results"]})
+    roles = sorted({r["role"] for r in report["results"]})
+    cells = {(r["role"], r["route"]): r for r in report["results"]}
+    width = max(len(route) for route in routes) + 2
+    print(f"{'Ruta':<{width}}" + "".join(f"{role:>16}" for role in roles))
+    for route in routes:
+        row = f"{route:<{width}}"
+        for role in roles:
+            cell = cells.get((role, route))
+            if cell is None:
+                mark = "-"
+            else:
+                mark = "permite" if cell["actual"] == route else "→ " + (cell["actual"] or "?")
+                if not cell["ok"]:
+                    mark = "✗ " + mark
+            row += f"{mark:>16}"
+        print(row)
+    print(f"\n{report['checks']} combinaciones en {report['wall_time']:.2f}s, {len(report['failures'])} no coinciden")
+    for failure in report["failures"]:
+        print(f"  {failure['role']} {failure['route']}: esperaba {failure['expected']}, llegó a {failure['actual']}")
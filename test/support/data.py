@@ -0,0 +1,37 @@
+import os
+import uuid
+import zlib
+
+
+class DataNamespace:
+    """Genera datos de prueba únicos para un worker.
+
+    Cada worker del runner recibe su propio prefijo, así dos flujos que crean
+    o editan clientes al mismo tiempo no escriben el mismo nombre o email.
+    """
+
+    def __init__(self, prefix=None):
+        self.prefix = prefix or os.environ.get("LAPANA_DATA_NAMESPACE") or uuid.uuid4().hex[:6]
+        self._counter = 0
+
+    def _next(self):
+        self._counter += 1
+        return f"{self.prefix}-{self._counter}"
+
+    def _digits(self, length):
+        seed = zlib.crc32(self._next().encode())
+        return str(seed).zfill(10)[-length:]
+
+    def name(self, base):
+        return f"{base} {self._next()}"
+
+    def email(self, base):
+        user, domain = base.split("@", 1)
+        return f"{user}+{self._next()}@{domain}"
+
+    def phone(self, base):
+        # Respeta el formato +999999999 que valida el formulario de clientes.
+        return base[:-6] + self._digits(6)
+
+    def barcode(self, base):
+        return base[:-8] + self._digits(8)
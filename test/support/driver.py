@@ -0,0 +1,72 @@
+import os
+import tempfile
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+from .shaping import apply_profile
+
+# Ruta del chromedriver resuelta por Selenium Manager. Se guarda en disco para
+# que los demás procesos de la corrida no vuelvan a resolverla.
+CHROMEDRIVER_CACHE = os.environ.get(
+    "LAPANA_CHROMEDRIVER_CACHE", os.path.join(tempfile.gettempdir(), "lapana-chromedriver-path")
+)
+
+_chromedriver_path = os.environ.get("CHROMEDRIVER")
+
+
+def is_headless():
+    return os.environ.get("LAPANA_HEADLESS", "0") == "1"
+
+
+def captures_network():
+    return os.environ.get("LAPANA_NETWORK_LOG", "0") == "1"
+
+
+def chromedriver_path():
+    global _chromedriver_path
+    if _chromedriver_path is None:
+        try:
+            with open(CHROMEDRIVER_CACHE) as f:
+                path = f.read().strip()
+        except OSError:
+            path = ""
+        if path and os.path.exists(path):
+            _chromedriver_path = path
+    return _chromedriver_path
+
+
+def _remember_chromedriver(path):
+    global _chromedriver_path
+    _chromedriver_path = path
+    tmp_path = f"{CHROMEDRIVER_CACHE}.{os.getpid()}"
+    with open(tmp_path, "w") as f:
+        f.write(path)
+    os.replace(tmp_path, CHROMEDRIVER_CACHE)
+
+
+def create_driver(headless=None, network=None, launch_profile=None):
+    """Lanza Chrome con el perfil de ``support.shaping`` (por defecto, LAPANA_BROWSER_PROFILE)."""
+    if headless is None:
+        headless = is_headless()
+    if network is None:
+        network = captures_network()
+
+    options = Options()
+    if headless:
+        options.add_argument("--headless=new")
+        options.add_argument("--window-size=1920,1080")
+    else:
+        options.add_argument("--start-maximized")
+    if network:
+        # Expone los eventos Network.* y Page.* de CDP en driver.get_log("performance").
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+    path = chromedriver_path()
+    if path:
+        driver = webdriver.Chrome(options=options, service=Service(executable_path=path))
+    else:
+        driver = webdriver.Chrome(options=options)
+        _remember_chromedriver(driver.service.path)
+    return apply_profile(driver, launch_profile)
@@ -0,0 +1,107 @@
+from contextlib import contextmanager
+from urllib.parse import quote
+
+from .api import ApiError, api_request
+from .records import (
+    EXPENSE_CATEGORY,
+    PRODUCT_BRAND,
+    PRODUCT_CATEGORY,
+    SUPPLIER,
+    customer_payload,
+    detail_path,
+    expense_payload,
+    find_by_name,
+    product_payload,
+)
+from .session import get_session
+
+_lookups = {}
+
+
+def lookup(resource, name, token):
+    """Id de la categoría, marca o proveedor ``name``; se consulta una vez por proceso."""
+    if resource not in _lookups:
+        _lookups[resource] = api_request("GET", f"/{resource}/?offset=0&limit=100000", token=token)
+    row = find_by_name(_lookups[resource], name)
+    if row is None:
+        raise LookupError(f"No existe {resource} '{name}'.")
+    return row["id"]
+
+
+def _current(resource, row, token):
+    """El registro como está ahora en la API, o None si ya no existe."""
+    try:
+        return api_request("GET", detail_path(resource, row), token=token)
+    except ApiError as e:
+        if e.status != 404:
+            raise
+    if resource != "products":
+        return None
+    # Editar el nombre cambia el slug: se busca el producto por id.
+    rows = api_request("GET", "/products/?offset=0&limit=100000", token=token)["results"]
+    return next((r for r in rows if r["id"] == row["id"]), None)
+
+
+def _delete(resource, row, token):
+    try:
+        api_request("DELETE", detail_path(resource, row), token=token)
+    except ApiError as e:
+        if e.status != 404:
+            raise
+        current = _current(resource, row, token) if resource == "products" else None
+        if current:
+            api_request("DELETE", detail_path(resource, current), token=token)
+
+
+@contextmanager
+def api_record(resource, payload, role="ADMIN"):
+    """Crea el registro por la API antes del paso de UI y lo borra al salir.
+
+    Si el flujo ya lo borró (los de eliminación), el 404 del borrado se ignora.
+    """
+    token = get_session(role)["access_token"]
+    row = api_request("POST", f"/{resource}/", payload, token)
+    try:
+        yield row
+    finally:
+        _delete(resource, row, token)
+
+
+@contextmanager
+def created_by_ui(resource, name, field="name", role="ADMIN"):
+    """Borra al salir el registro que crea el paso de UI, buscándolo por ``name``.
+
+    ``name`` tiene que venir de ``data`` para no tocar registros de otras corridas.
+    Si el flujo falló antes de guardar, no hay nada que borrar.
+    """
+    token = get_session(role)["access_token"]
+    try:
+        yield
+    finally:
+        rows = api_request("GET", f"/{resource}/?search={quote(name)}&offset=0&limit=100", token=token)
+        row = find_by_name(rows, name, field)
+        if row is not None:
+            _delete(resource, row, token)
+
+
+def product_record(data, role="ADMIN", **overrides):
+    token = get_session(role)["access_token"]
+    category = lookup("product-categories", PRODUCT_CATEGORY, token)
+    brand = lookup("product-brands", PRODUCT_BRAND, token)
+    return api_record("products", product_payload(data, category, brand, **overrides), role)
+
+
+def customer_record(data, role="ADMIN", **overrides):
+    return api_record("customers", customer_payload(data, **overrides), role)
+
+
+def expense_record(data, role="ADMIN", **overrides):
+    token = get_session(role)["access_token"]
+    category = lookup("expense-categories", EXPENSE_CATEGORY, token)
+    supplier = lookup("suppliers", SUPPLIER, token)
+    return api_record("expenses", expense_payload(data, category, supplier, **overrides), role)
+
+
+def fetch(resource, row, role="ADMIN"):
+    """Vuelve a leer ``row`` de la API (después del paso de UI); None si se borró."""
+    return _current(resource, row, get_session(role)["access_token"])
@@ -0,0 +1,13 @@
+from .data import DataNamespace
+from .driver import create_driver
+
+
+def run_script(run):
+    """Ejecuta un flujo como script independiente, con su propio navegador."""
+    driver = create_driver()
+    try:
+        run(driver, DataNamespace())
+    except Exception as e:
+        print("Ocurrió un error:", e)
+    finally:
+        driver.quit()
@@ -0,0 +1,81 @@
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+
+from .waits import DEFAULT_TIMEOUT, select_all_key, wait_for
+
+# Completa todos los campos en un solo round trip. React escucha los eventos
+# nativos, así que el valor se asigna con el setter del prototipo (el de la
+# instancia lo intercepta React) y después se disparan input y change.
+_FILL_SCRIPT = """
+const values = arguments[0];
+const find = (key) => {
+  const fields = [...document.querySelectorAll("input, textarea")];
+  return fields.find((el) => el.getAttribute("aria-label") === key)
+    || fields.find((el) => el.getAttribute("placeholder") === key)
+    || fields.find((el) => (el.getAttribute("placeholder") || "").startsWith(key));
+};
+const missing = [];
+for (const [key, value] of Object.entries(values)) {
+  const el = find(key);
+  if (!el) { missing.push(key); continue; }
+  const proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+  Object.getOwnPropertyDescriptor(proto, "value").set.call(el, value);
+  el.dispatchEvent(new Event("input", { bubbles: true }));
+  el.dispatchEvent(new Event("change", { bubbles: true }));
+}
+return missing;
+"""
+
+
+_FIND_FIELD = """
+const fields = [...document.querySelectorAll("input, textarea")];
+const el = fields.find((el) => el.getAttribute("aria-label") === args.key)
+  || fields.find((el) => el.getAttribute("placeholder") === args.key)
+  || fields.find((el) => (el.getAttribute("placeholder") || "").startsWith(args.key));
+return el && (!args.filled || el.value) ? el : null;
+"""
+
+
+def wait_for_field(driver, key, filled=False, timeout=DEFAULT_TIMEOUT):
+    """Espera al campo ``key``; con ``filled`` también a que el formulario lo haya cargado."""
+    return wait_for(
+        driver,
+        _FIND_FIELD,
+        args={"key": key, "filled": filled},
+        timeout=timeout,
+        message=f"No apareció el campo '{key}'.",
+    )
+
+
+def find_field(driver, key):
+    return driver.find_element(
+        By.XPATH,
+        f"(//input|//textarea)[@aria-label='{key}' or @placeholder='{key}' or starts-with(@placeholder, '{key}')]",
+    )
+
+
+def clear_and_type(element, text):
+    """Reemplaza el valor de un campo tecleando, como lo haría el usuario."""
+    element.click()
+    element.send_keys(select_all_key() + "a")
+    element.send_keys(Keys.DELETE)
+    element.send_keys(text)
+
+
+def fill_form(driver, values, typed=()):
+    """Completa los campos de ``values`` (aria-label o placeholder -> valor).
+
+    Los campos en ``typed`` se completan tecla por tecla, para los casos en
+    que lo que se prueba es justamente el comportamiento al escribir.
+    """
+    direct = {key: str(value) for key, value in values.items() if key not in typed}
+    if direct:
+        missing = driver.execute_script(_FILL_SCRIPT, direct)
+        if missing:
+            raise ValueError(f"No se encontraron los campos: {', '.join(missing)}")
+    for key in typed:
+        clear_and_type(find_field(driver, key), str(values[key]))
+
+
+def read_form(driver, keys):
+    return {key: find_field(driver, key).get_attribute("value") for key in keys}
@@ -0,0 +1,366 @@
+import base64
+import glob
+import hashlib
+import json
+import mmap
+import os
+import random
+import threading
+import time
+import uuid
+import zlib
+from contextlib import ExitStack, contextmanager
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import trio
+
+from . import api
+from .cdp import CdpThread
+from .config import API_URL
+from .data import DataNamespace
+
+API_ORIGIN = "{0.scheme}://{0.netloc}".format(urlsplit(API_URL))
+
+# Encabezados que no se guardan: el cuerpo queda decodificado y Chrome
+# recalcula el largo al servir la respuesta.
+SKIPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "keep-alive"}
+
+META_FILE = "meta.json"
+
+
+def request_key(method, url, body=b""):
+    """Clave de un pedido: método, ruta, query ordenada y hash del cuerpo."""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    if isinstance(body, str):
+        body = body.encode()
+    body_hash = hashlib.sha1(body).hexdigest()[:16] if body else ""
+    return [method.upper(), parts.path, query, body_hash]
+
+
+def flow_slug(flow):
+    return flow[:-3].replace(os.sep, "__").replace("/", "__") if flow.endswith(".py") else flow
+
+
+def parse_latency(text):
+    """``None``, ``"recorded"`` (la latencia grabada) o una cantidad fija de ms, p. ej. ``"80+40"``."""
+    if not text:
+        return None
+    if text == "recorded":
+        return text
+    base, _, jitter = text.partition("+")
+    return (float(base), float(jitter or 0))
+
+
+def prepare_archive(directory):
+    """Crea o vacía el directorio de grabación y anota el prefijo de datos de la corrida."""
+    os.makedirs(directory, exist_ok=True)
+    for path in glob.glob(os.path.join(directory, "*.json")) + glob.glob(os.path.join(directory, "*.bin")):
+        os.remove(path)
+    meta = {"prefix": f"har{uuid.uuid4().hex[:4]}", "api_url": API_URL, "created_at": time.time()}
+    with open(os.path.join(directory, META_FILE), "w") as f:
+        json.dump(meta, f, indent=2)
+    return meta
+
+
+def read_meta(directory):
+    with open(os.path.join(directory, META_FILE)) as f:
+        return json.load(f)
+
+
+def flow_data(directory, flow):
+    """``DataNamespace`` fijo por flujo, así la reproducción manda los mismos cuerpos que la grabación."""
+    prefix = read_meta(directory)["prefix"]
+    return DataNamespace(f"{prefix}{zlib.crc32(flow.encode()) % 10000:04d}")
+
+
+class ArchiveWriter:
+    """Graba las respuestas de un flujo: índice en ``<flujo>.json``, cuerpos en ``<flujo>.bin``."""
+
+    def __init__(self, directory, flow):
+        self.flow = flow
+        self._base = os.path.join(directory, flow_slug(flow))
+        self._bodies = open(f"{self._base}.bin", "wb")
+        self._lock = threading.Lock()
+        self.entries = []
+
+    def add(self, source, method, url, body, status, headers, payload, elapsed_ms):
+        headers = [[name, value] for name, value in headers if name.lower() not in SKIPPED_HEADERS]
+        with self._lock:
+            offset = self._bodies.tell()
+            self._bodies.write(payload)
+            self.entries.append({
+                "source": source,
+                "key": request_key(method, url, body),
+                "url": url,
+                "status": status,
+                "headers": headers,
+                "offset": offset,
+                "size": len(payload),
+                "time_ms": round(elapsed_ms, 2),
+            })
+
+    def close(self):
+        with self._lock:
+            self._bodies.close()
+            tmp_path = f"{self._base}.json.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump({"flow": self.flow, "entries": self.entries}, f)
+            os.replace(tmp_path, f"{self._base}.json")
+        return len(self.entries)
+
+
+class Archive:
+    """Respuestas grabadas, servidas desde los ``.bin`` mapeados en memoria.
+
+    Un pedido se busca primero en la grabación de su flujo con el cuerpo
+    exacto, después sin mirar el cuerpo (fechas del día, por ejemplo) y por
+    último en la de cualquier flujo (el login, que se graba una sola vez). Las
+    respuestas de una misma clave se sirven en el orden en que se grabaron; la
+    última se repite.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._segments = {}
+        self._files = []
+        self._cursors = {}
+        self._all = None
+        self._lock = threading.Lock()
+        self.served = 0
+        self.misses = []
+
+    def _segment(self, slug):
+        if slug not in self._segments:
+            base = os.path.join(self.directory, slug)
+            try:
+                with open(f"{base}.json") as f:
+                    entries = json.load(f)["entries"]
+            except FileNotFoundError:
+                entries = []
+            body = b""
+            if os.path.exists(f"{base}.bin") and os.path.getsize(f"{base}.bin"):
+                f = open(f"{base}.bin", "rb")
+                self._files.append(f)
+                body = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._segments[slug] = (entries, body)
+        return self._segments[slug]
+
+    def _slugs(self):
+        if self._all is None:
+            self._all = sorted(
+                os.path.basename(path)[:-5]
+                for path in glob.glob(os.path.join(self.directory, "*.json"))
+                if os.path.basename(path) != META_FILE
+            )
+        return self._all
+
+    def match(self, flow, method, url, body=b""):
+        """Devuelve ``(status, headers, bytes, time_ms)`` o None si no hay grabación."""
+        key = request_key(method, url, body)
+        own = [flow_slug(flow)]
+        with self._lock:
+            for slugs, exact in ((own, True), (own, False), (self._slugs(), True), (self._slugs(), False)):
+                candidates = [
+                    (entry, self._segment(slug)[1])
+                    for slug in slugs
+                    for entry in self._segment(slug)[0]
+                    if entry["key"] == key or (not exact and entry["key"][:3] == key[:3])
+                ]
+                if not candidates:
+                    continue
+                cursor = (tuple(slugs), exact, tuple(key if exact else key[:3]))
+                index = self._cursors.get(cursor, 0)
+                self._cursors[cursor] = index + 1
+                entry, bodies = candidates[min(index, len(candidates) - 1)]
+                self.served += 1
+                payload = bodies[entry["offset"]:entry["offset"] + entry["size"]] if entry["size"] else b""
+                return entry["status"], entry["headers"], payload, entry["time_ms"]
+            self.misses.append(" ".join(key[:3]).strip())
+            return None
+
+    def close(self):
+        for _, body in self._segments.values():
+            if isinstance(body, mmap.mmap):
+                body.close()
+        for f in self._files:
+            f.close()
+        self._segments.clear()
+        self._files.clear()
+
+
+def _delay(latency, recorded_ms, rng=random):
+    if latency is None:
+        return 0
+    if latency == "recorded":
+        return recorded_ms / 1000
+    base, jitter = latency
+    return (base + rng.uniform(0, jitter)) / 1000
+
+
+@contextmanager
+def python_hook(flow, writer=None, archive=None, latency=None):
+    """Graba o reproduce los pedidos que hace ``support.api`` (login, fixtures)."""
+    original = api.transport
+
+    def recording(method, url, body, headers, timeout):
+        start = time.perf_counter()
+        status, payload = original(method, url, body, headers, timeout)
+        writer.add(
+            "python", method, url, body or b"", status,
+            [("Content-Type", "application/json")], payload, (time.perf_counter() - start) * 1000,
+        )
+        return status, payload
+
+    def replaying(method, url, body, headers, timeout):
+        response = archive.match(flow, method, url, body or b"")
+        if response is None:
+            return 504, json.dumps({"detail": f"Sin grabación para {method} {url}"}).encode()
+        status, _, payload, time_ms = response
+        time.sleep(_delay(latency, time_ms))
+        return status, bytes(payload)
+
+    api.transport = recording if writer is not None else replaying
+    try:
+        yield
+    finally:
+        api.transport = original
+
+
+class BrowserInterceptor(CdpThread):
+    """Intercepta con ``Fetch.requestPaused`` los pedidos del navegador a la API.
+
+    Al grabar deja pasar cada pedido y guarda la respuesta; al reproducir la
+    responde con ``Fetch.fulfillRequest`` sin tocar la red.
+    """
+
+    def __init__(self, driver, flow, writer=None, archive=None, latency=None):
+        super().__init__(driver)
+        self.flow = flow
+        self.writer = writer
+        self.archive = archive
+        self.latency = latency
+        self._started = {}
+
+    async def setup(self, session, devtools):
+        fetch = devtools.fetch
+        stages = [fetch.RequestStage.REQUEST]
+        if self.writer is not None:
+            stages.append(fetch.RequestStage.RESPONSE)
+        patterns = [fetch.RequestPattern(url_pattern=f"{API_ORIGIN}/*", request_stage=stage) for stage in stages]
+        await session.execute(fetch.enable(patterns=patterns))
+
+    async def listen(self, session, devtools):
+        async with trio.open_nursery() as nursery:
+            async for event in session.listen(devtools.fetch.RequestPaused):
+                nursery.start_soon(self._handle, session, devtools.fetch, event)
+
+    async def _handle(self, session, fetch, event):
+        request = event.request
+        body = (request.post_data or "").encode()
+        request_id = event.request_id
+        if self.writer is not None:
+            tracking_id = event.network_id or request_id
+            if event.response_status_code is None:
+                self._started[tracking_id] = time.perf_counter()
+                await session.execute(fetch.continue_request(request_id=request_id))
+                return
+            elapsed = (time.perf_counter() - self._started.pop(tracking_id, time.perf_counter())) * 1000
+            try:
+                content, encoded = await session.execute(fetch.get_response_body(request_id=request_id))
+                payload = base64.b64decode(content) if encoded else content.encode()
+            except Exception:
+                # Redirecciones y 204 no tienen cuerpo.
+                payload = b""
+            headers = [(h.name, h.value) for h in event.response_headers or []]
+            self.writer.add("browser", request.method, request.url, body, event.response_status_code, headers, payload, elapsed)
+            await session.execute(fetch.continue_request(request_id=request_id))
+            return
+
+        response = self.archive.match(self.flow, request.method, request.url, body)
+        if response is None and request.method == "OPTIONS":
+            response = self._preflight(request)
+        if response is None:
+            response = (504, [("Content-Type", "application/json")],
+                        json.dumps({"detail": "Sin grabación para este pedido."}).encode(), 0)
+        status, headers, payload, time_ms = response
+        delay = _delay(self.latency, time_ms)
+        if delay:
+            await trio.sleep(delay)
+        await session.execute(fetch.fulfill_request(
+            request_id=request_id,
+            response_code=status,
+            response_headers=[fetch.HeaderEntry(name=name, value=value) for name, value in headers],
+            body=base64.b64encode(bytes(payload)).decode(),
+        ))
+
+    @staticmethod
+    def _preflight(request):
+        # Si la grabación no tiene el preflight de CORS se responde uno permisivo.
+        headers = {key.lower(): value for key, value in dict(request.headers).items()}
+        return 204, [
+            ("Access-Control-Allow-Origin", headers.get("origin", "*")),
+            ("Access-Control-Allow-Credentials", "true"),
+            ("Access-Control-Allow-Methods", headers.get("access-control-request-method", "GET")),
+            ("Access-Control-Allow-Headers", headers.get("access-control-request-headers", "*")),
+        ], b"", 0
+
+
+def har_mode():
+    """``("record" | "replay", directorio)`` según el entorno, o None."""
+    if os.environ.get("LAPANA_HAR_RECORD"):
+        return "record", os.environ["LAPANA_HAR_RECORD"]
+    if os.environ.get("LAPANA_HAR_REPLAY"):
+        return "replay", os.environ["LAPANA_HAR_REPLAY"]
+    return None
+
+
+class HarSession:
+    """Graba o reproduce la red de un flujo: pedidos del navegador y de ``support.api``."""
+
+    def __init__(self, driver, flow, mode, directory, latency=None):
+        self.flow = flow
+        self.mode = mode
+        self.directory = directory
+        self.data = flow_data(directory, flow)
+        self.writer = ArchiveWriter(directory, flow) if mode == "record" else None
+        self.archive = Archive(directory) if mode == "replay" else None
+        self.latency = latency
+        self.browser = BrowserInterceptor(driver, flow, self.writer, self.archive, latency)
+        self._stack = ExitStack()
+
+    @classmethod
+    def from_env(cls, driver, flow):
+        mode = har_mode()
+        if mode is None:
+            return None
+        return cls(driver, flow, *mode, latency=parse_latency(os.environ.get("LAPANA_HAR_LATENCY")))
+
+    def start(self):
+        with ExitStack() as stack:
+            stack.enter_context(python_hook(self.flow, self.writer, self.archive, self.latency))
+            self.browser.start()
+            stack.callback(self.browser.stop)
+            self._stack = stack.pop_all()
+        return self
+
+    def stop(self):
+        self._stack.close()
+        if self.writer is not None:
+            return {"mode": "record", "recorded": self.writer.close()}
+        self.archive.close()
+        return {"mode": "replay", "served": self.archive.served, "misses": self.archive.misses}
+
+
+def print_har_summary(results):
+    print()
+    for result in results:
+        har = result.get("har")
+        if not har:
+            continue
+        if har["mode"] == "record":
+            print(f"{result['flow']}: {har['recorded']} respuestas grabadas")
+        else:
+            print(f"{result['flow']}: {har['served']} respuestas servidas, {len(har['misses'])} sin grabación")
+            for miss in sorted(set(har["misses"])):
+                print(f"    {miss}")
@@ -0,0 +1,154 @@
+import asyncio
+import json
+import ssl
+from urllib.parse import urlsplit
+
+from .api import ApiError
+from .config import API_URL, credentials_for
+
+
+def _decode(payload):
+    if not payload:
+        return None
+    try:
+        return json.loads(payload)
+    except ValueError:
+        return payload.decode(errors="replace")
+
+
+class AsyncClient:
+    """Cliente HTTP/1.1 sobre asyncio que reutiliza conexiones keep-alive.
+
+    Mantiene hasta ``size`` conexiones abiertas contra la API; los pedidos
+    esperan a que se libere una en lugar de abrir conexiones nuevas, como haría
+    un navegador o un pool de ``requests``. Sólo usa la biblioteca estándar.
+    """
+
+    def __init__(self, base_url=API_URL, size=10, timeout=10):
+        parts = urlsplit(base_url)
+        self.host = parts.hostname
+        self.netloc = parts.netloc
+        self.port = parts.port or (443 if parts.scheme == "https" else 80)
+        self.prefix = parts.path.rstrip("/")
+        self.ssl = ssl.create_default_context() if parts.scheme == "https" else None
+        self.size = size
+        self.timeout = timeout
+        self.stats = {"connections": 0, "reused": 0, "requests": 0}
+        self._idle = []
+        self._slots = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def _connect(self):
+        reader, writer = await asyncio.open_connection(self.host, self.port, ssl=self.ssl)
+        self.stats["connections"] += 1
+        return reader, writer
+
+    @staticmethod
+    def _drop(conn):
+        conn[1].close()
+
+    async def _roundtrip(self, conn, method, path, body, headers):
+        reader, writer = conn
+        lines = [f"{method} {self.prefix}{path} HTTP/1.1", f"Host: {self.netloc}", "Connection: keep-alive"]
+        lines += [f"{key}: {value}" for key, value in headers.items()]
+        lines.append(f"Content-Length: {len(body)}")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError("La conexión se cerró antes de la respuesta.")
+        status = int(status_line.split()[1])
+        response_headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            key, _, value = line.decode("latin-1").partition(":")
+            response_headers[key.strip().lower()] = value.strip()
+
+        keep_alive = response_headers.get("connection", "").lower() != "close"
+        if method == "HEAD" or status in (204, 304):
+            payload = b""
+        elif "content-length" in response_headers:
+            payload = await reader.readexactly(int(response_headers["content-length"]))
+        elif response_headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    await reader.readline()
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+            payload = b"".join(chunks)
+        else:
+            payload = await reader.read()
+            keep_alive = False
+        return status, payload, keep_alive
+
+    async def request(self, method, path, data=None, token=None):
+        """Devuelve ``(status, payload)`` sin levantar excepción por el código HTTP."""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.size)
+        headers = {"Accept": "application/json"}
+        body = b""
+        if data is not None:
+            body = json.dumps(data).encode()
+            headers["Content-Type"] = "application/json"
+        if token:
+            headers["Authorization"] = f"Token {token}"
+
+        async with self._slots:
+            conn = self._idle.pop() if self._idle else None
+            reused = conn is not None
+            if conn is None:
+                conn = await self._connect()
+            try:
+                result = await asyncio.wait_for(self._roundtrip(conn, method, path, body, headers), self.timeout)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                self._drop(conn)
+                if not reused:
+                    raise
+                # El servidor cerró la conexión ociosa: se reintenta con una nueva.
+                conn = await self._connect()
+                reused = False
+                try:
+                    result = await asyncio.wait_for(self._roundtrip(conn, method, path, body, headers), self.timeout)
+                except BaseException:
+                    self._drop(conn)
+                    raise
+            except BaseException:
+                self._drop(conn)
+                raise
+            status, payload, keep_alive = result
+            self.stats["requests"] += 1
+            self.stats["reused"] += reused
+            if keep_alive:
+                self._idle.append(conn)
+            else:
+                self._drop(conn)
+        return status, _decode(payload)
+
+    async def call(self, method, path, data=None, token=None):
+        """Como ``support.api.api_request``: devuelve el JSON o levanta ``ApiError``."""
+        status, payload = await self.request(method, path, data, token)
+        if status >= 400:
+            raise ApiError(status, payload if isinstance(payload, str) else json.dumps(payload))
+        return payload
+
+    async def close(self):
+        while self._idle:
+            self._drop(self._idle.pop())
+
+
+async def login(client, role="ADMIN"):
+    """Inicia sesión con las credenciales del rol y devuelve el token."""
+    username, password = credentials_for(role)
+    data = await client.call("POST", "/users/login/", {"username": username, "password": password})
+    return data["access_token"]
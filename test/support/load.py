@@ -0,0 +1,304 @@
+import asyncio
+import datetime
+import math
+import random
+import time
+from collections import Counter, defaultdict
+from urllib.parse import urlencode
+
+from .config import API_URL
+from .http import AsyncClient, login
+
+# Estados que lista /dashboard/sales por defecto (DEFAULT_STATE_FILTERS).
+SALE_STATES = "creada,pendiente_entrega,entregada,cobrada,cobrada_parcial"
+SALES_ORDERINGS = [None, None, "-date", "date", "customer__name", "-total", "user__username"]
+PAYMENT_METHODS = ["efectivo", "efectivo", "tarjeta", "transferencia", "qr"]
+SEARCH_TERMS = ["pan", "fact", "tor", "gall", "med", "cro", "bizc", "pre"]
+ROWS_PER_PAGE = 10
+# Tecleo del cajero (media y desvío entre teclas, ms) y espera de useSearch.
+KEY_INTERVAL_MS = (180, 70)
+SEARCH_DEBOUNCE_MS = 250
+
+# Peso de cada escenario en la mezcla de tráfico. Los que modifican datos se
+# pueden apagar con ``read_only`` para correr contra staging.
+DEFAULT_MIX = {
+    "pos_open": 3,
+    "pos_sale": 15,
+    "pos_fast_sale": 10,
+    "sales_list": 25,
+    "statistics": 8,
+    "product_lookup": 20,
+    "collect": 7,
+    "deliver": 7,
+}
+MUTATING = ("pos_sale", "pos_fast_sale", "collect", "deliver")
+SCENARIO_ROLES = {
+    "pos_open": "SELLER",
+    "pos_sale": "SELLER",
+    "pos_fast_sale": "SELLER",
+    "sales_list": "SELLER",
+    "product_lookup": "SELLER",
+    "statistics": "ADMIN",
+    "collect": "DELIVERY",
+    "deliver": "DELIVERY",
+}
+
+
+def parse_mix(text):
+    """Parsea ``"pos_sale=30,statistics=0"`` sobre la mezcla por defecto."""
+    mix = dict(DEFAULT_MIX)
+    for item in filter(None, (text or "").split(",")):
+        name, _, weight = item.partition("=")
+        if name not in mix:
+            raise ValueError(f"Escenario desconocido: {name}")
+        mix[name] = float(weight)
+    return mix
+
+
+def percentile(values, p):
+    if not values:
+        return 0
+    ordered = sorted(values)
+    rank = math.ceil(p / 100 * len(ordered))
+    return ordered[max(0, min(len(ordered), rank) - 1)]
+
+
+class LoadStats:
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.statuses = defaultdict(Counter)
+        self.scenarios = Counter()
+
+    def record(self, endpoint, ms, status):
+        self.latencies[endpoint].append(ms)
+        self.statuses[endpoint][status] += 1
+
+    def summary(self, elapsed):
+        endpoints = {}
+        for endpoint, values in sorted(self.latencies.items()):
+            statuses = self.statuses[endpoint]
+            errors = sum(count for status, count in statuses.items() if status == 0 or status >= 400)
+            endpoints[endpoint] = {
+                "requests": len(values),
+                "errors": errors,
+                "rps": len(values) / elapsed if elapsed else 0,
+                "mean": sum(values) / len(values),
+                "p50": percentile(values, 50),
+                "p95": percentile(values, 95),
+                "p99": percentile(values, 99),
+                "max": max(values),
+                "statuses": {str(status): count for status, count in statuses.items()},
+            }
+        total = sum(e["requests"] for e in endpoints.values())
+        return {
+            "requests": total,
+            "errors": sum(e["errors"] for e in endpoints.values()),
+            "rps": total / elapsed if elapsed else 0,
+            "scenarios": dict(self.scenarios),
+            "endpoints": endpoints,
+        }
+
+
+class Catalog:
+    """Productos y clientes existentes, para armar pedidos válidos."""
+
+    def __init__(self, products, customers):
+        self.products = products
+        self.customers = customers
+
+    @classmethod
+    async def load(cls, client, token, size=200):
+        products = await client.call("GET", f"/products/?offset=0&limit={size}", token=token)
+        customers = await client.call("GET", f"/customers/?offset=0&limit={size}", token=token)
+        return cls(products["results"], customers["results"])
+
+
+class VirtualUser:
+    """Un usuario simulado que elige escenarios según la mezcla y espera entre uno y otro."""
+
+    def __init__(self, index, client, stats, catalog, tokens, mix, think, seed=0):
+        self.index = index
+        self.client = client
+        self.stats = stats
+        self.catalog = catalog
+        self.tokens = tokens
+        self.names = [name for name, weight in mix.items() if weight > 0]
+        self.weights = [mix[name] for name in self.names]
+        self.think = think
+        self.rng = random.Random(f"{seed}-{index}")
+        self.role = None
+
+    async def call(self, endpoint, method, path, data=None):
+        start = time.perf_counter()
+        try:
+            status, payload = await self.client.request(method, path, data, self.tokens[self.role])
+        except (OSError, asyncio.TimeoutError, ValueError):
+            status, payload = 0, None
+        self.stats.record(endpoint, (time.perf_counter() - start) * 1000, status)
+        return status, payload
+
+    async def run(self, delay, deadline):
+        await asyncio.sleep(delay)
+        while time.perf_counter() < deadline:
+            scenario = self.rng.choices(self.names, self.weights)[0]
+            self.role = SCENARIO_ROLES[scenario]
+            self.stats.scenarios[scenario] += 1
+            await getattr(self, scenario)()
+            if self.think:
+                pause = self.rng.expovariate(1 / self.think)
+                await asyncio.sleep(min(pause, max(0, deadline - time.perf_counter())))
+
+    # -- Escenarios ---------------------------------------------------------
+
+    async def pos_open(self):
+        # Los selectores del POS (SearchPicker.jsx) piden la primera página al abrirse.
+        await asyncio.gather(
+            self.call("GET /products/?search=", "GET", "/products/?search=&offset=0&limit=20"),
+            self.call("GET /customers/?search=", "GET", "/customers/?search=&offset=0&limit=20"),
+        )
+
+    def _sale_header(self):
+        customer = self.rng.choice(self.catalog.customers) if self.catalog.customers and self.rng.random() < 0.3 else None
+        return {
+            "date": datetime.date.today().isoformat(),
+            "customer": customer["id"] if customer else "",
+            "payment_method": self.rng.choice(PAYMENT_METHODS),
+            "sale_type": customer.get("customer_type", "minorista") if customer else "minorista",
+        }
+
+    async def pos_sale(self):
+        if not self.catalog.products:
+            return await self.pos_fast_sale()
+        sale = self._sale_header()
+        details = []
+        for product in self.rng.sample(self.catalog.products, min(len(self.catalog.products), self.rng.randint(1, 4))):
+            price = float(product["wholesale_price"] if sale["sale_type"] == "mayorista" else product["retail_price"])
+            quantity = self.rng.randint(1, 6)
+            details.append({"product": product["id"], "price": price, "quantity": quantity, "subtotal": price * quantity})
+        sale["sale_details"] = details
+        await self.call("POST /sales/", "POST", "/sales/", sale)
+
+    async def pos_fast_sale(self):
+        sale = self._sale_header()
+        sale["total"] = round(self.rng.uniform(500, 20000), 2)
+        await self.call("POST /sales/create-fast-sale/", "POST", "/sales/create-fast-sale/", sale)
+
+    async def sales_list(self):
+        # Igual que useSales: filtros de la página, después offset y limit.
+        params = {"state": SALE_STATES}
+        if self.rng.random() < 0.2:
+            params["search"] = self.rng.choice(SEARCH_TERMS)
+        ordering = self.rng.choice(SALES_ORDERINGS)
+        if ordering:
+            params["ordering"] = ordering
+        page = 1 if self.rng.random() < 0.7 else self.rng.randint(2, 10)
+        params["offset"] = (page - 1) * ROWS_PER_PAGE
+        params["limit"] = ROWS_PER_PAGE
+        await self.call("GET /sales/", "GET", f"/sales/?{urlencode(params)}")
+
+    async def statistics(self):
+        today = datetime.date.today()
+        period = self.rng.choice(["today", "week", "month", "year", "custom"])
+        if period == "today":
+            query = "today"
+        elif period == "week":
+            year, week, _ = today.isocalendar()
+            query = f"week={year}-W{week:02d}"
+        elif period == "month":
+            query = f"month={today:%Y-%m}"
+        elif period == "year":
+            query = f"year={today.year}"
+        else:
+            start = today - datetime.timedelta(days=self.rng.randint(7, 60))
+            query = f"start_date={start.isoformat()}&end_date={today.isoformat()}"
+        await self.call(f"GET /sales/statistics/ ({period})", "GET", f"/sales/statistics/?{query}")
+
+    async def product_lookup(self):
+        if self.catalog.products and self.rng.random() < 0.5:
+            product = self.rng.choice(self.catalog.products)
+            await self.call("GET /products/{slug}/", "GET", f"/products/{product['slug']}/")
+        else:
+            # useSearch sólo pide cuando pasan SEARCH_DEBOUNCE_MS sin teclas:
+            # el término completo y algún prefijo en el que el cajero se demoró.
+            term = self.rng.choice(SEARCH_TERMS)
+            for length in range(1, len(term) + 1):
+                pause = max(40, self.rng.gauss(*KEY_INTERVAL_MS))
+                if length == len(term) or pause >= SEARCH_DEBOUNCE_MS:
+                    query = urlencode({"search": term[:length], "offset": 0, "limit": 20})
+                    await self.call("GET /products/?search=", "GET", f"/products/?{query}")
+
+    async def collect(self):
+        status, payload = await self.call(
+            "GET /sales/list-by-customer-for-collect/", "GET", "/sales/list-by-customer-for-collect/?offset=0&limit=10"
+        )
+        customers = (payload or {}).get("customers", []) if status == 200 and isinstance(payload, dict) else []
+        sales = [sale for customer in customers for sale in customer["sales_to_collect"]]
+        if not sales:
+            return
+        sale = self.rng.choice(sales)
+        if self.rng.random() < 0.7:
+            await self.call("POST /sales/{id}/mark-as-charged/", "POST", f"/sales/{sale['id']}/mark-as-charged/", {})
+        else:
+            amount = round(float(sale["total_to_collect"]) / 2, 2)
+            await self.call(
+                "POST /sales/{id}/mark-as-partial-charged/",
+                "POST",
+                f"/sales/{sale['id']}/mark-as-partial-charged/",
+                {"total": amount},
+            )
+
+    async def deliver(self):
+        # delivery/page.jsx usa useSales(salesFilters) con offset=0 y limit=0.
+        query = urlencode({"needs_delivery": "true", "state": "pendiente_entrega", "offset": 0, "limit": 0})
+        status, payload = await self.call("GET /sales/?needs_delivery=true", "GET", f"/sales/?{query}")
+        sales = (payload or {}).get("results", []) if status == 200 and isinstance(payload, dict) else []
+        if not sales:
+            return
+        sale = self.rng.choice(sales)
+        await self.call("POST /sales/{id}/mark-as-delivered/", "POST", f"/sales/{sale['id']}/mark-as-delivered/")
+        if self.rng.random() < 0.5:
+            await self.call("POST /sales/{id}/mark-as-charged/", "POST", f"/sales/{sale['id']}/mark-as-charged/")
+
+
+async def run_load(base_url=API_URL, users=10, duration=60, think=1.0, mix=None, seed=0, connections=None, ramp_up=0):
+    """Corre ``users`` usuarios virtuales durante ``duration`` segundos y devuelve el reporte."""
+    mix = mix or dict(DEFAULT_MIX)
+    stats = LoadStats()
+    async with AsyncClient(base_url, size=connections or users) as client:
+        roles = sorted({SCENARIO_ROLES[name] for name, weight in mix.items() if weight > 0} | {"ADMIN"})
+        tokens = dict(zip(roles, await asyncio.gather(*(login(client, role) for role in roles))))
+        catalog = await Catalog.load(client, tokens["ADMIN"])
+
+        start = time.perf_counter()
+        deadline = start + duration
+        vus = [VirtualUser(i, client, stats, catalog, tokens, mix, think, seed) for i in range(users)]
+        await asyncio.gather(*(vu.run(ramp_up * i / users, deadline) for i, vu in enumerate(vus)))
+        elapsed = time.perf_counter() - start
+        connections_stats = dict(client.stats)
+
+    return {
+        "base_url": base_url,
+        "users": users,
+        "duration": duration,
+        "elapsed": elapsed,
+        "think": think,
+        "mix": mix,
+        "connections": connections_stats,
+        **stats.summary(elapsed),
+    }
+
+
+def print_load_report(report):
+    print(
+        f"{report['users']} usuarios, {report['elapsed']:.1f}s contra {report['base_url']}: "
+        f"{report['requests']} pedidos ({report['rps']:.1f}/s), {report['errors']} errores"
+    )
+    connections = report["connections"]
+    print(f"Conexiones abiertas: {connections['connections']}  pedidos sobre conexiones reutilizadas: {connections['reused']}")
+    print()
+    print(f"{'Endpoint':<52}{'Pedidos':>8}{'Err':>6}{'req/s':>8}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}")
+    for endpoint, e in report["endpoints"].items():
+        print(
+            f"{endpoint:<52}{e['requests']:>8}{e['errors']:>6}{e['rps']:>8.1f}"
+            f"{e['p50']:>7.0f}ms{e['p95']:>7.0f}ms{e['p99']:>7.0f}ms{e['max']:>7.0f}ms"
+        )
@@ -0,0 +1,176 @@
+import fnmatch
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import TimeoutException
+
+from .cdp import CdpThread
+from .config import API_URL
+from .profiler import span
+from .waits import DEFAULT_TIMEOUT
+
+API_PREFIX = urlsplit(API_URL).path.rstrip("/")
+
+# Pedidos que quedan abiertos por diseño y nunca dejarían la red ociosa.
+LONG_LIVED_TYPES = {"EventSource", "WebSocket"}
+
+
+class NetworkWatcher(CdpThread):
+    """Sigue los eventos ``Network.*`` de la pestaña para esperar respuestas concretas.
+
+    Las esperas se despiertan con cada evento (no hay intervalo de sondeo) y
+    sólo aceptan respuestas llegadas después de la marca de la espera, así un
+    prefijo de URL que ya estaba no la da por cumplida.
+    """
+
+    def __init__(self, driver):
+        super().__init__(driver)
+        self._changed = threading.Condition()
+        self._pending = {}
+        self._responses = []
+        self._last_activity = time.perf_counter()
+
+    async def setup(self, session, devtools):
+        await session.execute(devtools.network.enable())
+
+    async def listen(self, session, devtools):
+        network = devtools.network
+        events = (network.RequestWillBeSent, network.ResponseReceived, network.LoadingFinished, network.LoadingFailed)
+        async for event in session.listen(*events):
+            with self._changed:
+                self._last_activity = time.perf_counter()
+                if isinstance(event, network.RequestWillBeSent):
+                    kind = event.type_.value if event.type_ else ""
+                    if kind not in LONG_LIVED_TYPES:
+                        self._pending[event.request_id] = {"method": event.request.method, "url": event.request.url}
+                elif isinstance(event, network.ResponseReceived):
+                    request = self._pending.get(event.request_id, {})
+                    self._responses.append({
+                        "seq": len(self._responses) + 1,
+                        "method": request.get("method", ""),
+                        "url": event.response.url,
+                        "status": event.response.status,
+                        "time": self._last_activity,
+                    })
+                else:
+                    self._pending.pop(event.request_id, None)
+                self._changed.notify_all()
+
+    def clear(self):
+        """Olvida las respuestas y pedidos vistos; las marcas anteriores dejan de valer."""
+        with self._changed:
+            self._responses.clear()
+            self._pending.clear()
+            self._last_activity = time.perf_counter()
+
+    # -- Esperas ------------------------------------------------------------
+
+    def mark(self):
+        """Posición actual; las esperas con ``after=`` sólo miran lo que llegue después."""
+        with self._changed:
+            return len(self._responses)
+
+    def responses_since(self, mark=0):
+        """Copia de las respuestas llegadas después de ``mark``, en orden."""
+        with self._changed:
+            return [dict(response) for response in self._responses[mark:]]
+
+    @staticmethod
+    def _matches(response, method, path):
+        url_path = urlsplit(response["url"]).path
+        if not url_path.startswith(API_PREFIX):
+            return False
+        return response["method"] == method.upper() and fnmatch.fnmatchcase(url_path[len(API_PREFIX):], path)
+
+    def _wait(self, predicate, timeout, message):
+        deadline = time.perf_counter() + timeout
+        with self._changed:
+            while True:
+                result = predicate()
+                if result:
+                    return result
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0 or not self.alive:
+                    raise TimeoutException(message)
+                self._changed.wait(min(remaining, 0.05))
+
+    def wait_for_response(self, method, path, status=None, after=None, timeout=DEFAULT_TIMEOUT):
+        """Espera la respuesta de ``method path`` (``path`` relativo a la API, admite ``*``).
+
+        ``after`` es una marca o una respuesta anterior. Si llega con otro
+        ``status`` falla en el momento, sin esperar al timeout.
+        """
+        if isinstance(after, dict):
+            after = after["seq"]
+        start = self.mark() if after is None else after
+        label = f"{method.upper()} {path}"
+
+        def found():
+            for response in self._responses[start:]:
+                if self._matches(response, method, path):
+                    if status is not None and response["status"] != status:
+                        raise AssertionError(f"{label} respondió {response['status']}, se esperaba {status}.")
+                    return response
+            return None
+
+        with span("wait_for_response", "wait", locator=label):
+            return self._wait(found, timeout, f"No llegó la respuesta de {label}.")
+
+    @contextmanager
+    def expect_response(self, method, path, status=None, timeout=DEFAULT_TIMEOUT):
+        """Marca antes de la acción del bloque y al salir espera la respuesta.
+
+        ``with network.expect_response("POST", "/customers/", 201) as saved:``;
+        la respuesta queda en ``saved["response"]``.
+        """
+        start = self.mark()
+        result = {}
+        yield result
+        result["response"] = self.wait_for_response(method, path, status, after=start, timeout=timeout)
+
+    def wait_for_idle(self, quiet_ms=300, timeout=DEFAULT_TIMEOUT):
+        """Espera a que no haya pedidos en curso durante ``quiet_ms``."""
+        def idle():
+            quiet = (time.perf_counter() - self._last_activity) * 1000
+            return not self._pending and quiet >= quiet_ms
+
+        with span("wait_for_idle", "wait", locator=f"{quiet_ms} ms"):
+            return self._wait(idle, timeout, f"La red no quedó ociosa ({len(self._pending)} pedidos en curso).")
+
+
+_watchers = {}
+_watchers_lock = threading.Lock()
+
+
+def watch_network(driver):
+    """El ``NetworkWatcher`` de ``driver``; se abre una vez y se reutiliza entre flujos del pool."""
+    with _watchers_lock:
+        # Los de navegadores cerrados o colgados ya no reciben eventos.
+        dead = [d for d, w in _watchers.items() if d is not driver and not w.alive]
+        for d in dead:
+            _watchers.pop(d).stop()
+        watcher = _watchers.get(driver)
+        if watcher is None or not watcher.alive:
+            if watcher is not None:
+                watcher.stop()
+            watcher = NetworkWatcher(driver).start()
+            _watchers[driver] = watcher
+        return watcher
+
+
+def reset_network(driver):
+    """Vacía las respuestas del watcher de ``driver`` antes de pasarlo a otro flujo."""
+    with _watchers_lock:
+        watcher = _watchers.get(driver)
+    if watcher is not None:
+        watcher.clear()
+
+
+def forget_network(driver):
+    """Cierra la conexión CDP del watcher de ``driver`` y lo saca del registro."""
+    with _watchers_lock:
+        watcher = _watchers.pop(driver, None)
+    if watcher is not None:
+        watcher.stop()
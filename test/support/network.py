@@ -0,0 +1,187 @@
+import hashlib
+import json
+from collections import defaultdict
+from urllib.parse import parse_qs, urlsplit
+
+API_TYPES = ("XHR", "Fetch")
+
+# Umbrales de los hallazgos del análisis.
+OVERSIZED_KB = 100
+LARGE_LIMIT = 1000
+WATERFALL_GAP_MS = 100
+WATERFALL_MIN_LENGTH = 3
+
+
+class NetworkRecorder:
+    """Arma la lista de pedidos XHR/fetch a partir del log de performance de Chrome.
+
+    El driver tiene que haberse creado con ``network=True`` (ver
+    ``support.driver.create_driver``), que activa los eventos ``Network.*`` y
+    ``Page.*`` de CDP en ``driver.get_log("performance")``.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.page = None
+        self._requests = {}
+        self._order = []
+
+    def start(self):
+        """Descarta lo registrado hasta ahora (por ejemplo, el reset del pool)."""
+        self.driver.get_log("performance")
+        self._requests.clear()
+        self._order.clear()
+
+    def drain(self):
+        for entry in self.driver.get_log("performance"):
+            message = json.loads(entry["message"])["message"]
+            self._handle(message["method"], message.get("params", {}))
+
+    def _handle(self, method, params):
+        if method == "Page.frameNavigated" and not params["frame"].get("parentId"):
+            self.page = urlsplit(params["frame"]["url"]).path
+        elif method == "Page.navigatedWithinDocument":
+            self.page = urlsplit(params["url"]).path
+        elif method == "Network.requestWillBeSent":
+            if params.get("type") not in API_TYPES:
+                return
+            request = params["request"]
+            body = request.get("postData") or ""
+            self._requests[params["requestId"]] = {
+                "method": request["method"],
+                "url": request["url"],
+                "body_hash": hashlib.sha1(body.encode()).hexdigest()[:12] if body else None,
+                "page": self.page,
+                "start": params["timestamp"],
+                "end": None,
+                "status": None,
+                "bytes": 0,
+            }
+            self._order.append(params["requestId"])
+        elif params.get("requestId") in self._requests:
+            request = self._requests[params["requestId"]]
+            if method == "Network.responseReceived":
+                request["status"] = params["response"]["status"]
+                request["mime"] = params["response"].get("mimeType")
+            elif method == "Network.loadingFinished":
+                request["end"] = params["timestamp"]
+                request["bytes"] = params.get("encodedDataLength", 0)
+            elif method == "Network.loadingFailed":
+                request["end"] = params["timestamp"]
+                request["error"] = params.get("errorText")
+
+    def stop(self):
+        """Devuelve los pedidos en orden, con tiempos en ms relativos al primero."""
+        self.drain()
+        requests = [self._requests[request_id] for request_id in self._order]
+        origin = requests[0]["start"] if requests else 0
+        for request in requests:
+            end = request["end"] if request["end"] is not None else request["start"]
+            request["start_ms"] = (request["start"] - origin) * 1000
+            request["ms"] = (end - request["start"]) * 1000
+            del request["start"], request["end"]
+        return requests
+
+
+def _key(request):
+    return request["method"], request["url"], request["body_hash"]
+
+
+def duplicates(requests):
+    """Pedidos idénticos (método, URL y cuerpo) repetidos dentro de una misma página."""
+    groups = defaultdict(list)
+    for request in requests:
+        groups[(request["page"], *_key(request))].append(request)
+    found = []
+    for (page, method, url, _), group in groups.items():
+        if len(group) > 1:
+            found.append({
+                "page": page,
+                "method": method,
+                "url": url,
+                "count": len(group),
+                "wasted_bytes": sum(r["bytes"] for r in group[1:]),
+            })
+    return sorted(found, key=lambda d: d["wasted_bytes"], reverse=True)
+
+
+def oversized(requests, max_kb=OVERSIZED_KB, max_limit=LARGE_LIMIT):
+    """Respuestas de más de ``max_kb`` o listados pedidos con ``limit`` enorme."""
+    found = []
+    for request in requests:
+        limit = parse_qs(urlsplit(request["url"]).query).get("limit", ["0"])[0]
+        reasons = []
+        if request["bytes"] > max_kb * 1024:
+            reasons.append(f"{request['bytes'] / 1024:.0f} KB")
+        if limit.isdigit() and int(limit) >= max_limit:
+            reasons.append(f"limit={limit}")
+        if reasons:
+            found.append({**request, "reasons": reasons})
+    return found
+
+
+def waterfalls(requests, gap_ms=WATERFALL_GAP_MS, min_length=WATERFALL_MIN_LENGTH):
+    """Cadenas de pedidos que arrancan recién cuando termina el anterior.
+
+    Es una heurística: dos pedidos de la misma página forman parte de una
+    cadena si el segundo empieza menos de ``gap_ms`` después de que terminó el
+    primero y no se solapan, que es lo que pasa cuando un efecto dispara el
+    siguiente fetch al recibir la respuesta.
+    """
+    chains = []
+    by_page = defaultdict(list)
+    for request in requests:
+        by_page[request["page"]].append(request)
+    for page, page_requests in by_page.items():
+        chain = []
+        for request in sorted(page_requests, key=lambda r: r["start_ms"]):
+            if chain:
+                previous_end = chain[-1]["start_ms"] + chain[-1]["ms"]
+                if not 0 <= request["start_ms"] - previous_end <= gap_ms:
+                    if len(chain) >= min_length:
+                        chains.append(chain)
+                    chain = []
+            chain.append(request)
+        if len(chain) >= min_length:
+            chains.append(chain)
+    return [
+        {
+            "page": chain[0]["page"],
+            "length": len(chain),
+            "ms": chain[-1]["start_ms"] + chain[-1]["ms"] - chain[0]["start_ms"],
+            "urls": [f"{r['method']} {urlsplit(r['url']).path}" for r in chain],
+        }
+        for chain in chains
+    ]
+
+
+def bytes_per_page(requests):
+    pages = defaultdict(lambda: {"requests": 0, "bytes": 0})
+    for request in requests:
+        pages[request["page"]]["requests"] += 1
+        pages[request["page"]]["bytes"] += request["bytes"]
+    return dict(pages)
+
+
+def analyze(requests):
+    return {
+        "requests": len(requests),
+        "bytes": sum(r["bytes"] for r in requests),
+        "pages": bytes_per_page(requests),
+        "duplicates": duplicates(requests),
+        "oversized": oversized(requests),
+        "waterfalls": waterfalls(requests),
+    }
+
+
+def print_analysis(flow, analysis):
+    print()
+    print(f"Red de {flow}: {analysis['requests']} pedidos, {analysis['bytes'] / 1024:.1f} KB")
+    for page, totals in analysis["pages"].items():
+        print(f"  {page or '-':<36} {totals['requests']:>4} pedidos {totals['bytes'] / 1024:>9.1f} KB")
+    for d in analysis["duplicates"]:
+        print(f"  Duplicado x{d['count']} en {d['page']}: {d['method']} {d['url']} ({d['wasted_bytes'] / 1024:.1f} KB de más)")
+    for o in analysis["oversized"]:
+        print(f"  Pesado: {o['method']} {o['url']} ({', '.join(o['reasons'])})")
+    for w in analysis["waterfalls"]:
+        print(f"  Cascada de {w['length']} pedidos en {w['page']} ({w['ms']:.0f} ms): {' -> '.join(w['urls'])}")
@@ -0,0 +1,222 @@
+import statistics
+
+from .waits import OPTIONS_JS, wait_for
+
+# Se registra antes de que cargue la página para no perder el LCP ni las tareas
+# largas del arranque de Next.js.
+_OBSERVERS_SCRIPT = """
+window.__lapanaPerf = { lcp: null, longTasks: [], lastLongTaskEnd: 0 };
+try {
+  new PerformanceObserver((list) => {
+    const entries = list.getEntries();
+    window.__lapanaPerf.lcp = entries[entries.length - 1].startTime;
+  }).observe({ type: "largest-contentful-paint", buffered: true });
+  new PerformanceObserver((list) => {
+    for (const entry of list.getEntries()) {
+      window.__lapanaPerf.longTasks.push(entry.duration);
+      window.__lapanaPerf.lastLongTaskEnd = Math.max(
+        window.__lapanaPerf.lastLongTaskEnd, entry.startTime + entry.duration
+      );
+    }
+  }).observe({ type: "longtask", buffered: true });
+} catch (e) {}
+"""
+
+_READ_SCRIPT = """
+const nav = performance.getEntriesByType("navigation")[0];
+const fcp = performance.getEntriesByName("first-contentful-paint")[0];
+const perf = window.__lapanaPerf || { lcp: null, longTasks: [] };
+return {
+  ttfb: nav ? nav.responseStart : null,
+  dom_content_loaded: nav ? nav.domContentLoadedEventEnd : null,
+  load: nav ? nav.loadEventEnd : null,
+  transfer_kb: nav ? nav.transferSize / 1024 : null,
+  fcp: fcp ? fcp.startTime : null,
+  lcp: perf.lcp,
+  long_tasks: perf.longTasks.length,
+  long_task_ms: perf.longTasks.reduce((a, b) => a + b, 0),
+};
+"""
+
+_READY_SCRIPT = """
+if (document.readyState !== "complete") return null;
+if (!performance.getEntriesByType("navigation")[0]?.loadEventEnd) return null;
+return document.querySelector('[aria-label="Loading"], [aria-label^="Cargando"]') ? null : true;
+"""
+
+# Métricas de Performance.getMetrics que se reportan, con su conversión.
+CDP_METRICS = {
+    "ScriptDuration": ("script_ms", 1000),
+    "LayoutDuration": ("layout_ms", 1000),
+    "RecalcStyleDuration": ("style_ms", 1000),
+    "TaskDuration": ("task_ms", 1000),
+    "JSHeapUsedSize": ("heap_mb", 1 / (1024 * 1024)),
+    "Nodes": ("nodes", 1),
+    "JSEventListeners": ("listeners", 1),
+}
+
+DURATION_METRICS = [key for key, _ in CDP_METRICS.values() if key.endswith("_ms")]
+
+
+def install_observers(driver):
+    """Registra los observers de LCP y tareas largas para todas las cargas siguientes."""
+    driver.execute_cdp_cmd("Performance.enable", {})
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": _OBSERVERS_SCRIPT})
+
+
+def wait_until_loaded(driver, timeout=30):
+    wait_for(driver, _READY_SCRIPT, timeout=timeout, message="La página no terminó de cargar.")
+
+
+def cdp_metrics(driver):
+    metrics = driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]
+    values = {}
+    for metric in metrics:
+        if metric["name"] in CDP_METRICS:
+            key, scale = CDP_METRICS[metric["name"]]
+            values[key] = metric["value"] * scale
+    return values
+
+
+def page_metrics(driver, before=None):
+    """Navigation Timing, FCP, LCP, tareas largas y las métricas de CDP de la página actual.
+
+    Las duraciones de CDP son acumuladas por proceso de renderer; con ``before``
+    (las métricas tomadas antes de navegar) se reporta sólo lo de esta carga.
+    """
+    metrics = cdp_metrics(driver)
+    if before:
+        for key in DURATION_METRICS:
+            if key in metrics and key in before:
+                metrics[key] = max(0, metrics[key] - before[key])
+    return {**driver.execute_script(_READ_SCRIPT), **metrics}
+
+
+def time_to_interactive(driver, ready, quiet_ms=500, timeout=60):
+    """Milisegundos desde el inicio de la navegación hasta que la página es usable.
+
+    ``ready`` es el cuerpo JS que indica que el contenido principal se pintó.
+    Como en la métrica TTI de Lighthouse, después se espera una ventana de
+    ``quiet_ms`` sin tareas largas y se toma el final de la última.
+    """
+    ready_at = wait_for(
+        driver,
+        f"const ok = (() => {{ {ready} }})(); return ok ? performance.now() : null;",
+        timeout=timeout,
+        message="La página no mostró su contenido.",
+    )
+    return wait_for(
+        driver,
+        """
+const last = Math.max((window.__lapanaPerf || {}).lastLongTaskEnd || 0, args.ready);
+return performance.now() - last >= args.quiet ? last : null;
+""",
+        args={"ready": ready_at, "quiet": quiet_ms},
+        timeout=timeout,
+        message="La página no dejó de ejecutar tareas largas.",
+    )
+
+
+_SCROLL_SCRIPT = """
+const [selector, frames, step] = arguments;
+const done = arguments[arguments.length - 1];
+let target = selector ? document.querySelector(selector) : document.scrollingElement;
+// El elemento puede no ser el que scrollea (el listbox vive dentro de su popover).
+while (target && target !== document.scrollingElement && target.scrollHeight <= target.clientHeight) {
+  target = target.parentElement;
+}
+if (!target) { done(null); return; }
+const deltas = [];
+let last = null;
+const tick = (now) => {
+  if (last !== null) deltas.push(now - last);
+  last = now;
+  if (deltas.length >= frames) { done(deltas); return; }
+  target.scrollTop += step;
+  if (target.scrollTop + target.clientHeight >= target.scrollHeight) target.scrollTop = 0;
+  requestAnimationFrame(tick);
+};
+requestAnimationFrame(tick);
+"""
+
+
+def scroll_frame_times(driver, selector=None, frames=60, step=200):
+    """Desplaza ``selector`` (o la página) un paso por frame y resume la duración de los frames."""
+    driver.set_script_timeout(30)
+    deltas = driver.execute_async_script(_SCROLL_SCRIPT, selector, frames, step)
+    if not deltas:
+        return {}
+    ordered = sorted(deltas)
+    return {
+        "frame_p50": statistics.median(ordered),
+        "frame_p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        "frame_max": ordered[-1],
+        "janky_frames": sum(1 for d in deltas if d > 50),
+    }
+
+
+def install_key_timer(driver):
+    """Registra el momento de cada tecla para medir cuánto tarda la UI en responder."""
+    driver.execute_script(
+        "if (!window.__lapanaKeyTimer) {"
+        "  window.__lapanaKeyTimer = true;"
+        "  document.addEventListener('keydown', () => { window.__lapanaKeyAt = performance.now(); }, true);"
+        "}"
+    )
+
+
+def keystroke_latencies(driver, input_el, text, timeout=30):
+    """Teclea ``text`` en un Autocomplete y mide, por tecla, cuánto tarda el listbox en filtrarse."""
+    install_key_timer(driver)
+    latencies = []
+    typed = ""
+    for char in text:
+        typed += char
+        input_el.send_keys(char)
+        latencies.append(wait_for(
+            driver,
+            OPTIONS_JS + """
+const wanted = args.toLowerCase();
+if (!options.length || !options.every((el) => el.textContent.toLowerCase().includes(wanted))) return null;
+return Math.max(performance.now() - window.__lapanaKeyAt, 0.001);
+""",
+            args=typed,
+            timeout=timeout,
+            message=f"El listbox no se filtró por '{typed}'.",
+        ))
+    return latencies
+
+
+def clear_cache(driver):
+    driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+
+
+def summarize(samples):
+    """Mediana de cada métrica entre iteraciones, ignorando las que no se pudieron medir."""
+    keys = {key for sample in samples for key in sample}
+    summary = {}
+    for key in sorted(keys):
+        values = [sample[key] for sample in samples if sample.get(key) is not None]
+        if values:
+            summary[key] = statistics.median(values)
+    return summary
+
+
+def compare(current, baseline, tolerance=0.2, tolerances=None, floors=None):
+    """Devuelve las métricas de ``current`` que empeoraron más de lo tolerado.
+
+    Una métrica se considera regresión si supera el valor de referencia por más
+    de ``tolerance`` (relativo) y además por más de su piso absoluto, para que
+    el ruido en valores chicos no haga fallar la comparación.
+    """
+    tolerances = tolerances or {}
+    floors = floors or {}
+    regressions = []
+    for key, base in baseline.items():
+        value = current.get(key)
+        if value is None or base is None:
+            continue
+        allowed = base * (1 + tolerances.get(key, tolerance))
+        if value > allowed and value - base > floors.get(key, 0):
+            regressions.append({"metric": key, "baseline": base, "value": value, "allowed": allowed})
+    return regressions
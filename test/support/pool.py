@@ -0,0 +1,144 @@
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+
+from .config import BASE_URL
+from .driver import create_driver
+from .netwaits import forget_network, reset_network
+
+APP_ORIGIN = "{0.scheme}://{0.netloc}".format(urlsplit(BASE_URL))
+
+
+class DriverPool:
+    """Mantiene hasta ``size`` navegadores abiertos y los reutiliza entre flujos.
+
+    En lugar de cerrar Chrome al terminar un flujo, se borran las cookies y el
+    almacenamiento del origen de la app y se vuelve a ``about:blank``. Si un
+    navegador dejó de responder se descarta y se lanza uno nuevo.
+    """
+
+    def __init__(self, size=1, factory=create_driver, prewarm=False):
+        self.size = size
+        self.factory = factory
+        self.stats = []
+        self._idle = queue.LifoQueue()
+        self._slots = threading.Semaphore(size)
+        self._lock = threading.Lock()
+        self._drivers = set()
+        self._leases = {}
+        if prewarm:
+            for _ in range(size):
+                self._idle.put(self._launch())
+
+    def _launch(self):
+        driver = self.factory()
+        with self._lock:
+            self._drivers.add(driver)
+        return driver
+
+    def _discard(self, driver):
+        with self._lock:
+            self._drivers.discard(driver)
+        forget_network(driver)
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+    @staticmethod
+    def is_alive(driver):
+        try:
+            driver.execute_script("return 1")
+            return True
+        except WebDriverException:
+            return False
+
+    def reset(self, driver):
+        # Las respuestas del flujo anterior no le sirven al siguiente.
+        reset_network(driver)
+        driver.delete_all_cookies()
+        driver.execute_cdp_cmd(
+            "Storage.clearDataForOrigin", {"origin": APP_ORIGIN, "storageTypes": "all"}
+        )
+        driver.get("about:blank")
+
+    def acquire(self, flow=None):
+        self._slots.acquire()
+        start = time.perf_counter()
+        source = "reutilizado"
+        driver = None
+        try:
+            while driver is None:
+                try:
+                    candidate = self._idle.get_nowait()
+                except queue.Empty:
+                    driver = self._launch()
+                    if source == "reutilizado":
+                        source = "nuevo"
+                    break
+                if self.is_alive(candidate):
+                    driver = candidate
+                else:
+                    self._discard(candidate)
+                    source = "reemplazado"
+        except Exception:
+            self._slots.release()
+            raise
+        entry = {
+            "flow": flow,
+            "source": source,
+            "startup": time.perf_counter() - start,
+        }
+        with self._lock:
+            self.stats.append(entry)
+            self._leases[id(driver)] = entry
+        return driver
+
+    def release(self, driver):
+        with self._lock:
+            entry = self._leases.pop(id(driver), {})
+        try:
+            start = time.perf_counter()
+            self.reset(driver)
+            entry["reset"] = time.perf_counter() - start
+            self._idle.put(driver)
+        except WebDriverException:
+            self._discard(driver)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def lease(self, flow=None):
+        driver = self.acquire(flow)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def close(self):
+        with self._lock:
+            drivers = list(self._drivers)
+            self._drivers.clear()
+        for driver in drivers:
+            forget_network(driver)
+            try:
+                driver.quit()
+            except WebDriverException:
+                pass
+
+    def summary(self):
+        launches = [s["startup"] for s in self.stats if s["source"] != "reutilizado"]
+        reused = [s["startup"] + s.get("reset", 0) for s in self.stats if s["source"] == "reutilizado"]
+        avg_launch = sum(launches) / len(launches) if launches else 0
+        return {
+            "flows": len(self.stats),
+            "launches": len(launches),
+            "reused": len(reused),
+            "avg_launch": avg_launch,
+            "avg_reuse": sum(reused) / len(reused) if reused else 0,
+            "saved": sum(avg_launch - cost for cost in reused),
+        }
@@ -0,0 +1,235 @@
+import json
+import os
+import time
+from contextlib import contextmanager
+
+from selenium.webdriver.support.wait import WebDriverWait
+
+# Perfil del flujo en curso. Cada worker corre un flujo a la vez, así que
+# alcanza con uno por proceso.
+_active = None
+_original_until = None
+
+
+def _locator(command, params):
+    if not params:
+        return None
+    if "using" in params:
+        return f"{params['using']}={params['value']}"
+    if "url" in params:
+        return params["url"]
+    if "cmd" in params:
+        return params["cmd"]
+    return None
+
+
+def _describe(method):
+    """Nombre legible de una condición de ``expected_conditions``."""
+    name = getattr(method, "__qualname__", type(method).__name__).split(".<locals>")[0]
+    for cell in getattr(method, "__closure__", None) or ():
+        value = cell.cell_contents
+        if isinstance(value, tuple) and len(value) == 2 and all(isinstance(v, str) for v in value):
+            return f"{name}({value[0]}={value[1]})"
+        if isinstance(value, str):
+            return f"{name}({value})"
+    return name
+
+
+def _install_wait_hook():
+    """Hace que ``WebDriverWait.until`` registre la espera y la cantidad de polls."""
+    global _original_until
+    if _original_until is not None:
+        return
+    _original_until = WebDriverWait.until
+
+    def until(self, method, message=""):
+        profiler = _active
+        if profiler is None:
+            return _original_until(self, method, message)
+        polls = 0
+
+        def counted(driver):
+            nonlocal polls
+            polls += 1
+            return method(driver)
+
+        with profiler.span("WebDriverWait.until", "wait", locator=_describe(method)) as event:
+            try:
+                return _original_until(self, counted, message)
+            finally:
+                event["polls"] = polls
+
+    WebDriverWait.until = until
+
+
+class Profiler:
+    """Registra cada comando de WebDriver y cada espera de un flujo.
+
+    Los comandos se capturan envolviendo ``driver.execute``, por donde pasan
+    también los de ``WebElement``. Los eventos guardan su duración, el
+    localizador, los polls (en las esperas) y el paso del flujo en el que
+    ocurrieron; ``step`` marca el comienzo de cada paso.
+    """
+
+    def __init__(self, flow=None, worker=0):
+        self.flow = flow
+        self.worker = worker
+        self.events = []
+        self.epoch = time.time()
+        self._origin = time.perf_counter()
+        self._stack = []
+        self._step = None
+        self._driver = None
+        self._previous = None
+
+    def now(self):
+        return time.perf_counter() - self._origin
+
+    def attach(self, driver):
+        global _active
+        self._driver = driver
+        self._previous = vars(driver).get("execute")
+        execute = driver.execute
+
+        def profiled_execute(command, params=None):
+            with self.span(command, "command", locator=_locator(command, params)):
+                return execute(command, params)
+
+        driver.execute = profiled_execute
+        _install_wait_hook()
+        _active = self
+        return self
+
+    def detach(self):
+        global _active
+        self.step(None)
+        if self._driver is not None:
+            if self._previous is None:
+                del self._driver.execute
+            else:
+                self._driver.execute = self._previous
+            self._driver = None
+        if _active is self:
+            _active = None
+
+    @contextmanager
+    def span(self, name, kind, **args):
+        event = {
+            "name": name,
+            "kind": kind,
+            "step": self._step["name"] if self._step else None,
+            "start": self.now(),
+            "depth": len(self._stack),
+            **args,
+        }
+        self._stack.append(event)
+        try:
+            yield event
+        except Exception as e:
+            event["error"] = type(e).__name__
+            raise
+        finally:
+            self._stack.pop()
+            event["duration"] = self.now() - event["start"]
+            self.events.append(event)
+
+    def step(self, name):
+        """Cierra el paso en curso y, si ``name`` no es None, abre uno nuevo."""
+        now = self.now()
+        if self._step:
+            self._step["duration"] = now - self._step["start"]
+            self.events.append(self._step)
+        self._step = {"name": name, "kind": "step", "start": now, "depth": 0} if name else None
+
+    def to_dict(self):
+        return {
+            "flow": self.flow,
+            "worker": self.worker,
+            "epoch": self.epoch,
+            "events": sorted(self.events, key=lambda e: e["start"]),
+        }
+
+
+def step(name):
+    """Marca el comienzo de un paso del flujo. Sin perfil activo no hace nada."""
+    if _active is not None:
+        _active.step(name)
+
+
+@contextmanager
+def span(name, kind, **args):
+    if _active is None:
+        yield {}
+        return
+    with _active.span(name, kind, **args) as event:
+        yield event
+
+
+def trace_events(profiles):
+    """Convierte los perfiles al formato trace-event de Chrome (chrome://tracing, Perfetto)."""
+    origin = min((p["epoch"] for p in profiles), default=0)
+    events = []
+    for tid, profile in enumerate(profiles, 1):
+        offset = (profile["epoch"] - origin) * 1e6
+        events.append({
+            "name": "thread_name",
+            "ph": "M",
+            "pid": profile["worker"],
+            "tid": tid,
+            "args": {"name": profile["flow"]},
+        })
+        for event in profile["events"]:
+            events.append({
+                "name": event["name"],
+                "cat": event["kind"],
+                "ph": "X",
+                "ts": offset + event["start"] * 1e6,
+                "dur": event["duration"] * 1e6,
+                "pid": profile["worker"],
+                "tid": tid,
+                "args": {k: event[k] for k in ("step", "locator", "polls", "error") if event.get(k) is not None},
+            })
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def step_summary(profile):
+    """Duración de cada paso con el tiempo repartido entre comandos y esperas."""
+    steps = []
+    for event in profile["events"]:
+        if event["kind"] != "step":
+            continue
+        inside = [e for e in profile["events"] if e["kind"] != "step" and e["step"] == event["name"] and e["depth"] == 0]
+        steps.append({
+            "flow": profile["flow"],
+            "step": event["name"],
+            "duration": event["duration"],
+            "commands": sum(1 for e in profile["events"] if e["kind"] == "command" and e["step"] == event["name"]),
+            "waiting": sum(e["duration"] for e in inside if e["kind"] == "wait"),
+            "polls": sum(e.get("polls", 0) for e in inside if e["kind"] == "wait"),
+        })
+    return steps
+
+
+def slowest_steps(profiles, limit=10):
+    steps = [s for profile in profiles for s in step_summary(profile)]
+    return sorted(steps, key=lambda s: s["duration"], reverse=True)[:limit]
+
+
+def print_slowest_steps(profiles, limit=10):
+    print()
+    print(f"Pasos más lentos (top {limit}):")
+    print(f"{'Flujo':<40} {'Paso':<30} {'Tiempo':>8} {'Esperas':>8} {'Polls':>6} {'Cmds':>5}")
+    for s in slowest_steps(profiles, limit):
+        print(
+            f"{s['flow']:<40} {s['step'][:30]:<30} {s['duration']:>7.2f}s "
+            f"{s['waiting']:>7.2f}s {s['polls']:>6} {s['commands']:>5}"
+        )
+
+
+def write_profiles(profiles, directory):
+    """Guarda ``profile.json`` (eventos crudos) y ``trace.json`` (trace-event de Chrome)."""
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, "profile.json"), "w") as f:
+        json.dump(profiles, f, indent=2)
+    with open(os.path.join(directory, "trace.json"), "w") as f:
+        json.dump(trace_events(profiles), f)
@@ -0,0 +1,84 @@
+import datetime
+from decimal import Decimal, InvalidOperation
+
+# Recurso -> campo con el que se arma la URL de detalle (products usa el slug).
+DETAIL_KEYS = {
+    "products": "slug",
+    "customers": "id",
+    "expenses": "id",
+}
+
+# Valores de referencia que los flujos de la UI eligen en los Autocomplete.
+PRODUCT_CATEGORY = "Panadería"
+PRODUCT_BRAND = "Leone"
+EXPENSE_CATEGORY = "Negocio"
+SUPPLIER = "YPF"
+
+
+def detail_path(resource, row):
+    return f"/{resource}/{row[DETAIL_KEYS[resource]]}/"
+
+
+def find_by_name(rows, name, field="name"):
+    """Fila con ``field`` igual a ``name``, o None. Acepta la respuesta paginada o la lista."""
+    rows = rows["results"] if isinstance(rows, dict) else rows
+    return next((row for row in rows if row[field] == name), None)
+
+
+# Los payloads repiten lo que arman las páginas de alta y edición
+# (products/create, customers/create, expenses/create y sus ediciones).
+
+def product_payload(data, category, brand, **overrides):
+    payload = {
+        "barcode": data.barcode("123456789013"),
+        "name": data.name("Pan Negro"),
+        "retail_price": "100.00",
+        "wholesale_price": "90.00",
+        "description": "Pan integral saludable",
+        "category": category,
+        "brand": brand,
+    }
+    payload.update(overrides)
+    return payload
+
+
+def customer_payload(data, **overrides):
+    payload = {
+        "name": data.name("Juan Paerez"),
+        "email": data.email("juan.aperez@example.com"),
+        "phone_number": data.phone("+54911122345678"),
+        "address": "Calle Falsa 123",
+        "customer_type": "mayorista",
+    }
+    payload.update(overrides)
+    return payload
+
+
+def expense_payload(data, category, supplier, **overrides):
+    payload = {
+        "amount": "1000.50",
+        "date": datetime.date.today().isoformat(),
+        "description": data.name("Compra de insumos de prueba"),
+        "category": category,
+        "supplier": supplier,
+    }
+    payload.update(overrides)
+    return payload
+
+
+def _same(actual, expected):
+    if isinstance(actual, dict) and "id" in actual:
+        actual = actual["id"]
+    try:
+        return Decimal(str(actual)) == Decimal(str(expected))
+    except (InvalidOperation, ValueError):
+        return actual == expected
+
+
+def mismatches(row, expected):
+    """Campos de ``expected`` que la API devolvió con otro valor (montos comparados como números)."""
+    return {
+        key: (row.get(key), value)
+        for key, value in expected.items()
+        if not _same(row.get(key), value)
+    }
@@ -0,0 +1,346 @@
+import math
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+import time
+from functools import lru_cache
+
+from .shaping import browser_profile
+
+TEST_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_DB = os.environ.get("LAPANA_RESULTS_DB", os.path.join(TEST_DIR, ".perf-results.sqlite"))
+
+# Métricas en las que subir es mejorar; en el resto, subir es una regresión.
+HIGHER_IS_BETTER = {"rps"}
+
+# Diferencia absoluta mínima para considerar una regresión, según la unidad
+# del nombre de la métrica (como DEFAULT_FLOORS en bench_pages.py).
+FLOORS = {
+    "duration": 0.05,
+    "startup": 0.1,
+    "waiting": 0.05,
+    "commands": 2,
+    "polls": 5,
+    "api_requests": 1,
+    "api_duplicates": 1,
+    "api_bytes": 20 * 1024,
+    "p50": 10,
+    "p95": 20,
+    "p99": 30,
+    "errors": 1,
+    "rps": 1,
+    "long_tasks": 1,
+    "transfer_kb": 20,
+    "heap_mb": 2,
+    "nodes": 200,
+    "listeners": 50,
+}
+DEFAULT_MS_FLOOR = 50
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    git_commit TEXT NOT NULL,
+    dirty INTEGER NOT NULL,
+    environment TEXT NOT NULL,
+    source TEXT NOT NULL,
+    created REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS measurements (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    flow TEXT NOT NULL,
+    step TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    value REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_commit ON runs (git_commit, environment);
+CREATE INDEX IF NOT EXISTS measurements_key ON measurements (run_id, flow, step, metric);
+"""
+
+
+def _git(*args):
+    try:
+        return subprocess.run(
+            ["git", *args], cwd=TEST_DIR, capture_output=True, text=True, check=True, timeout=30
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+@lru_cache(maxsize=None)
+def current_commit():
+    """Commit del árbol de trabajo y si tiene cambios sin commitear."""
+    commit = _git("rev-parse", "HEAD") or "desconocido"
+    dirty = bool(_git("status", "--porcelain", "--untracked-files=no"))
+    return commit, dirty
+
+
+def resolve_commit(ref):
+    return _git("rev-parse", "--verify", f"{ref}^{{commit}}") or ref
+
+
+def ancestors(ref, limit):
+    """Los ``limit`` commits anteriores a ``ref`` en la historia de primer padre, del más nuevo al más viejo."""
+    output = _git("rev-list", "--first-parent", f"--max-count={limit}", f"{ref}~1")
+    return output.split() if output else []
+
+
+def environment():
+    """Dónde se midió: máquina, perfil de navegador y si las respuestas eran reproducidas.
+
+    Sólo se comparan corridas del mismo entorno. ``LAPANA_RESULTS_ENV`` lo
+    reemplaza, por ejemplo para agrupar los runners de CI.
+    """
+    if os.environ.get("LAPANA_RESULTS_ENV"):
+        return os.environ["LAPANA_RESULTS_ENV"]
+    parts = [platform.node() or "local", browser_profile()]
+    if os.environ.get("LAPANA_HAR_REPLAY"):
+        parts.append("replay")
+    return "/".join(parts)
+
+
+class ResultsStore:
+    """Resultados de rendimiento por commit, flujo, paso y entorno, en SQLite."""
+
+    def __init__(self, path=DEFAULT_DB):
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.execute("PRAGMA foreign_keys = ON")
+        self.db.executescript(_SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def record(self, source, rows, commit=None, env=None):
+        """Guarda una corrida; ``rows`` son tuplas ``(flujo, paso, métrica, valor)``."""
+        rows = [(flow, step or "", metric, float(value)) for flow, step, metric, value in rows if value is not None]
+        if not rows:
+            return None
+        if commit is None:
+            commit, dirty = current_commit()
+        else:
+            dirty = False
+        with self.db:
+            run_id = self.db.execute(
+                "INSERT INTO runs (git_commit, dirty, environment, source, created) VALUES (?, ?, ?, ?, ?)",
+                (commit, int(dirty), env or environment(), source, time.time()),
+            ).lastrowid
+            self.db.executemany(
+                "INSERT INTO measurements (run_id, flow, step, metric, value) VALUES (?, ?, ?, ?, ?)",
+                [(run_id, *row) for row in rows],
+            )
+        return run_id
+
+    def samples(self, commits, env, include_dirty=False):
+        """``{(flujo, paso, métrica): [valores]}`` de todas las corridas de ``commits``."""
+        if not commits:
+            return {}
+        marks = ",".join("?" * len(commits))
+        query = (
+            "SELECT m.flow, m.step, m.metric, m.value FROM measurements m JOIN runs r ON r.id = m.run_id "
+            f"WHERE r.git_commit IN ({marks}) AND r.environment = ?"
+        )
+        if not include_dirty:
+            query += " AND r.dirty = 0"
+        found = {}
+        for flow, step, metric, value in self.db.execute(query, (*commits, env)):
+            found.setdefault((flow, step, metric), []).append(value)
+        return found
+
+    def commits_with_data(self, commits, env, include_dirty=False):
+        if not commits:
+            return []
+        marks = ",".join("?" * len(commits))
+        query = f"SELECT DISTINCT git_commit FROM runs WHERE git_commit IN ({marks}) AND environment = ?"
+        if not include_dirty:
+            query += " AND dirty = 0"
+        present = {row[0] for row in self.db.execute(query, (*commits, env))}
+        return [commit for commit in commits if commit in present]
+
+    def runs(self, limit=20):
+        return self.db.execute(
+            "SELECT r.id, r.git_commit, r.dirty, r.environment, r.source, r.created, COUNT(m.run_id) "
+            "FROM runs r LEFT JOIN measurements m ON m.run_id = r.id GROUP BY r.id ORDER BY r.id DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+
+    def trend(self, flow, step, metric, env, limit=30):
+        """Mediana por commit de una métrica, en el orden en que se corrieron."""
+        rows = self.db.execute(
+            "SELECT r.git_commit, MIN(r.created), GROUP_CONCAT(m.value) FROM measurements m "
+            "JOIN runs r ON r.id = m.run_id WHERE m.flow = ? AND m.step = ? AND m.metric = ? "
+            "AND r.environment = ? GROUP BY r.git_commit ORDER BY MIN(r.created) DESC LIMIT ?",
+            (flow, step, metric, env, limit),
+        ).fetchall()
+        points = []
+        for commit, created, values in reversed(rows):
+            values = [float(v) for v in values.split(",")]
+            points.append({"commit": commit, "created": created, "runs": len(values), "median": statistics.median(values)})
+        return points
+
+    def environments(self):
+        return [row[0] for row in self.db.execute("SELECT DISTINCT environment FROM runs ORDER BY environment")]
+
+
+# -- Qué se guarda de cada tipo de corrida ----------------------------------------
+
+def suite_rows(report, steps=()):
+    """Filas de ``runner.run_suite``: duración de cada flujo, sus pasos y sus pedidos a la API.
+
+    ``steps`` es la salida de ``profiler.step_summary`` de cada perfil.
+
+    Los flujos fallidos no se guardan: su tiempo es el de la falla, no el del flujo.
+    """
+    passed = {r["flow"] for r in report["results"] if r["status"] == "passed"}
+    rows = []
+    for result in report["results"]:
+        if result["flow"] not in passed:
+            continue
+        rows.append((result["flow"], "", "duration", result["duration"]))
+        rows.append((result["flow"], "", "startup", result.get("startup")))
+        for metric in ("api_requests", "api_bytes", "api_duplicates"):
+            rows.append((result["flow"], "", metric, result.get(metric)))
+    for step in steps:
+        if step["flow"] not in passed:
+            continue
+        for metric in ("duration", "waiting", "commands", "polls"):
+            rows.append((step["flow"], step["step"], metric, step[metric]))
+    return rows
+
+
+def page_rows(samples):
+    """Filas de ``bench_pages``: cada iteración de cada ruta, en frío y en tibio."""
+    return [
+        (route, mode, metric, value)
+        for route, modes in samples.items()
+        for mode, iterations in modes.items()
+        for sample in iterations
+        for metric, value in sample.items()
+    ]
+
+
+def load_rows(report):
+    """Filas de ``load.py``: latencias, throughput y errores por endpoint."""
+    return [
+        ("api", endpoint, metric, stats[metric])
+        for endpoint, stats in report["endpoints"].items()
+        for metric in ("p50", "p95", "p99", "rps", "errors")
+    ]
+
+
+def record_results(source, rows, path=DEFAULT_DB):
+    """Guarda la corrida y avisa en qué commit quedó; no interrumpe la corrida si falla."""
+    try:
+        with ResultsStore(path) as store:
+            run_id = store.record(source, rows)
+    except sqlite3.Error as e:
+        print(f"No se pudieron guardar los resultados en {path}: {e}")
+        return None
+    if run_id is not None:
+        commit, dirty = current_commit()
+        print(f"Resultados guardados en {path} (commit {commit[:10]}{', con cambios' if dirty else ''}).")
+    return run_id
+
+
+# -- Comparación --------------------------------------------------------------
+
+def _exact_u_pvalue(u, m, n):
+    """P(U <= u) exacta para muestras sin empates (recurrencia de Mann y Whitney)."""
+    @lru_cache(maxsize=None)
+    def count(u, m, n):
+        if u < 0:
+            return 0
+        if m == 0 or n == 0:
+            return 1 if u == 0 else 0
+        return count(u - n, m - 1, n) + count(u, m, n - 1)
+
+    total = math.comb(m + n, m)
+    return sum(count(k, m, n) for k in range(int(u) + 1)) / total
+
+
+def mann_whitney_greater(a, b):
+    """p-valor de que los valores de ``b`` tiendan a ser mayores que los de ``a``.
+
+    Prueba U de Mann-Whitney a una cola: no supone normalidad, que los
+    tiempos de una corrida no cumplen. Es exacta con muestras chicas sin
+    empates y, si no, usa la aproximación normal con corrección por empates.
+    """
+    m, n = len(a), len(b)
+    combined = sorted([(value, 0) for value in a] + [(value, 1) for value in b])
+    ranks = [0.0] * len(combined)
+    ties = []
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        if j > i:
+            ties.append(j - i + 1)
+        i = j + 1
+    rank_b = sum(rank for rank, (_, group) in zip(ranks, combined) if group == 1)
+    u_b = rank_b - n * (n + 1) / 2
+    # b mayor que a equivale a un U de a chico.
+    u_a = m * n - u_b
+    if not ties and m + n <= 30:
+        return _exact_u_pvalue(u_a, m, n)
+    mean = m * n / 2
+    tie_term = sum(t ** 3 - t for t in ties) / ((m + n) * (m + n - 1))
+    variance = m * n / 12 * ((m + n + 1) - tie_term)
+    if variance <= 0:
+        return 1.0
+    z = (mean - u_a - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def floor_for(metric):
+    if metric in FLOORS:
+        return FLOORS[metric]
+    return DEFAULT_MS_FLOOR if metric.endswith("_ms") or metric in ("ttfb", "fcp", "lcp", "load", "dom_content_loaded") else 0
+
+
+def compare_samples(base, head, alpha=0.05, threshold=0.1, min_runs=3):
+    """Compara cada clave presente en las dos muestras y marca las regresiones.
+
+    Una clave regresiona si la prueba de Mann-Whitney da ``p < alpha``, la
+    mediana empeora más que ``threshold`` (relativo) y la diferencia supera
+    el piso de su métrica. Con menos de ``min_runs`` valores de un lado queda
+    como "insuficiente".
+    """
+    rows = []
+    for key in sorted(set(base) & set(head)):
+        a, b = base[key], head[key]
+        flow, step, metric = key
+        row = {
+            "flow": flow, "step": step, "metric": metric,
+            "base_runs": len(a), "head_runs": len(b),
+            "base": statistics.median(a), "head": statistics.median(b),
+        }
+        row["change"] = (row["head"] - row["base"]) / row["base"] if row["base"] else 0.0
+        if len(a) < min_runs or len(b) < min_runs:
+            row["status"] = "insuficiente"
+            rows.append(row)
+            continue
+        higher, lower = mann_whitney_greater(a, b), mann_whitney_greater(b, a)
+        if metric in HIGHER_IS_BETTER:
+            p_worse, p_better, worsening = lower, higher, -row["change"]
+        else:
+            p_worse, p_better, worsening = higher, lower, row["change"]
+        relevant = abs(row["head"] - row["base"]) >= floor_for(metric)
+        if p_worse < alpha and worsening > threshold and relevant:
+            row["status"], row["p"] = "regresión", p_worse
+        elif p_better < alpha and worsening < -threshold and relevant:
+            row["status"], row["p"] = "mejora", p_better
+        else:
+            row["status"], row["p"] = "igual", min(p_worse, p_better)
+        rows.append(row)
+    return rows
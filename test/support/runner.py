@@ -0,0 +1,297 @@
+import argparse
+import contextlib
+import glob
+import importlib.util
+import json
+import multiprocessing
+import os
+import time
+import traceback
+import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing.util import Finalize
+
+from .data import DataNamespace
+from .driver import captures_network, create_driver
+from .har import Archive, ArchiveWriter, HarSession, parse_latency, prepare_archive, print_har_summary, python_hook
+from .network import NetworkRecorder, analyze, print_analysis
+from .pool import DriverPool
+from .profiler import Profiler, print_slowest_steps, step_summary, write_profiles
+from .results import DEFAULT_DB, record_results, suite_rows
+from .session import clear_sessions, get_session
+from .shaping import PROFILES
+
+TEST_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_worker = {}
+
+
+def discover_flows(pattern=None):
+    """Devuelve las rutas relativas de los scripts que exponen ``run(driver, data)``."""
+    paths = sorted(glob.glob(os.path.join(TEST_DIR, "*", "test_*.py")))
+    # test/api tiene los casos sin navegador; los corre run_api.py.
+    flows = [os.path.relpath(path, TEST_DIR) for path in paths if os.path.basename(os.path.dirname(path)) != "api"]
+    if pattern:
+        flows = [flow for flow in flows if pattern in flow]
+    return flows
+
+
+def load_flow(flow):
+    path = os.path.join(TEST_DIR, flow)
+    name = "flows." + flow[:-3].replace(os.sep, ".")
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    if not hasattr(module, "run"):
+        raise AttributeError(f"{flow} no define run(driver, data)")
+    return module.run
+
+
+def _init_worker(worker_ids, run_id, use_pool, profile=False):
+    os.environ["LAPANA_HEADLESS"] = "1"
+    worker_id = worker_ids.get()
+    _worker["id"] = worker_id
+    _worker["profile"] = profile
+    _worker["data"] = DataNamespace(f"{run_id}w{worker_id}")
+    if use_pool:
+        pool = DriverPool(size=1)
+        _worker["pool"] = pool
+        # Los workers de ProcessPoolExecutor no ejecutan atexit al terminar.
+        Finalize(pool, pool.close, exitpriority=10)
+
+
+def run_flow(flow):
+    result = {
+        "flow": flow,
+        "worker": _worker.get("id", 0),
+        "status": "passed",
+        "error": None,
+    }
+    pool = _worker.get("pool")
+    start = time.perf_counter()
+    driver = None
+    profiler = None
+    recorder = None
+    har = None
+    lease = {}
+    try:
+        run = load_flow(flow)
+        if pool:
+            driver = pool.acquire(flow)
+            lease = pool.stats[-1]
+            result["browser"] = lease["source"]
+        else:
+            driver = create_driver()
+            result["browser"] = "nuevo"
+        result["startup"] = time.perf_counter() - start
+        data = _worker.get("data") or DataNamespace()
+        har = HarSession.from_env(driver, flow)
+        if har is not None:
+            har.start()
+            data = har.data
+        if captures_network():
+            recorder = NetworkRecorder(driver)
+            recorder.start()
+        if _worker.get("profile"):
+            profiler = Profiler(flow, result["worker"]).attach(driver)
+        run(driver, data)
+    except Exception as e:
+        result["status"] = "failed"
+        result["error"] = f"{type(e).__name__}: {e}"
+        result["traceback"] = traceback.format_exc()
+    finally:
+        if profiler is not None:
+            profiler.detach()
+            result["profile"] = profiler.to_dict()
+        if recorder is not None:
+            try:
+                requests = recorder.stop()
+                analysis = analyze(requests)
+                result["network"] = {"requests": requests, "analysis": analysis}
+                # Totales que quedan en el reporte para seguirlos corrida a corrida.
+                result["api_requests"] = analysis["requests"]
+                result["api_bytes"] = analysis["bytes"]
+                result["api_duplicates"] = sum(d["count"] - 1 for d in analysis["duplicates"])
+            except Exception as e:
+                result["network_error"] = f"{type(e).__name__}: {e}"
+        if har is not None:
+            result["har"] = har.stop()
+        if driver is not None:
+            if pool:
+                pool.release(driver)
+                # Limpiar el navegador para el próximo flujo es parte de reutilizarlo.
+                result["reset"] = lease.get("reset", 0)
+            else:
+                driver.quit()
+    result["duration"] = time.perf_counter() - start
+    return result
+
+
+def startup_summary(results):
+    launches = [r["startup"] for r in results if r.get("browser") in ("nuevo", "reemplazado")]
+    # Igual que DriverPool.summary: reutilizar cuesta el arranque más la limpieza.
+    reused = [r["startup"] + r.get("reset", 0) for r in results if r.get("browser") == "reutilizado"]
+    avg_launch = sum(launches) / len(launches) if launches else 0
+    return {
+        "launches": len(launches),
+        "reused": len(reused),
+        "total": sum(launches) + sum(reused),
+        "avg_launch": avg_launch,
+        "saved": sum(avg_launch - cost for cost in reused),
+    }
+
+
+def run_suite(flows, workers=1, use_pool=True, profile=False):
+    run_id = uuid.uuid4().hex[:4]
+    # Un único login por corrida: los workers leen la sesión del caché en disco.
+    get_session("ADMIN")
+
+    start = time.perf_counter()
+    ctx = multiprocessing.get_context("spawn")
+    worker_ids = ctx.Manager().Queue()
+    for worker_id in range(1, workers + 1):
+        worker_ids.put(worker_id)
+
+    results = []
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=ctx,
+        initializer=_init_worker,
+        initargs=(worker_ids, run_id, use_pool, profile),
+    ) as executor:
+        futures = [executor.submit(run_flow, flow) for flow in flows]
+        for future in as_completed(futures):
+            result = future.result()
+            status = "OK " if result["status"] == "passed" else "ERR"
+            print(f"[{status}] w{result['worker']} {result['flow']} ({result['duration']:.2f}s)")
+            results.append(result)
+    wall_time = time.perf_counter() - start
+
+    results.sort(key=lambda r: r["flow"])
+    serial_time = sum(r["duration"] for r in results)
+    return {
+        "run_id": run_id,
+        "workers": workers,
+        "wall_time": wall_time,
+        "serial_time": serial_time,
+        "speedup": serial_time / wall_time if wall_time else 0,
+        "passed": sum(r["status"] == "passed" for r in results),
+        "failed": sum(r["status"] == "failed" for r in results),
+        "startup": startup_summary(results),
+        "results": results,
+    }
+
+
+def print_report(report, baseline=None):
+    print()
+    print(f"{'Flujo':<40} {'Worker':>6} {'Arranque':>9} {'Tiempo':>9}  Estado")
+    for result in report["results"]:
+        startup = f"{result['startup']:.2f}s" if "startup" in result else "-"
+        print(
+            f"{result['flow']:<40} {result['worker']:>6} {startup:>9} "
+            f"{result['duration']:>8.2f}s  {result['status']} ({result.get('browser', '-')})"
+        )
+        if result["error"]:
+            print(f"    {result['error']}")
+    print()
+    print(f"Flujos: {len(report['results'])}  OK: {report['passed']}  Fallidos: {report['failed']}")
+    print(f"Tiempo total con {report['workers']} workers: {report['wall_time']:.2f}s")
+    print(f"Suma de tiempos por flujo (serie estimada): {report['serial_time']:.2f}s")
+    print(f"Speedup estimado: {report['speedup']:.2f}x")
+    startup = report["startup"]
+    print(
+        f"Navegadores lanzados: {startup['launches']}  reutilizados: {startup['reused']}  "
+        f"arranque total: {startup['total']:.2f}s  ahorro estimado del pool: {startup['saved']:.2f}s"
+    )
+    if baseline:
+        print(f"Speedup contra la corrida en serie de referencia: {baseline['wall_time'] / report['wall_time']:.2f}x")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ejecuta los flujos de Selenium en paralelo.")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("-k", "--filter", help="Solo los flujos cuya ruta contiene este texto.")
+    parser.add_argument("--report", help="Ruta del reporte JSON combinado.")
+    parser.add_argument("--no-pool", action="store_true", help="Lanza un Chrome nuevo por flujo.")
+    parser.add_argument("--baseline", help="Reporte JSON de una corrida en serie para comparar.")
+    parser.add_argument("--profile", metavar="DIR", help="Registra cada comando y guarda profile.json y trace.json en DIR.")
+    parser.add_argument("--network", metavar="ARCHIVO", help="Registra los pedidos a la API y guarda el análisis en ARCHIVO.")
+    parser.add_argument(
+        "--results", default=DEFAULT_DB, metavar="DB",
+        help="Base SQLite donde se guardan las corridas con --profile o --network (ver perf_history.py).",
+    )
+    parser.add_argument("--no-results", action="store_true", help="No guardar esta corrida en la base de resultados.")
+    parser.add_argument(
+        "--browser-profile", choices=sorted(PROFILES),
+        help="Perfil de red y animaciones de los navegadores (ver support/shaping.py).",
+    )
+    har = parser.add_mutually_exclusive_group()
+    har.add_argument("--record", metavar="DIR", help="Graba en DIR todas las respuestas de la API de la corrida.")
+    har.add_argument("--replay", metavar="DIR", help="Sirve las respuestas grabadas en DIR, sin backend.")
+    parser.add_argument(
+        "--replay-latency", metavar="MS[+JITTER]|recorded",
+        help="Demora de cada respuesta reproducida: fija (p. ej. 80+40) o la grabada.",
+    )
+    args = parser.parse_args(argv)
+
+    if args.browser_profile:
+        os.environ["LAPANA_BROWSER_PROFILE"] = args.browser_profile
+    if args.network:
+        # Los workers heredan el entorno, así que sus navegadores se crean con el log de red.
+        os.environ["LAPANA_NETWORK_LOG"] = "1"
+
+    flows = discover_flows(args.filter)
+    if not flows:
+        parser.error("No se encontraron flujos.")
+
+    # El login inicial de run_suite también pasa por la grabación.
+    har_context = contextlib.nullcontext()
+    writer = None
+    if args.record:
+        prepare_archive(args.record)
+        clear_sessions()
+        os.environ["LAPANA_HAR_RECORD"] = args.record
+        writer = ArchiveWriter(args.record, "_suite")
+        har_context = python_hook("_suite", writer=writer)
+    elif args.replay:
+        os.environ["LAPANA_HAR_REPLAY"] = args.replay
+        if args.replay_latency:
+            os.environ["LAPANA_HAR_LATENCY"] = args.replay_latency
+        har_context = python_hook("_suite", archive=Archive(args.replay), latency=parse_latency(args.replay_latency))
+
+    with har_context:
+        report = run_suite(
+            flows,
+            workers=max(1, min(args.workers, len(flows))),
+            use_pool=not args.no_pool,
+            profile=bool(args.profile),
+        )
+    if writer is not None:
+        writer.close()
+    profiles = [r.pop("profile") for r in report["results"] if "profile" in r]
+    network = {r["flow"]: r.pop("network") for r in report["results"] if "network" in r}
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+    if profiles:
+        write_profiles(profiles, args.profile)
+        print_slowest_steps(profiles)
+    if args.record or args.replay:
+        print_har_summary(report["results"])
+    # Sólo las corridas instrumentadas tienen pasos y pedidos para comparar entre commits.
+    if (profiles or network) and not args.no_results:
+        steps = [step for profile in profiles for step in step_summary(profile)]
+        record_results("suite", suite_rows(report, steps), args.results)
+    if network:
+        for flow, captured in network.items():
+            print_analysis(flow, captured["analysis"])
+        with open(args.network, "w") as f:
+            json.dump(network, f, indent=2)
+
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(report, f, indent=2)
+    return 1 if report["failed"] else 0
@@ -0,0 +1,297 @@
+import asyncio
+import datetime
+import json
+import os
+import random
+import time
+
+from .api import ApiError
+from .backend.seed import CUSTOMER_NAMES, EXPENSE_CATEGORIES, PRODUCT_BRANDS, PRODUCT_CATEGORIES, PRODUCT_NAMES, SUPPLIERS
+
+PRESETS = {
+    "small": {"products": 30, "customers": 15, "sales": 200, "expenses": 20, "months": 2},
+    "10k": {"products": 300, "customers": 200, "sales": 10_000, "expenses": 500, "months": 6},
+    "100k": {"products": 1_000, "customers": 1_000, "sales": 100_000, "expenses": 3_000, "months": 12},
+}
+
+# Orden de borrado: primero lo que referencia a otros recursos.
+TEARDOWN_ORDER = [
+    "returns",
+    "sales",
+    "standing-orders",
+    "expenses",
+    "customers",
+    "products",
+    "suppliers",
+    "expense-categories",
+    "product-brands",
+    "product-categories",
+]
+
+LOOKUPS = {
+    "product-categories": PRODUCT_CATEGORIES,
+    "product-brands": PRODUCT_BRANDS,
+    "expense-categories": EXPENSE_CATEGORIES,
+    "suppliers": SUPPLIERS,
+}
+
+PAYMENT_METHODS = ["efectivo", "efectivo", "tarjeta", "transferencia", "qr", "cuenta_corriente"]
+
+# Acciones que se aplican a las ventas con cliente (nacen pendientes de entrega)
+# para repartirlas entre los estados que ve la app.
+SALE_OUTCOMES = [
+    (0.35, ["mark-as-delivered", "mark-as-charged"]),
+    (0.15, ["mark-as-delivered"]),
+    (0.10, ["mark-as-delivered", "mark-as-partial-charged"]),
+    (0.05, ["cancel"]),
+    (0.35, []),
+]
+
+
+def plan(seed=0, preset="small", now=None):
+    """Arma todos los payloads de antemano, así el resultado depende sólo de ``seed``.
+
+    Las referencias a otros recursos se guardan como índices dentro del plan y
+    se resuelven a ids cuando esos recursos ya existen en la API.
+    """
+    counts = PRESETS[preset] if isinstance(preset, str) else preset
+    rng = random.Random(seed)
+    now = now or datetime.datetime.now().replace(microsecond=0)
+    tag = f"{seed % 1000:03d}"
+
+    products = []
+    for i in range(counts["products"]):
+        retail = rng.randint(200, 5000)
+        products.append({
+            "barcode": f"778{tag}{i:07d}",
+            "name": f"{PRODUCT_NAMES[i % len(PRODUCT_NAMES)]} {i // len(PRODUCT_NAMES) + 1}",
+            "retail_price": retail,
+            "wholesale_price": round(retail * 0.85),
+            "description": "",
+            "category": rng.randrange(len(PRODUCT_CATEGORIES)),
+            "brand": rng.randrange(len(PRODUCT_BRANDS)),
+        })
+
+    customers = []
+    for i in range(counts["customers"]):
+        base = CUSTOMER_NAMES[i % len(CUSTOMER_NAMES)]
+        customers.append({
+            "name": f"{base} {tag}-{i}",
+            "email": f"cliente.{tag}.{i}@example.com",
+            "phone_number": f"+549351{rng.randint(1000000, 9999999)}",
+            "address": f"Calle {rng.randint(1, 200)} N°{rng.randint(1, 3000)}",
+            "customer_type": rng.choice(["minorista", "mayorista"]),
+        })
+
+    standing_orders = []
+    if products:
+        for customer in range(len(customers) // 3):
+            for day in range(6):
+                standing_orders.append({
+                    "customer": customer,
+                    "day_of_week": day,
+                    "details": [
+                        {"product": p, "quantity": rng.randint(1, 20)}
+                        for p in rng.sample(range(len(products)), min(3, len(products)))
+                    ],
+                })
+
+    days = counts["months"] * 30
+    expenses = []
+    for i in range(counts["expenses"]):
+        date = (now - datetime.timedelta(days=rng.randint(0, days))).date()
+        expenses.append({
+            "amount": rng.randint(1000, 90000),
+            "date": date.isoformat(),
+            "description": f"Gasto {tag}-{i + 1}",
+            "category": rng.randrange(len(EXPENSE_CATEGORIES)),
+            "supplier": rng.randrange(len(SUPPLIERS)),
+        })
+
+    sales, actions, returns = [], [], []
+    for i in range(counts["sales"] if products else 0):
+        date = now - datetime.timedelta(days=rng.randint(0, days), minutes=rng.randint(0, 600))
+        customer = rng.randrange(len(customers)) if customers and rng.random() < 0.6 else None
+        sale_type = customers[customer]["customer_type"] if customer is not None else "minorista"
+        details = []
+        for p in rng.sample(range(len(products)), min(rng.randint(1, 4), len(products))):
+            product = products[p]
+            price = product["wholesale_price"] if sale_type == "mayorista" else product["retail_price"]
+            quantity = rng.randint(1, 12)
+            details.append({"product": p, "price": price, "quantity": quantity, "subtotal": price * quantity})
+        sales.append({
+            "date": date.isoformat(),
+            "customer": customer,
+            "payment_method": rng.choice(PAYMENT_METHODS),
+            "sale_type": sale_type,
+            "sale_details": details,
+        })
+        if customer is None:
+            continue
+        roll, cumulative = rng.random(), 0
+        for weight, steps in SALE_OUTCOMES:
+            cumulative += weight
+            if roll < cumulative:
+                actions.extend((i, step) for step in steps)
+                break
+        if rng.random() < 0.1:
+            returns.append({
+                "sale": i,
+                "date": date.isoformat(),
+                "return_details": [{"product": details[0]["product"], "quantity": 1}],
+            })
+
+    return {
+        "products": products,
+        "customers": customers,
+        "standing-orders": standing_orders,
+        "expenses": expenses,
+        "sales": sales,
+        "sale-actions": actions,
+        "returns": returns,
+    }
+
+
+async def bounded(items, worker, concurrency):
+    """Ejecuta ``worker(item)`` sobre todos los items con a lo sumo ``concurrency`` a la vez."""
+    iterator = iter(enumerate(items))
+    results = [None] * len(items)
+    errors = []
+
+    async def consume():
+        for index, item in iterator:
+            try:
+                results[index] = await worker(item)
+            except ApiError as e:
+                errors.append(str(e))
+
+    await asyncio.gather(*(consume() for _ in range(concurrency)))
+    return results, errors
+
+
+class Seeder:
+    """Carga un plan en la API con pedidos concurrentes y registra lo creado.
+
+    El manifiesto se guarda después de cada etapa, así un seed interrumpido se
+    puede borrar igual con ``teardown``.
+    """
+
+    def __init__(self, client, token, manifest_path, concurrency=16, log=print):
+        self.client = client
+        self.token = token
+        self.manifest_path = manifest_path
+        self.concurrency = concurrency
+        self.log = log
+        self.created = {resource: [] for resource in TEARDOWN_ORDER}
+        self.errors = {}
+
+    def save_manifest(self, **extra):
+        data = {"created": self.created, **extra}
+        tmp_path = f"{self.manifest_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.manifest_path)
+
+    async def post(self, path, data):
+        return await self.client.call("POST", path, data, self.token)
+
+    async def _stage(self, name, items, worker):
+        start = time.perf_counter()
+        results, errors = await bounded(items, worker, self.concurrency)
+        elapsed = time.perf_counter() - start
+        if errors:
+            self.errors[name] = errors
+        rate = len(items) / elapsed if elapsed else 0
+        self.log(f"{name}: {len(items) - len(errors)}/{len(items)} en {elapsed:.1f}s ({rate:.0f}/s)")
+        return results
+
+    async def lookup(self, resource, names):
+        """Reutiliza las categorías, marcas y proveedores que ya existen; crea las que faltan."""
+        existing = await self.client.call("GET", f"/{resource}/?offset=0&limit=100000", token=self.token)
+        rows = existing["results"] if isinstance(existing, dict) else existing
+        by_name = {row["name"]: row["id"] for row in rows}
+
+        async def create(name):
+            if name in by_name:
+                return by_name[name]
+            row = await self.post(f"/{resource}/", {"name": name, "description": ""})
+            self.created[resource].append(row["id"])
+            return row["id"]
+
+        return await self._stage(resource, names, create)
+
+    async def run(self, data, **manifest_extra):
+        ids = {resource: await self.lookup(resource, names) for resource, names in LOOKUPS.items()}
+        self.save_manifest(**manifest_extra)
+
+        def create(resource, key="id"):
+            async def worker(payload):
+                row = await self.post(f"/{resource}/", payload)
+                self.created[resource].append(row[key])
+                return row
+            return worker
+
+        products = await self._stage("products", [
+            {**p, "category": ids["product-categories"][p["category"]], "brand": ids["product-brands"][p["brand"]]}
+            for p in data["products"]
+        ], create("products", "slug"))
+        customers = await self._stage("customers", data["customers"], create("customers"))
+        self.save_manifest(**manifest_extra)
+
+        def product_id(index):
+            return products[index]["id"] if products[index] else None
+
+        def customer_id(index):
+            return customers[index]["id"] if index is not None and customers[index] else None
+
+        await self._stage("standing-orders", [
+            {**o, "customer": customer_id(o["customer"]),
+             "details": [{**d, "product": product_id(d["product"])} for d in o["details"]]}
+            for o in data["standing-orders"] if customer_id(o["customer"])
+        ], create("standing-orders"))
+        await self._stage("expenses", [
+            {**e, "category": ids["expense-categories"][e["category"]], "supplier": ids["suppliers"][e["supplier"]]}
+            for e in data["expenses"]
+        ], create("expenses"))
+        self.save_manifest(**manifest_extra)
+
+        sales = await self._stage("sales", [
+            {**s, "customer": customer_id(s["customer"]) or "",
+             "sale_details": [{**d, "product": product_id(d["product"])} for d in s["sale_details"]]}
+            for s in data["sales"]
+        ], create("sales"))
+        self.save_manifest(**manifest_extra)
+
+        # Las acciones de una misma venta van en orden; distintas ventas, en paralelo.
+        by_sale = {}
+        for index, action in data["sale-actions"]:
+            if sales[index]:
+                by_sale.setdefault(sales[index]["id"], []).append(action)
+
+        async def apply(item):
+            sale_id, steps = item
+            for step in steps:
+                body = {"total": round(float(sales_by_id[sale_id]["total"]) / 2, 2)} if step == "mark-as-partial-charged" else None
+                await self.post(f"/sales/{sale_id}/{step}/", body)
+
+        sales_by_id = {sale["id"]: sale for sale in sales if sale}
+        await self._stage("sale-actions", list(by_sale.items()), apply)
+
+        await self._stage("returns", [
+            {**r, "sale": sales[r["sale"]]["id"],
+             "return_details": [{**d, "product": product_id(d["product"])} for d in r["return_details"]]}
+            for r in data["returns"] if sales[r["sale"]]
+        ], create("returns"))
+        self.save_manifest(**manifest_extra)
+        return self.created
+
+    async def teardown(self, created):
+        for resource in TEARDOWN_ORDER:
+            keys = created.get(resource, [])
+            if not keys:
+                continue
+
+            async def delete(key, resource=resource):
+                await self.client.call("DELETE", f"/{resource}/{key}/", token=self.token)
+
+            await self._stage(f"borrar {resource}", keys, delete)
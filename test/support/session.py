@@ -0,0 +1,125 @@
+import json
+import os
+import tempfile
+import time
+import urllib.parse
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from .api import api_request
+from .config import BASE_URL, credentials_for
+
+# Las sesiones se guardan en disco para que todos los scripts de una misma
+# corrida (que son procesos distintos) reutilicen un único login por rol.
+SESSION_CACHE = os.environ.get(
+    "LAPANA_SESSION_CACHE", os.path.join(tempfile.gettempdir(), "lapana-sessions.json")
+)
+SESSION_MAX_AGE = int(os.environ.get("LAPANA_SESSION_MAX_AGE", "3600"))
+
+_sessions = {}
+
+
+def _read_cache():
+    try:
+        with open(SESSION_CACHE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_cache(cache):
+    tmp_path = f"{SESSION_CACHE}.{os.getpid()}"
+    with open(tmp_path, "w") as f:
+        json.dump(cache, f)
+    os.replace(tmp_path, SESSION_CACHE)
+
+
+def api_login(role="ADMIN"):
+    username, password = credentials_for(role)
+    data = api_request("POST", "/users/login/", {"username": username, "password": password})
+    return {"user": data["user"], "access_token": data["access_token"]}
+
+
+def ui_login(driver, role="ADMIN"):
+    username, password = credentials_for(role)
+    driver.get(f"{BASE_URL}/auth/login")
+
+    wait = WebDriverWait(driver, 10)
+    username_field = wait.until(EC.presence_of_element_located((By.XPATH, "//input[@placeholder='Nombre de usuario']")))
+    username_field.send_keys(username)
+
+    password_field = driver.find_element(By.XPATH, "//input[@placeholder='********']")
+    password_field.send_keys(password)
+
+    driver.find_element(By.XPATH, "//button[@type='submit']").click()
+    wait.until(EC.url_contains("/dashboard"))
+
+    user_cookie = driver.get_cookie("user")
+    token_cookie = driver.get_cookie("access_token")
+    return {
+        "user": json.loads(urllib.parse.unquote(user_cookie["value"])),
+        "access_token": token_cookie["value"],
+    }
+
+
+def get_session(role="ADMIN", driver=None):
+    """Devuelve la sesión del rol, iniciando sesión solo si no hay una vigente.
+
+    Sin ``driver`` el login se hace contra ``POST /users/login/``; con
+    ``driver`` se recorre el formulario de la página de login.
+    """
+    role = role.upper()
+    session = _sessions.get(role)
+    if session is None:
+        session = _read_cache().get(role)
+    if session is None or time.time() - session["created_at"] > SESSION_MAX_AGE:
+        session = save_session(role, ui_login(driver, role) if driver else api_login(role))
+    _sessions[role] = session
+    return session
+
+
+def save_session(role, session):
+    role = role.upper()
+    if session["user"].get("user_type") != role:
+        raise ValueError(f"El usuario de {role} tiene tipo {session['user'].get('user_type')}")
+    session = {**session, "created_at": time.time()}
+    cache = _read_cache()
+    cache[role] = session
+    _write_cache(cache)
+    _sessions[role] = session
+    return session
+
+
+def clear_sessions():
+    _sessions.clear()
+    try:
+        os.remove(SESSION_CACHE)
+    except FileNotFoundError:
+        pass
+
+
+def session_cookies(session):
+    """Las cookies ``access_token`` y ``user`` que revisa middleware.jsx."""
+    return [
+        {"name": "access_token", "value": session["access_token"], "path": "/"},
+        {"name": "user", "value": urllib.parse.quote(json.dumps(session["user"]), safe=""), "path": "/"},
+    ]
+
+
+def inject_session(driver, session):
+    # Las cookies solo se pueden agregar estando en el dominio; /favicon.ico
+    # es una ruta pública que el middleware no intercepta.
+    driver.get(f"{BASE_URL}/favicon.ico")
+    driver.delete_all_cookies()
+    for cookie in session_cookies(session):
+        driver.add_cookie(cookie)
+
+
+def start_session(driver, path="/dashboard", role="ADMIN"):
+    """Abre ``path`` con la sesión del rol ya cargada en las cookies."""
+    inject_session(driver, get_session(role))
+    driver.get(f"{BASE_URL}{path}")
+    WebDriverWait(driver, 10).until(EC.url_contains(path))
+    return driver
@@ -0,0 +1,78 @@
+import os
+
+# Patrones de Network.setBlockedURLs (``*`` es comodín). No se bloquea
+# /favicon.ico: session.inject_session navega ahí para cargar las cookies.
+BLOCKED_ASSETS = ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp"]
+# Chunk de react-apexcharts que carga /dashboard/statistics con next/dynamic.
+# Sin él la página no dibuja los gráficos: los flujos de estadísticas no deben usar "ci".
+CHART_BUNDLES = ["*apexcharts*"]
+
+# Apaga transiciones y animaciones CSS. Las de framer-motion (NextUI) se apagan
+# con prefers-reduced-motion, que NextUIProvider respeta con reducedMotion="user".
+_NO_ANIMATIONS_SCRIPT = """
+const style = document.createElement("style");
+style.textContent = `*, *::before, *::after {
+  transition: none !important;
+  animation: none !important;
+  scroll-behavior: auto !important;
+  caret-color: auto !important;
+}`;
+const inject = () => (document.head || document.documentElement).appendChild(style);
+if (document.documentElement) inject();
+else document.addEventListener("DOMContentLoaded", inject, { once: true });
+"""
+
+PROFILES = {
+    "normal": {},
+    # Lo más rápido posible, para CI.
+    "ci": {
+        "block": BLOCKED_ASSETS + CHART_BUNDLES,
+        "reduced_motion": True,
+        "no_animations": True,
+    },
+    # La terminal del local: 3G rápido y un CPU cuatro veces más lento.
+    "pos-antiguo": {
+        "network": {"latency": 150, "download_kbps": 1600, "upload_kbps": 750},
+        "cpu_slowdown": 4,
+    },
+}
+
+
+def browser_profile():
+    return os.environ.get("LAPANA_BROWSER_PROFILE", "normal")
+
+
+def apply_profile(driver, profile=None):
+    """Aplica un perfil de ``PROFILES`` (o un dict con las mismas claves) al navegador.
+
+    La configuración vive en el target de la pestaña, así que sobrevive a las
+    navegaciones y al reset del pool.
+    """
+    if profile is None:
+        profile = browser_profile()
+    if isinstance(profile, str):
+        if profile not in PROFILES:
+            raise ValueError(f"Perfil de navegador desconocido: {profile}")
+        profile = PROFILES[profile]
+
+    if profile.get("block") or profile.get("network"):
+        driver.execute_cdp_cmd("Network.enable", {})
+    if profile.get("block"):
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": profile["block"]})
+    if profile.get("network"):
+        network = profile["network"]
+        driver.execute_cdp_cmd("Network.emulateNetworkConditions", {
+            "offline": False,
+            "latency": network["latency"],
+            "downloadThroughput": network["download_kbps"] * 1024 / 8,
+            "uploadThroughput": network["upload_kbps"] * 1024 / 8,
+        })
+    if profile.get("cpu_slowdown"):
+        driver.execute_cdp_cmd("Emulation.setCPUThrottlingRate", {"rate": profile["cpu_slowdown"]})
+    if profile.get("reduced_motion"):
+        driver.execute_cdp_cmd("Emulation.setEmulatedMedia", {
+            "features": [{"name": "prefers-reduced-motion", "value": "reduce"}],
+        })
+    if profile.get("no_animations"):
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": _NO_ANIMATIONS_SCRIPT})
+    return driver
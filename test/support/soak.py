@@ -0,0 +1,252 @@
+import json
+import random
+import statistics
+import time
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+
+from .forms import clear_and_type
+from .netwaits import watch_network
+from .waits import OPTIONS_JS, wait_for, wait_for_listbox
+
+DETAILS_TABLE = "Tabla de Detalles de Venta"
+_ROWS_XPATH = f"//table[@aria-label='{DETAILS_TABLE}']//tbody/tr[@data-key]"
+_ADD_DETAIL_XPATH = "//p[text()='Detalles de la Venta']/following-sibling::*//button"
+_CUSTOMER_XPATH = "//input[@placeholder='Cliente']"
+_SUBMIT_XPATH = "//button[normalize-space()='Crear Venta']"
+
+POS_READY = """
+return document.querySelector('input[placeholder="Cliente"]') && !document.body.textContent.includes("Loading...");
+"""
+
+# Peso de cada acción del cajero. ``submit_sale`` completa lo que falte antes
+# de enviar, así cada venta pasa por el mismo camino que en el mostrador.
+ACTIONS = {
+    "add_detail": 4,
+    "remove_detail": 2,
+    "switch_customer": 2,
+    "submit_sale": 2,
+}
+
+# Crecimiento tolerado por hora, ya pasado el calentamiento.
+DEFAULT_LIMITS = {
+    "heap_mb": 5.0,
+    "nodes": 500,
+    "listeners": 100,
+    "detached": 50,
+}
+
+METRIC_LABELS = {
+    "heap_mb": "Heap JS (MB)",
+    "nodes": "Nodos DOM",
+    "listeners": "Listeners",
+    "detached": "Nodos separados",
+}
+
+
+def parse_duration(text):
+    """``"4h"``, ``"30m"``, ``"90s"`` o segundos sueltos."""
+    text = str(text).strip().lower()
+    units = {"h": 3600, "m": 60, "s": 1}
+    if text and text[-1] in units:
+        return float(text[:-1]) * units[text[-1]]
+    return float(text)
+
+
+def parse_limits(specs):
+    """Parsea ``["heap_mb=10", "nodes=1000"]`` sobre los límites por defecto."""
+    limits = dict(DEFAULT_LIMITS)
+    for spec in specs or ():
+        name, _, value = spec.partition("=")
+        if name not in limits:
+            raise ValueError(f"Métrica desconocida: {name}")
+        limits[name] = float(value)
+    return limits
+
+
+# -- Muestras -----------------------------------------------------------------
+
+def enable_memory_sampling(driver):
+    driver.execute_cdp_cmd("DOM.enable", {})
+
+
+def sample_memory(driver):
+    """Heap usado, nodos, listeners y nodos separados del DOM, después de forzar un GC.
+
+    Sin el GC las muestras suben y bajan con la basura pendiente y la pendiente
+    no dice nada. ``DOM.getDetachedDomNodes`` es experimental; si el Chrome no
+    lo tiene, la métrica queda afuera.
+    """
+    driver.execute_cdp_cmd("HeapProfiler.collectGarbage", {})
+    heap = driver.execute_cdp_cmd("Runtime.getHeapUsage", {})
+    counters = driver.execute_cdp_cmd("Memory.getDOMCounters", {})
+    sample = {
+        "heap_mb": heap["usedSize"] / (1024 * 1024),
+        "nodes": counters["nodes"],
+        "listeners": counters["jsEventListeners"],
+        "documents": counters["documents"],
+    }
+    try:
+        sample["detached"] = len(driver.execute_cdp_cmd("DOM.getDetachedDomNodes", {})["detachedNodes"])
+    except WebDriverException:
+        pass
+    return sample
+
+
+def growth(samples, metric):
+    """Pendiente por hora de ``metric`` (mínimos cuadrados) y si el crecimiento es sostenido.
+
+    Es sostenido cuando lo más bajo del último tercio queda por encima de lo
+    más alto del primero: el GC ya no devuelve la memoria a donde estaba.
+    """
+    points = [(s["elapsed"], s[metric]) for s in samples if s.get(metric) is not None]
+    if len(points) < 3:
+        return None
+    times, values = zip(*points)
+    if len(set(times)) < 2:
+        return None
+    slope, _ = statistics.linear_regression(times, values)
+    third = max(1, len(values) // 3)
+    return {
+        "first": values[0],
+        "last": values[-1],
+        "per_hour": slope * 3600,
+        "sustained": min(values[-third:]) > max(values[:third]),
+    }
+
+
+def analyze(samples, warmup=300, limits=None):
+    """Pendientes de cada métrica sin el calentamiento y las que superan su límite."""
+    limits = limits or DEFAULT_LIMITS
+    steady = [s for s in samples if s["elapsed"] >= warmup]
+    trends, leaks = {}, []
+    for metric, limit in limits.items():
+        trend = growth(steady, metric)
+        if trend is None:
+            continue
+        trend["limit"] = limit
+        trends[metric] = trend
+        if trend["per_hour"] > limit and trend["sustained"]:
+            leaks.append(metric)
+    return {"samples": len(steady), "trends": trends, "leaks": leaks}
+
+
+# -- Cajero ---------------------------------------------------------------------
+
+class PosClerk:
+    """Maneja el POS como un cajero: arma detalles, los quita, cambia de cliente y cobra."""
+
+    def __init__(self, driver, seed=0):
+        self.driver = driver
+        self.rng = random.Random(seed)
+        self.network = watch_network(driver)
+        self.counts = {name: 0 for name in ACTIONS}
+        self.sales = 0
+
+    def _rows(self):
+        return self.driver.find_elements(By.XPATH, _ROWS_XPATH)
+
+    def _wait_rows(self, count):
+        wait_for(
+            self.driver,
+            f"return document.querySelectorAll('table[aria-label=\"{DETAILS_TABLE}\"] tbody tr[data-key]').length === args;",
+            args=count,
+            message=f"La tabla de detalles no quedó con {count} filas.",
+        )
+
+    def _pick_option(self, input_el):
+        input_el.click()
+        options = wait_for_listbox(self.driver)
+        self.rng.choice(options[:20]).click()
+        wait_for(self.driver, OPTIONS_JS + "return options.length ? null : true;", message="El listbox no se cerró.")
+
+    def step(self):
+        names = list(ACTIONS)
+        action = self.rng.choices(names, [ACTIONS[name] for name in names])[0]
+        getattr(self, action)()
+        self.counts[action] += 1
+        return action
+
+    def add_detail(self):
+        count = len(self._rows())
+        self.driver.find_element(By.XPATH, _ADD_DETAIL_XPATH).click()
+        self._wait_rows(count + 1)
+        self._pick_option(self.driver.find_elements(By.XPATH, "//input[@aria-label='Producto']")[-1])
+        clear_and_type(self.driver.find_elements(By.XPATH, "//input[@aria-label='Cantidad']")[-1], str(self.rng.randint(1, 6)))
+
+    def remove_detail(self):
+        rows = self._rows()
+        if not rows:
+            return self.add_detail()
+        self.rng.choice(rows).find_elements(By.TAG_NAME, "button")[-1].click()
+        self._wait_rows(len(rows) - 1)
+
+    def switch_customer(self):
+        self._pick_option(self.driver.find_element(By.XPATH, _CUSTOMER_XPATH))
+
+    def submit_sale(self):
+        if not self._rows():
+            self.add_detail()
+        with self.network.expect_response("POST", "/sales/", status=201):
+            self.driver.find_element(By.XPATH, _SUBMIT_XPATH).click()
+        # Después de crear la venta el POS vacía los detalles.
+        self._wait_rows(0)
+        self.sales += 1
+
+
+def run_soak(driver, duration, interval=60, seed=0, on_sample=None):
+    """Usa el POS durante ``duration`` segundos y toma una muestra de memoria cada ``interval``.
+
+    El POS tiene que estar abierto. Antes de cada muestra se espera a que la
+    red quede ociosa, para no medir a mitad de un guardado.
+    """
+    clerk = PosClerk(driver, seed)
+    enable_memory_sampling(driver)
+    samples = []
+
+    def take(start):
+        clerk.network.wait_for_idle()
+        sample = {"elapsed": time.perf_counter() - start, "sales": clerk.sales, **sample_memory(driver)}
+        samples.append(sample)
+        if on_sample:
+            on_sample(sample)
+
+    start = time.perf_counter()
+    take(start)
+    next_sample = start + interval
+    deadline = start + duration
+    while time.perf_counter() < deadline:
+        clerk.step()
+        if time.perf_counter() >= next_sample:
+            take(start)
+            next_sample += interval
+    take(start)
+    return {"duration": time.perf_counter() - start, "actions": clerk.counts, "sales": clerk.sales, "samples": samples}
+
+
+def append_sample(path, sample):
+    """Agrega la muestra como una línea de JSON, para seguir una corrida larga mientras avanza."""
+    with open(path, "a") as f:
+        f.write(json.dumps(sample) + "\n")
+
+
+def format_sample(sample):
+    detached = f"  separados {sample['detached']}" if "detached" in sample else ""
+    return (
+        f"{sample['elapsed'] / 60:7.1f} min  ventas {sample['sales']:>5}  heap {sample['heap_mb']:7.1f} MB"
+        f"  nodos {sample['nodes']:>7}  listeners {sample['listeners']:>6}{detached}"
+    )
+
+
+def print_soak_report(report, analysis):
+    actions = ", ".join(f"{name} {count}" for name, count in report["actions"].items())
+    print(f"\n{report['duration'] / 60:.1f} min, {report['sales']} ventas ({actions})")
+    print(f"Pendientes sobre {analysis['samples']} muestras después del calentamiento:")
+    print(f"{'Métrica':<18}{'inicio':>10}{'final':>10}{'por hora':>12}{'límite':>10}")
+    for metric, trend in analysis["trends"].items():
+        mark = "  ✗ crece sin techo" if metric in analysis["leaks"] else ""
+        print(
+            f"{METRIC_LABELS[metric]:<18}{trend['first']:>10.1f}{trend['last']:>10.1f}"
+            f"{trend['per_hour']:>+12.1f}{trend['limit']:>10.1f}{mark}"
+        )
@@ -0,0 +1,172 @@
+import platform
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support.ui import WebDriverWait
+
+from .profiler import span
+
+DEFAULT_TIMEOUT = 10
+POLL_INTERVAL = 0.05
+
+# Espera en el navegador a que ``condition`` devuelva algo truthy. Se vuelve a
+# evaluar con cada mutación del DOM, así la espera termina en cuanto React pinta
+# el resultado. El intervalo cubre las animaciones WAAPI, que no mutan el DOM.
+# Devuelve [resultado, cantidad de evaluaciones] para el perfil de la corrida.
+_OBSERVE_SCRIPT = """
+const [source, args, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+const condition = new Function("args", source);
+let checks = 0;
+const check = () => { checks++; try { return condition(args); } catch (e) { return null; } };
+
+const first = check();
+if (first) { done([first, checks]); return; }
+
+let timer = null;
+let interval = null;
+const recheck = () => {
+  const result = check();
+  if (result) { cleanup(); done([result, checks]); }
+};
+const observer = new MutationObserver(recheck);
+const cleanup = () => { observer.disconnect(); clearTimeout(timer); clearInterval(interval); };
+timer = setTimeout(() => { cleanup(); done([null, checks]); }, timeoutMs);
+interval = setInterval(recheck, 50);
+observer.observe(document, { subtree: true, childList: true, attributes: true, characterData: true });
+"""
+
+_IS_VISIBLE = """
+const isVisible = (el) => {
+  if (!el || !el.getClientRects().length) return false;
+  const style = getComputedStyle(el);
+  return style.visibility !== "hidden" && style.display !== "none" && parseFloat(style.opacity) > 0;
+};
+"""
+
+# Opciones visibles de los listbox abiertos, para usar dentro de condiciones JS.
+OPTIONS_JS = _IS_VISIBLE + """
+const options = [...document.querySelectorAll('[role="listbox"]')]
+  .filter(isVisible)
+  .flatMap((box) => [...box.querySelectorAll('[role="option"]')])
+  .filter(isVisible);
+"""
+
+
+def select_all_key():
+    return Keys.COMMAND if platform.system() == "Darwin" else Keys.CONTROL
+
+
+def wait_for(driver, condition, args=None, timeout=DEFAULT_TIMEOUT, message=""):
+    """Espera a que el cuerpo JS ``condition`` devuelva un valor truthy y lo devuelve."""
+    with span("wait_for", "wait", locator=message or None) as event:
+        driver.set_script_timeout(timeout + 5)
+        result, checks = driver.execute_async_script(_OBSERVE_SCRIPT, condition, args, int(timeout * 1000))
+        event["polls"] = checks
+    if not result:
+        raise TimeoutException(message or "La condición no se cumplió a tiempo.")
+    return result
+
+
+def poll(driver, condition, timeout=DEFAULT_TIMEOUT, message=""):
+    """Variante del lado de Python para condiciones que no dependen del DOM."""
+    return WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(condition, message)
+
+
+def wait_for_listbox(driver, timeout=DEFAULT_TIMEOUT):
+    """Espera a que el listbox de un Autocomplete abierto tenga opciones y las devuelve."""
+    return wait_for(
+        driver,
+        OPTIONS_JS + "return options.length ? options : null;",
+        timeout=timeout,
+        message="El listbox no mostró opciones.",
+    )
+
+
+def wait_for_option(driver, text, timeout=DEFAULT_TIMEOUT):
+    """Devuelve la opción visible cuyo texto coincide con ``text`` (exacta primero)."""
+    return wait_for(
+        driver,
+        OPTIONS_JS + """
+const wanted = args.toLowerCase().trim();
+const label = (el) => el.textContent.toLowerCase().trim();
+return options.find((el) => label(el) === wanted) || options.find((el) => label(el).includes(wanted)) || null;
+""",
+        args=text,
+        timeout=timeout,
+        message=f"No apareció la opción '{text}'.",
+    )
+
+
+def select_autocomplete(driver, aria_label, text, option_text=None, timeout=DEFAULT_TIMEOUT):
+    """Escribe ``text`` en un Autocomplete de NextUI y elige la opción apenas se pinta."""
+    input_el = driver.find_element(By.XPATH, f"//input[@aria-label='{aria_label}']")
+    input_el.click()
+    input_el.send_keys(select_all_key() + "a")
+    input_el.send_keys(text)
+    option = wait_for_option(driver, option_text or text, timeout)
+    option.click()
+    return option
+
+
+def wait_for_modal_open(driver, timeout=DEFAULT_TIMEOUT):
+    return wait_for(
+        driver,
+        _IS_VISIBLE + """
+const dialog = [...document.querySelectorAll('[role="dialog"]')].find(isVisible);
+return dialog && !dialog.getAnimations({ subtree: true }).some((a) => a.playState === "running") ? dialog : null;
+""",
+        timeout=timeout,
+        message="El modal no se abrió.",
+    )
+
+
+def wait_for_modal_closed(driver, timeout=DEFAULT_TIMEOUT):
+    return wait_for(
+        driver,
+        "return document.querySelector('[role=\"dialog\"]') ? null : true;",
+        timeout=timeout,
+        message="El modal no se cerró.",
+    )
+
+
+def wait_for_table_rows(driver, min_rows=1, table_label=None, timeout=DEFAULT_TIMEOUT):
+    """Espera a que la tabla tenga al menos ``min_rows`` filas con datos y las devuelve."""
+    return wait_for(
+        driver,
+        """
+const selector = args.label ? `table[aria-label="${args.label}"]` : "table";
+const rows = [...document.querySelectorAll(`${selector} tbody tr[data-key]`)];
+return rows.length >= args.min ? rows : null;
+""",
+        args={"label": table_label, "min": min_rows},
+        timeout=timeout,
+        message="La tabla no mostró filas.",
+    )
+
+
+def wait_for_spinner_gone(driver, timeout=DEFAULT_TIMEOUT):
+    return wait_for(
+        driver,
+        """
+const spinners = document.querySelectorAll('[aria-label="Loading"], [aria-label^="Cargando"]');
+return spinners.length ? null : true;
+""",
+        timeout=timeout,
+        message="El spinner no desapareció.",
+    )
+
+
+def wait_for_button(driver, aria_label, timeout=DEFAULT_TIMEOUT):
+    """Espera el botón con ``aria-label`` exacto habilitado, p. ej. el de una fila puntual."""
+    return wait_for(
+        driver,
+        _IS_VISIBLE + """
+const button = [...document.querySelectorAll("button[aria-label]")].find((b) => b.getAttribute("aria-label") === args.label);
+return button && isVisible(button) && !button.disabled ? button : null;
+""",
+        args={"label": aria_label},
+        timeout=timeout,
+        message=f"No apareció el botón '{aria_label}'.",
+    )